@@ -1,6 +1,6 @@
 import cryptle.logging as logging
-from cryptle.metric.base import Candle
-from cryptle.event import source, on, Bus
+from cryptle.metric.base import CandleColumns
+from cryptle.event import source, on, on_batch, Bus
 
 logger = logging.getLogger(__name__)
 
@@ -27,12 +27,23 @@ class Aggregator:
 
     def __init__(self, period, auto_prune=False, maxsize=500):
         self.period = period
-        self._bars = []  # this construct might be unnecessary
+        self._bars = CandleColumns(maxsize if auto_prune else None)
         self._auto_prune = auto_prune
         self._maxsize = maxsize
         self.last_timestamp = None
 
-    @on('tick')
+    @on_batch('tick')
+    def pushTicks(self, ticks):
+        """Provides public interface for accepting a chunk of ticks in order.
+
+        Args
+        ---
+        ticks   : list
+            list of ticks, each in the representation expected by :meth:`pushTick`
+        """
+        for tick in ticks:
+            self.pushTick(tick)
+
     def pushTick(self, data):
         """Provides public interface for accepting ticks.
 
@@ -77,10 +88,7 @@ class Aggregator:
         return timestamp > self.last_bar_timestamp + self.period
 
     def _prune(self, size):
-        try:
-            self._bars = self._bars[-size:]
-        except IndexError:
-            raise ("Empty CandleBar cannot be pruned")
+        self._bars.prune(size)
 
     @on('candle')
     def pushCandle(self, bar):
@@ -136,10 +144,10 @@ class Aggregator:
     @source('aggregator:new_candle')
     def _pushInitCandle(self, value, timestamp, volume, action):
         round_ts = timestamp - timestamp % self.period
-        new_candle = Candle(
+        self._bars.append(
             value, value, value, value, round_ts, volume, volume * action
         )
-        self._bars.append(new_candle)
+        new_candle = self._bars[-1]
         if len(self._bars) > 1:
             finished_candle = self._bars[-2]
             self._pushAllMetrics(
@@ -164,16 +172,16 @@ class Aggregator:
     @source('aggregator:new_candle')
     def _pushFullCandle(self, o, c, h, l, t, v, nv):
         t = t - t % self.period
-        new_candle = Candle(o, c, h, l, t, v, nv)
-        self._bars.append(new_candle)
+        self._bars.append(o, c, h, l, t, v, nv)
+        new_candle = self._bars[-1]
         self._pushAllMetrics(o, c, h, l, t, v, nv)
         return new_candle._bar
 
     @source('aggregator:new_candle')
     def _pushEmptyCandle(self, value, timestamp):
         round_ts = timestamp - timestamp % self.period
-        new_candle = Candle(value, value, value, value, round_ts, 0, 0)
-        self._bars.append(new_candle)
+        self._bars.append(value, value, value, value, round_ts, 0, 0)
+        new_candle = self._bars[-1]
         self._pushAllMetrics(value, value, value, value, round_ts, 0, 0)
         return new_candle._bar
 
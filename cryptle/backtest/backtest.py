@@ -11,7 +11,7 @@ import cryptle.logging as logging
 logger = logging.getLogger(__name__)
 
 
-def backtest_with_bus(strat, dataset, dtype, *bindables, bus=None):
+def backtest_with_bus(strat, dataset, dtype, *bindables, bus=None, chunksize=None):
     """Convenience function for backtesting with an event bus.
 
     Handles the bus creation and binding boilerplate code, followed by going
@@ -28,6 +28,9 @@ def backtest_with_bus(strat, dataset, dtype, *bindables, bus=None):
         Any number of listener or emitter objects to be binded to the bus.
     bus : :class:`~cryptle.event.Bus`
         An optional keyword argument to accept a ready made event bus.
+    chunksize : int
+        An optional keyword argument to emit the dataset in chunks of this size
+        with :meth:`~cryptle.event.Bus.emitBatch`.
     """
     data_iterator = DataEmitter(dtype)
 
@@ -40,7 +43,7 @@ def backtest_with_bus(strat, dataset, dtype, *bindables, bus=None):
     bus.bind(strat)
     bus.bind(data_iterator)
 
-    data_iterator.emitAll(dataset)
+    data_iterator.emitAll(dataset, chunksize)
 
 
 def backtest_tick(
@@ -137,19 +140,27 @@ class DataEmitter:
     def __init__(self, dtype):
         self.dtype = dtype
 
-    def emitAll(self, dataset):
+    def emitAll(self, dataset, chunksize=None):
+        """Broadcast the dataset row by row, or in chunks of rows if a chunksize is given."""
         if not self.dtype:
             raise ValueError('Expect emitter data type to be set')
 
         if self.dtype == 'candle':
-            for data in dataset:
-                self.emitCandle(data)
+            emitter = self.emitCandle
         elif self.dtype == 'trade':
-            for data in dataset:
-                self.emitTrade(data)
+            emitter = self.emitTick
         else:
             raise TypeError('Unrecognized data type')
 
+        if chunksize is None:
+            for data in dataset:
+                emitter(data)
+            return
+
+        for chunk in _chunked(dataset, chunksize):
+            for bus in emitter.buses:
+                bus.emitBatch(emitter.event, chunk)
+
     @source('candles')
     def emitCandle(self, data):
         return data
@@ -377,3 +388,14 @@ def _unpack(tick):
     else:
         action = 0
     return price, timestamp, volume, action
+
+
+def _chunked(dataset, size):
+    chunk = []
+    for data in dataset:
+        chunk.append(data)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
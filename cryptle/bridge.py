@@ -0,0 +1,230 @@
+"""Forwarding of event bus traffic between processes.
+
+A :class:`BusBridge` connects the :class:`~cryptle.event.Bus` of one process to the
+buses of other processes on the same host over Unix domain sockets. Events named in
+the bridge are forwarded to every connected peer, while events received from peers
+are emitted into the local bus. A typical setup has one datafeed process listening
+on a socket and forwarding ``tick`` events, with any number of strategy processes
+connected to it.
+
+Flat sequences of numbers, such as ticks and the ``_bar`` list of a
+:class:`~cryptle.metric.base.Candle`, are encoded in a compact binary format that
+preserves the int/float/bool type of every item. Any other payload is pickled.
+"""
+import os
+import pickle
+import socket
+import struct
+import threading
+
+import cryptle.logging as logging
+
+logger = logging.getLogger(__name__)
+
+
+# Frame header: payload kind, event name length, payload length
+_HEADER = struct.Struct('!BHI')
+
+_PICKLE = 0
+_LIST = 1
+_TUPLE = 2
+
+_TYPECODES = {float: b'd', int: b'q', bool: b'?'}
+_MAX_PACKED = 255
+
+
+def _pack(data):
+    """Return the kind and payload of a flat sequence of numbers, None otherwise."""
+    if type(data) is list:
+        kind = _LIST
+    elif type(data) is tuple:
+        kind = _TUPLE
+    else:
+        return None
+
+    if len(data) > _MAX_PACKED:
+        return None
+
+    try:
+        codes = b''.join(_TYPECODES[type(x)] for x in data)
+        return kind, bytes([len(data)]) + codes + struct.pack('!' + codes.decode(), *data)
+    except (KeyError, struct.error):
+        return None
+
+
+def encode(event, data):
+    """Serialise an event into a frame."""
+    name = event.encode()
+    packed = _pack(data)
+    if packed is None:
+        kind, payload = _PICKLE, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    else:
+        kind, payload = packed
+    return _HEADER.pack(kind, len(name), len(payload)) + name + payload
+
+
+def decode(kind, body, namelen):
+    """Deserialise the body of a frame, i.e. the bytes after the header."""
+    event = body[:namelen].decode()
+    payload = body[namelen:]
+
+    if kind == _PICKLE:
+        return event, pickle.loads(payload)
+
+    count = payload[0]
+    codes = payload[1 : 1 + count].decode()
+    values = struct.unpack('!' + codes, payload[1 + count :])
+    return event, list(values) if kind == _LIST else values
+
+
+def _recvExactly(sock, size):
+    buf = bytearray()
+    while len(buf) < size:
+        chunk = sock.recv(size - len(buf))
+        if not chunk:
+            raise ConnectionError('Peer closed the connection')
+        buf += chunk
+    return bytes(buf)
+
+
+class BusBridge:
+    """Bidirectional bridge between an event bus and the buses of other processes.
+
+    Args
+    ----
+    bus : :class:`~cryptle.event.Bus`
+        The local event bus.
+    events : iterable of str
+        Names of the local events to be forwarded to peers.
+
+    Note
+    ----
+    Events received from peers are emitted into the local bus on the receive
+    thread of the connection. The received event itself is not forwarded back out of
+    the bridge, while other events emitted by its listeners are.
+
+    Warning
+    -------
+    Payloads other than flat sequences of numbers are unpickled, so peers must be
+    trusted. The socket of :meth:`listen` is only accessible to the user running the
+    process.
+
+    """
+
+    def __init__(self, bus, events=()):
+        self.bus = bus
+        self.events = tuple(events)
+        self.path = None
+
+        self._peers = {}
+        self._peers_lock = threading.Lock()
+        self._server = None
+        self._local = threading.local()
+        self._closed = False
+
+        for event in self.events:
+            bus.addListener(event, self._forwarder(event))
+
+    def __repr__(self):
+        return '<BusBridge({}, {})>'.format(self.path, list(self.events))
+
+    def listen(self, path):
+        """Accept connections from peers on a Unix domain socket at the path."""
+        if os.path.exists(path):
+            os.unlink(path)
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(path)
+        # Restrict access before accepting any connection
+        os.chmod(path, 0o600)
+        self._server.listen()
+        self.path = path
+        self._spawn(self._acceptForever)
+        logger.debug('Bridge listening on {}', path)
+
+    def connect(self, path):
+        """Connect to a bridge listening on a Unix domain socket at the path."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(path)
+        self.path = self.path or path
+        self._addPeer(sock)
+        logger.debug('Bridge connected to {}', path)
+
+    def send(self, event, data):
+        """Send an event to every connected peer."""
+        frame = encode(event, data)
+        with self._peers_lock:
+            peers = list(self._peers.items())
+
+        for sock, lock in peers:
+            try:
+                with lock:
+                    sock.sendall(frame)
+            except OSError:
+                self._dropPeer(sock)
+
+    def close(self):
+        """Close every connection, and the listening socket if any."""
+        self._closed = True
+        if self._server is not None:
+            self._server.close()
+            if self.path and os.path.exists(self.path):
+                os.unlink(self.path)
+        with self._peers_lock:
+            peers, self._peers = list(self._peers), {}
+        for sock in peers:
+            sock.close()
+
+    @property
+    def peers(self):
+        """Number of connected peers."""
+        return len(self._peers)
+
+    def _forwarder(self, event):
+        def forward(data):
+            # Do not echo the event being received back to the peers
+            if getattr(self._local, 'receiving', None) == event:
+                return
+            self.send(event, data)
+
+        forward.__qualname__ = '{}.forward[{}]'.format(type(self).__name__, event)
+        return forward
+
+    def _spawn(self, target, *args):
+        thread = threading.Thread(target=target, args=args)
+        thread.daemon = True
+        thread.start()
+
+    def _addPeer(self, sock):
+        with self._peers_lock:
+            self._peers[sock] = threading.Lock()
+        self._spawn(self._recvForever, sock)
+
+    def _dropPeer(self, sock):
+        with self._peers_lock:
+            self._peers.pop(sock, None)
+        sock.close()
+
+    def _acceptForever(self):
+        while not self._closed:
+            try:
+                sock, _ = self._server.accept()
+            except OSError:
+                return
+            self._addPeer(sock)
+
+    def _recvForever(self, sock):
+        try:
+            while True:
+                kind, namelen, size = _HEADER.unpack(_recvExactly(sock, _HEADER.size))
+                event, data = decode(kind, _recvExactly(sock, namelen + size), namelen)
+                self._local.receiving = event
+                try:
+                    self.bus.emit(event, data)
+                except Exception:
+                    logger.exception('Uncaught exception in listener of "{}"', event)
+                finally:
+                    self._local.receiving = None
+        except (OSError, ConnectionError):
+            pass
+        finally:
+            self._dropPeer(sock)
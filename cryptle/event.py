@@ -1,9 +1,14 @@
+import csv
 import inspect
+import json
 import cryptle.logging as logging
+import re
 import threading
+import time
 import warnings
-from functools import update_wrapper
-from collections import defaultdict
+import weakref
+from functools import lru_cache, partial, update_wrapper
+from collections import defaultdict, deque
 
 logger = logging.getLogger(__name__)
 
@@ -30,16 +35,29 @@ class UnboundEmitter(Warning):
     pass
 
 
+class BusClosed(BusException):
+    def __init__(self):
+        super().__init__()
+        self.expression = 'Events cannot be emitted into a closed bus.'
+
+
 class _Emitter:
-    """Functor descriptor for wrapper functions and instance methods into bindable emitters."""
+    """Functor descriptor for wrapper functions and instance methods into bindable emitters.
+
+    Accessing an emitter through an instance returns a bound emitter with its own
+    list of buses. The bound emitter is cached in the instance dictionary, hence
+    instances of the same class never share buses, and subsequent lookups bypass
+    the descriptor altogether.
+    """
 
-    def __init__(self, event, func):
+    def __init__(self, event, func, instance=None):
         if isinstance(func, self.__class__):
             raise DuplicateEvent()
         self.func = func
         self.buses = []
         self.event = event
-        self.instance = None
+        self.instance = instance
+        self.name = None
         update_wrapper(self, func)
 
         # Fix comparions for bound methods to unbound methods
@@ -48,12 +66,30 @@ class _Emitter:
     def __repr__(self):
         return '<Emitter({}, {})>'.format(self.event, self.func)
 
+    def __set_name__(self, owner, name):
+        self.name = name
+
     def __get__(self, instance, owner=None):
-        self.instance = instance
-        return self
+        if instance is None or self.instance is not None:
+            return self
+
+        bound = _Emitter(self.event, self.func, instance)
+        # Like bound methods, refer back to the emitter of the class
+        bound.__func__ = self
+        try:
+            instance.__dict__[self.name or self.__name__] = bound
+        except AttributeError:
+            # Instances without a __dict__ cannot cache, fall back to a weak map
+            bound = self._bound(instance, bound)
+        return bound
+
+    def _bound(self, instance, bound):
+        if not hasattr(self, '_instances'):
+            self._instances = weakref.WeakKeyDictionary()
+        return self._instances.setdefault(instance, bound)
 
     def __call__(self, *args, **kwargs):
-        if self.instance:
+        if self.instance is not None:
             rvalue = self.func(self.instance, *args, **kwargs)
         else:
             rvalue = self.func(*args, **kwargs)
@@ -63,6 +99,57 @@ class _Emitter:
         return rvalue
 
 
+class _BatchListener:
+    """Adapter delivering a single event to a batch listener as a sequence of one."""
+
+    __slots__ = ('func',)
+
+    def __init__(self, func):
+        self.func = func
+
+    def __repr__(self):
+        return '<BatchListener({})>'.format(self.func)
+
+    def __eq__(self, other):
+        if isinstance(other, _BatchListener):
+            return self.func == other.func
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.func)
+
+    def __call__(self, data):
+        self.func((data,))
+
+
+class _WeakListener:
+    """Weak reference to a bound method listener.
+
+    The callback is called with the listener once the instance of the method is
+    garbage collected. Calls made in the meantime are silently dropped.
+    """
+
+    def __init__(self, method, callback):
+        self.ref = weakref.WeakMethod(method, lambda ref: callback(self))
+        self.__qualname__ = method.__qualname__
+
+    def __repr__(self):
+        return '<WeakListener({})>'.format(self.ref())
+
+    def __eq__(self, other):
+        if isinstance(other, _WeakListener):
+            return self.ref == other.ref
+        return self.ref() == other
+
+    def __hash__(self):
+        return hash(self.ref)
+
+    def __call__(self, data):
+        method = self.ref()
+        if method is not None:
+            method(data)
+
+
 class Bus:
     """Event bus middleware.
 
@@ -70,20 +157,53 @@ class Bus:
     modular components that are agnostic about the implementation and existance
     of its dependency.
 
+    Listeners may subscribe to wildcard patterns of hierarchical event names,
+    e.g. ``'trades:*'`` or ``'order:**'``. A ``*`` matches within one segment of
+    colon separated names and ``**`` matches one or more segments. Patterns are
+    resolved into the routing table of an event name when the name is first
+    seen, so emitting does not pay for matching.
+
+    Args
+    ----
+    threaded : bool, optional
+        Declare that events may be emitted from more than one thread. A single
+        re-entrant lock shared by the bus then serialises the delivery of events.
+        Defaults to False, in which case no locking is done at all.
+    weak : bool, optional
+        Hold bound method listeners through weak references. Listeners of
+        instances that are garbage collected are then removed automatically.
+        Defaults to False. Plain functions are always held strongly.
+
     Attributes
     ----------
     name : str
         An optional name. Defaults to the object id.
-
-    Todo
-    ----
-    Allow removal of callback/emitter bindings.
+    frozen : bool
+        Whether the bus has been compiled into flat dispatch tables by
+        :meth:`freeze`.
+    profiler : :class:`BusProfiler`
+        The active profiler, None unless enabled by :meth:`enableProfiling`.
 
     """
 
-    def __init__(self):
+    def __init__(self, threaded=False, weak=False):
         self._callbacks = defaultdict(list)
         self._emitters = defaultdict(list)
+        self._lock = threading.RLock() if threaded else None
+        self._weak = weak
+
+        # Compiled event -> tuple of callbacks, only populated when frozen
+        self._dispatch = {}
+        self.frozen = False
+        self.profiler = None
+
+        # Event -> _Conflator, for events delivered at a bounded rate
+        self._conflators = {}
+
+        # Wildcard subscriptions as (pattern, regex, callback), and the names of
+        # the events already routed to them
+        self._patterns = []
+        self._resolved = set()
 
         # Default to object id
         self.name = id(self)
@@ -107,6 +227,9 @@ class Bus:
         ----
         Functors will not be treated as functions.
 
+        The names of decorated class attributes are discovered once per class and
+        cached. Other attributes, properties in particular, are never evaluated.
+
         """
         decorated = False
 
@@ -115,6 +238,11 @@ class Bus:
                 self.addListener(evt, object)
             decorated = True
 
+        if hasattr(object, '_batch_events'):
+            for evt in object._batch_events:
+                self.addBatchListener(evt, object)
+            decorated = True
+
         # global functions binded as emitters
         if isinstance(object, _Emitter):
             object.buses.append(self)
@@ -126,7 +254,7 @@ class Bus:
 
         # object is instance variable, find unbound methods in the instance
         if inspect.isclass(object.__class__):
-            for _, attr in inspect.getmembers(object):
+            for attr in _bindableAttributes(object):
 
                 # bind callbacks
                 if hasattr(attr, '_events'):
@@ -134,6 +262,11 @@ class Bus:
                         self.addListener(evt, attr)
                     decorated = True
 
+                if hasattr(attr, '_batch_events'):
+                    for evt in attr._batch_events:
+                        self.addBatchListener(evt, attr)
+                    decorated = True
+
                 # bind emitters
                 if isinstance(attr, _Emitter):
                     logger.debug('Added emitter {}', attr)
@@ -143,15 +276,236 @@ class Bus:
         if not decorated:
             raise ValueError('Expected callbacks or emitters in {}.'.format(object))
 
+    def unbind(self, object):
+        """Reverse of :meth:`bind`, removing every listener and emitter of an object.
+
+        Bindings that do not exist are ignored.
+        """
+        attrs = [object]
+        if inspect.isclass(object.__class__):
+            attrs.extend(_bindableAttributes(object))
+
+        for attr in attrs:
+            for evt in getattr(attr, '_events', ()):
+                self._removeCallbacks(evt, attr)
+            for evt in getattr(attr, '_batch_events', ()):
+                self._removeCallbacks(evt, attr)
+
+            if isinstance(attr, _Emitter):
+                while self in attr.buses:
+                    attr.buses.remove(self)
+                for emitters in self._emitters.values():
+                    while attr in emitters:
+                        emitters.remove(attr)
+
+        if isinstance(object, DeferedSource) and getattr(object, '_bus', None) is self:
+            object._bus = None
+
     def emit(self, event, data):
         """Directly emit events into the event bus."""
 
-        if event not in self._callbacks:
+        callbacks = self._callbacks.get(event) or self._resolve(event)
+        if not callbacks:
             logger.debug('{} not listened', event)
+            return
 
-        with threading.Lock():
-            for cb in self._callbacks[event]:
+        if self._lock is None:
+            for cb in callbacks:
                 cb(data)
+        else:
+            with self._lock:
+                for cb in callbacks:
+                    cb(data)
+
+    def emitBatch(self, event, sequence):
+        """Emit every item of a sequence as an event of the same name.
+
+        Batch listeners, see :func:`on_batch`, receive the whole sequence in a
+        single call. Any run of consecutive scalar listeners receives the items
+        one by one, item by item, exactly as if :meth:`emit` was called on each
+        item in turn. Listeners are otherwise visited in the order they were
+        added.
+        """
+        if event in self._conflators:
+            for data in sequence:
+                self._conflators[event].push(data)
+            return
+
+        callbacks = self._listenersOf(event)
+        if not callbacks:
+            logger.debug('{} not listened', event)
+            return
+
+        if self.profiler is not None:
+            deliver = self.profiler.dispatchBatch
+        else:
+            deliver = _deliverBatch
+
+        if self._lock is None:
+            deliver(event, callbacks, sequence)
+        else:
+            with self._lock:
+                deliver(event, callbacks, sequence)
+
+    def freeze(self):
+        """Compile the listeners of every event into flat dispatch tables.
+
+        Once all objects are bound, freezing the bus turns :meth:`emit` into a
+        single dictionary lookup followed by a call loop over a tuple of
+        callbacks. Listeners added after the bus is frozen are still delivered,
+        the affected event is simply recompiled.
+        """
+        self._dispatch = {evt: tuple(cbs) for evt, cbs in self._callbacks.items()}
+        self.frozen = True
+        self._rebindEmit()
+
+    def unfreeze(self):
+        """Revert to the dynamic dispatch of :meth:`emit`."""
+        self._dispatch = {}
+        self.frozen = False
+        self._rebindEmit()
+
+    def enableProfiling(self, window=10000):
+        """Start recording call counts and latencies of events and listeners.
+
+        Args
+        ----
+        window : int, optional
+            Number of most recent latency samples kept per event and per listener
+            for the percentile estimates. Defaults to 10000.
+
+        Returns
+        -------
+        :class:`BusProfiler`
+            The profiler collecting the statistics of this bus.
+
+        """
+        self.profiler = BusProfiler(window)
+        self._rebindEmit()
+        return self.profiler
+
+    def disableProfiling(self):
+        """Stop profiling and return the detached profiler, if any."""
+        profiler, self.profiler = self.profiler, None
+        self._rebindEmit()
+        return profiler
+
+    def conflate(self, event, interval, reducer=None):
+        """Deliver an event at most once per interval.
+
+        The first event of a burst is delivered right away. Events emitted within
+        the following interval are held back and only the latest one is delivered
+        once the interval has elapsed, unless a reducer is given, in which case
+        the held back events are merged into a single value by
+        ``reducer(merged, data)``.
+
+        Delivery at the end of an interval happens on a timer thread. Buses with
+        conflated events should hence be created with ``threaded=True``, or be an
+        :class:`AsyncBus`.
+
+        Args
+        ----
+        event : str
+            Name of the event to be conflated.
+        interval : float
+            Minimum number of seconds between two deliveries of the event.
+        reducer : callable, optional
+            Function merging pending event data with newly emitted data.
+
+        """
+        if interval <= 0:
+            raise ValueError('Conflation interval must be positive.')
+        self.deconflate(event)
+        self._conflators[event] = _Conflator(self, event, interval, reducer)
+        self._rebindEmit()
+
+    def deconflate(self, event):
+        """Deliver every emission of an event again. Pending data is delivered first."""
+        conflator = self._conflators.pop(event, None)
+        if conflator is not None:
+            conflator.flush()
+        self._rebindEmit()
+
+    def flushConflated(self):
+        """Deliver the pending data of all conflated events immediately."""
+        for conflator in list(self._conflators.values()):
+            conflator.flush()
+
+    def _rebindEmit(self):
+        """Shadow :meth:`emit` with the implementation fitting the bus state."""
+        self.__dict__.pop('emit', None)
+        if self.profiler is not None:
+            self.emit = self._emitProfiled
+        elif self.frozen:
+            if self._lock is None:
+                self.emit = self._emitFrozen
+            else:
+                self.emit = self._emitFrozenLocked
+
+        # Conflated events are intercepted ahead of the selected implementation
+        if self._conflators:
+            self._emitUnconflated = self.emit
+            self.emit = self._emitConflated
+
+    def _emitConflated(self, event, data):
+        conflator = self._conflators.get(event)
+        if conflator is None:
+            self._emitUnconflated(event, data)
+        else:
+            conflator.push(data)
+
+    def _listenersOf(self, event):
+        if self.frozen:
+            callbacks = self._dispatch.get(event)
+        else:
+            callbacks = self._callbacks.get(event)
+
+        if callbacks is None:
+            return self._resolve(event)
+        return callbacks
+
+    def _resolve(self, event):
+        """Route a newly seen event name to the listeners of matching patterns.
+
+        Every name is matched against the patterns only once, the listeners are
+        then part of the routing table of the name like any other listener.
+        """
+        if not self._patterns or event in self._resolved:
+            return ()
+        self._resolved.add(event)
+
+        matched = [cb for _, regex, cb in self._patterns if regex.match(event)]
+        if not matched:
+            return ()
+
+        self._callbacks[event] = matched
+        self._recompile(event)
+        return self._listenersOf(event)
+
+    def _emitProfiled(self, event, data):
+        callbacks = self._listenersOf(event)
+        if self._lock is None:
+            self.profiler.dispatch(event, callbacks, data)
+        else:
+            with self._lock:
+                self.profiler.dispatch(event, callbacks, data)
+
+    def _emitFrozen(self, event, data):
+        callbacks = self._dispatch.get(event)
+        if callbacks is None:
+            callbacks = self._resolve(event)
+        for cb in callbacks:
+            cb(data)
+
+    def _emitFrozenLocked(self, event, data):
+        with self._lock:
+            self._emitFrozen(event, data)
+
+    def _recompile(self, event):
+        """Refresh the dispatch table of an event if the bus is frozen."""
+        if not self.frozen:
+            return
+        self._dispatch[event] = tuple(self._callbacks[event])
 
     def on(self, event):
         """Decorator for global functions as bound event callbacks.
@@ -204,8 +558,103 @@ class Bus:
 
     def addListener(self, event, func):
         """Add the provided function to the list of listeners of the provided event."""
-        self._callbacks[event].append(func)
-        logger.debug('Added listener {} for event "{}" to {}', func, event, self)
+        self._addCallback(event, self._hold(event, func))
+
+    def addBatchListener(self, event, func):
+        """Add the provided function as a batch listener of the provided event.
+
+        The function is called with a sequence of event data. Events emitted with
+        :meth:`emit` are delivered as a sequence of one.
+        """
+        self._addCallback(event, _BatchListener(self._hold(event, func)))
+
+    def removeListener(self, event, func):
+        """Remove every registration of the provided function for the provided event.
+
+        Raises
+        ------
+        ValueError
+            If the function is not a listener of the event.
+
+        """
+        if not self._removeCallbacks(event, func):
+            raise ValueError('{} is not a listener of "{}"'.format(func, event))
+        logger.debug('Removed listener {} for event "{}" from {}', func, event, self)
+
+    def _hold(self, event, func):
+        if self._weak and inspect.ismethod(func):
+            return _WeakListener(func, partial(self._removeDead, event))
+        return func
+
+    def _addCallback(self, event, callback):
+        if _isPattern(event):
+            regex = _compilePattern(event)
+            self._patterns.append((event, regex, callback))
+            for evt in set(self._callbacks) | self._resolved:
+                if regex.match(evt):
+                    self._callbacks[evt].append(callback)
+                    self._recompile(evt)
+        else:
+            if event not in self._callbacks:
+                self._resolve(event)
+            self._callbacks[event].append(callback)
+            self._recompile(event)
+        logger.debug('Added listener {} for event "{}" to {}', callback, event, self)
+
+    def _removeCallbacks(self, event, func):
+        def matches(cb):
+            if isinstance(cb, _BatchListener):
+                return cb == func or cb.func == func
+            return cb == func
+
+        return self._purge(event, matches)
+
+    def _removeDead(self, event, listener):
+        def matches(cb):
+            return cb is listener or getattr(cb, 'func', None) is listener
+
+        self._purge(event, matches)
+
+    def _purge(self, event, predicate):
+        """Drop the matching callbacks of an event or pattern, return the number removed."""
+        if not _isPattern(event):
+            return self._filterCallbacks(event, predicate)
+
+        kept = [p for p in self._patterns if not (p[0] == event and predicate(p[2]))]
+        removed = len(self._patterns) - len(kept)
+        if removed:
+            self._patterns = kept
+            regex = _compilePattern(event)
+            for evt in list(self._callbacks):
+                if regex.match(evt):
+                    self._filterCallbacks(evt, predicate)
+        return removed
+
+    def _filterCallbacks(self, event, predicate):
+        """Drop the matching callbacks of an event, return the number removed.
+
+        The callback list is replaced rather than mutated, so that deliveries in
+        progress keep iterating the list they started with.
+        """
+        callbacks = self._callbacks.get(event)
+        if not callbacks:
+            return 0
+
+        kept = [cb for cb in callbacks if not predicate(cb)]
+        if len(kept) == len(callbacks):
+            return 0
+
+        if kept:
+            self._callbacks[event] = kept
+        else:
+            del self._callbacks[event]
+
+        if self.frozen:
+            if kept:
+                self._dispatch[event] = tuple(kept)
+            else:
+                self._dispatch.pop(event, None)
+        return len(callbacks) - len(kept)
 
     def makeEmitter(self, event, func):
         """Return an emitter function binded to the caller bus."""
@@ -235,11 +684,509 @@ class Bus:
         return emitter
 
 
+def _isPattern(event):
+    return '*' in event
+
+
+@lru_cache(maxsize=None)
+def _compilePattern(pattern):
+    """Translate a wildcard event pattern into a regular expression.
+
+    Event names are hierarchies of segments separated by colons. A ``*`` matches
+    within a single segment, while ``**`` matches one or more whole segments.
+    """
+    parts = re.split(r'(\*\*|\*)', pattern)
+    regex = ''.join(
+        '.+' if part == '**' else '[^:]+' if part == '*' else re.escape(part)
+        for part in parts
+    )
+    return re.compile(regex + r'\Z')
+
+
+# Class -> sorted tuple of attribute names holding listeners or emitters
+_bindable_names = weakref.WeakKeyDictionary()
+
+
+def _isBindable(attr):
+    # Look through staticmethod and classmethod wrappers
+    attr = getattr(attr, '__func__', attr)
+    return (
+        hasattr(attr, '_events')
+        or hasattr(attr, '_batch_events')
+        or isinstance(attr, _Emitter)
+    )
+
+
+def _bindableNames(cls):
+    """Return the names of the listeners and emitters defined by a class."""
+    try:
+        return _bindable_names[cls]
+    except KeyError:
+        pass
+
+    names = set()
+    for klass in reversed(cls.__mro__):
+        for name, attr in vars(klass).items():
+            if _isBindable(attr):
+                names.add(name)
+            else:
+                # An undecorated override hides a decorated base attribute
+                names.discard(name)
+
+    names = tuple(sorted(names))
+    try:
+        _bindable_names[cls] = names
+    except TypeError:
+        pass
+    return names
+
+
+def _bindableAttributes(object):
+    """Yield the listeners and emitters of an object in the order of their names."""
+    names = set(_bindableNames(type(object)))
+    for name, attr in getattr(object, '__dict__', {}).items():
+        if _isBindable(attr):
+            names.add(name)
+        else:
+            names.discard(name)
+
+    for name in sorted(names):
+        try:
+            yield getattr(object, name)
+        except AttributeError:
+            continue
+
+
+def _deliverBatch(event, callbacks, sequence):
+    scalars = []
+    for cb in callbacks:
+        if isinstance(cb, _BatchListener):
+            for item in sequence:
+                for scalar in scalars:
+                    scalar(item)
+            scalars = []
+            cb.func(sequence)
+        else:
+            scalars.append(cb)
+
+    for item in sequence:
+        for scalar in scalars:
+            scalar(item)
+
+
+class _Stats:
+    """Call count, cumulative time and a window of recent latency samples."""
+
+    __slots__ = ('count', 'total', 'samples', 'max_depth')
+
+    def __init__(self, window):
+        self.count = 0
+        self.total = 0.0
+        self.samples = deque(maxlen=window)
+        self.max_depth = 0
+
+    def record(self, elapsed):
+        self.count += 1
+        self.total += elapsed
+        self.samples.append(elapsed)
+
+    def percentile(self, q):
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def asdict(self):
+        return {
+            'count': self.count,
+            'total': self.total,
+            'mean': self.total / self.count if self.count else None,
+            'p50': self.percentile(0.5),
+            'p99': self.percentile(0.99),
+            'max_depth': self.max_depth,
+        }
+
+
+def _listenerName(cb):
+    if isinstance(cb, _BatchListener):
+        cb = cb.func
+    return getattr(cb, '__qualname__', None) or repr(cb)
+
+
+class BusProfiler:
+    """Latency and call count statistics of the events delivered by a bus.
+
+    Events are timed from the start to the end of their delivery, which
+    includes the delivery of nested events emitted by the listeners. Listeners
+    are timed per call and aggregated by qualified name, so every instance of
+    the same class method shares a single entry. The depth of an event is its
+    level of nesting, where an event emitted from outside of any listener has a
+    depth of 1.
+
+    Args
+    ----
+    window : int
+        Number of most recent latency samples kept for the percentile estimates.
+
+    """
+
+    def __init__(self, window=10000):
+        self.window = window
+        self.events = {}
+        self.listeners = {}
+        self._local = threading.local()
+
+    def reset(self):
+        """Discard all recorded statistics."""
+        self.events = {}
+        self.listeners = {}
+
+    def dispatch(self, event, callbacks, data):
+        """Deliver data to the callbacks while recording their latencies."""
+        with self._timeEvent(event):
+            for cb in callbacks:
+                start = time.perf_counter()
+                cb(data)
+                self._listenerStats(cb).record(time.perf_counter() - start)
+
+    def dispatchBatch(self, event, callbacks, sequence):
+        """Batch counterpart of :meth:`dispatch`, see :meth:`Bus.emitBatch`."""
+        timed = [self._timed(cb) for cb in callbacks]
+        with self._timeEvent(event):
+            _deliverBatch(event, timed, sequence)
+
+    def stats(self):
+        """Return the statistics as a dictionary of events and listeners."""
+        return {
+            'events': {k: v.asdict() for k, v in self.events.items()},
+            'listeners': {k: v.asdict() for k, v in self.listeners.items()},
+        }
+
+    def dump(self, path):
+        """Write the statistics to a file, as CSV if the path ends with .csv else JSON."""
+        stats = self.stats()
+        with open(path, 'w', newline='') as f:
+            if not str(path).endswith('.csv'):
+                json.dump(stats, f, indent=2)
+                return
+
+            fields = ['kind', 'name', 'count', 'total', 'mean', 'p50', 'p99', 'max_depth']
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            for kind in ('events', 'listeners'):
+                for name, row in stats[kind].items():
+                    writer.writerow(dict(row, kind=kind[:-1], name=name))
+
+    def _listenerStats(self, cb):
+        name = _listenerName(cb)
+        try:
+            return self.listeners[name]
+        except KeyError:
+            return self.listeners.setdefault(name, _Stats(self.window))
+
+    def _timed(self, cb):
+        stats = self._listenerStats(cb)
+        func = cb.func if isinstance(cb, _BatchListener) else cb
+
+        def timed(data):
+            start = time.perf_counter()
+            func(data)
+            stats.record(time.perf_counter() - start)
+
+        return _BatchListener(timed) if isinstance(cb, _BatchListener) else timed
+
+    def _timeEvent(self, event):
+        return _EventTimer(self, event)
+
+
+class _EventTimer:
+    """Context manager timing the delivery of an event at its nesting depth."""
+
+    __slots__ = ('profiler', 'event', 'stats', 'start')
+
+    def __init__(self, profiler, event):
+        self.profiler = profiler
+        self.event = event
+
+    def __enter__(self):
+        local = self.profiler._local
+        local.depth = getattr(local, 'depth', 0) + 1
+
+        stats = self.profiler.events.get(self.event)
+        if stats is None:
+            stats = self.profiler.events.setdefault(
+                self.event, _Stats(self.profiler.window)
+            )
+        stats.max_depth = max(stats.max_depth, local.depth)
+        self.stats = stats
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        self.profiler._local.depth -= 1
+        self.stats.record(elapsed)
+
+
+_NOTHING = object()
+
+
+class _Conflator:
+    """Rate limiter holding back the data of one event, see :meth:`Bus.conflate`."""
+
+    def __init__(self, bus, event, interval, reducer=None):
+        self.bus = bus
+        self.event = event
+        self.interval = interval
+        self.reducer = reducer
+
+        self._pending = _NOTHING
+        self._next = 0.0
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def push(self, data):
+        with self._lock:
+            now = time.monotonic()
+            if self._pending is _NOTHING and now >= self._next:
+                self._next = now + self.interval
+                deliver = True
+            else:
+                deliver = False
+                if self._pending is _NOTHING or self.reducer is None:
+                    self._pending = data
+                else:
+                    self._pending = self.reducer(self._pending, data)
+                if self._timer is None:
+                    self._timer = threading.Timer(self._next - now, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+
+        if deliver:
+            self.bus._emitUnconflated(self.event, data)
+
+    def flush(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            data, self._pending = self._pending, _NOTHING
+            if data is _NOTHING:
+                return
+            self._next = time.monotonic() + self.interval
+
+        self.bus._emitUnconflated(self.event, data)
+
+
+# Backpressure policies of AsyncBus
+BLOCK = 'block'
+DROP_OLDEST = 'drop-oldest'
+COALESCE = 'coalesce'
+
+
+class _EventQueue:
+    """Bounded FIFO of pending (event, data, batch) entries with a backpressure policy."""
+
+    def __init__(self, maxsize, policy):
+        self.maxsize = maxsize
+        self.policy = policy
+        self.dropped = 0
+        self.closed = False
+
+        self._items = deque()
+        # Event -> queued entry, for in-place replacement under COALESCE
+        self._pending = {}
+        self._cond = threading.Condition()
+
+    def put(self, event, data, batch=False):
+        with self._cond:
+            if self.closed:
+                raise BusClosed()
+
+            coalesce = self.policy == COALESCE and not batch
+            if coalesce and event in self._pending:
+                self._pending[event][1] = data
+                return
+
+            if len(self._items) >= self.maxsize:
+                if self.policy == DROP_OLDEST:
+                    self._discard(self._items.popleft())
+                    self.dropped += 1
+                else:
+                    while len(self._items) >= self.maxsize and not self.closed:
+                        self._cond.wait()
+                    if self.closed:
+                        raise BusClosed()
+
+            entry = [event, data, batch]
+            self._items.append(entry)
+            if coalesce:
+                self._pending[event] = entry
+            self._cond.notify_all()
+
+    def get(self):
+        """Block until an entry is available. Return None once closed and drained."""
+        with self._cond:
+            while not self._items and not self.closed:
+                self._cond.wait()
+            if not self._items:
+                return None
+            entry = self._items.popleft()
+            self._discard(entry)
+            self._cond.notify_all()
+            return entry
+
+    def close(self):
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+    def _discard(self, entry):
+        if self._pending.get(entry[0]) is entry:
+            del self._pending[entry[0]]
+
+    def __len__(self):
+        return len(self._items)
+
+
+class AsyncBus(Bus):
+    """Event bus that delivers events on a pool of worker threads.
+
+    Emitting into an asynchronous bus only places the event on a bounded queue,
+    so the emitting thread, e.g. the receive thread of a datafeed, never waits
+    for listeners to finish. Every event name is pinned to a single worker, hence
+    the data of one event is always delivered in the order it was emitted.
+    Events emitted by listeners from within a worker thread are delivered
+    synchronously on that worker, exactly as a :class:`Bus` would.
+
+    Args
+    ----
+    workers : int, optional
+        Number of worker threads. Defaults to 1, in which case all listeners run
+        on a single thread in emission order.
+    maxsize : int, optional
+        Capacity of the queue of each worker. Defaults to 1024.
+    policy : str, optional
+        Behaviour when a queue is full. One of :data:`BLOCK` (wait for space,
+        the default), :data:`DROP_OLDEST` (discard the oldest pending event) or
+        :data:`COALESCE` (replace the data of an already pending event of the same
+        name with the newer data, otherwise block). A batch queued by
+        :meth:`emitBatch` counts as one pending event and is never coalesced.
+    weak : bool, optional
+        Hold bound method listeners through weak references, see :class:`Bus`.
+
+    Note
+    ----
+    Listeners of events pinned to different workers may run concurrently. They
+    must not share unguarded state when more than one worker is used.
+
+    """
+
+    def __init__(self, workers=1, maxsize=1024, policy=BLOCK, weak=False):
+        if policy not in (BLOCK, DROP_OLDEST, COALESCE):
+            raise ValueError('Unknown backpressure policy {}'.format(policy))
+        if workers < 1 or maxsize < 1:
+            raise ValueError('At least one worker and a positive queue size required.')
+        super().__init__(weak=weak)
+
+        self.policy = policy
+        self._queues = [_EventQueue(maxsize, policy) for _ in range(workers)]
+        self._assignment = {}
+        self._threads = []
+        self._worker_ids = set()
+
+        for i, queue in enumerate(self._queues):
+            thread = threading.Thread(
+                target=self._work, args=(queue,), name='{}-worker-{}'.format(self, i)
+            )
+            thread.daemon = True
+            self._threads.append(thread)
+            thread.start()
+            self._worker_ids.add(thread.ident)
+
+    def __repr__(self):
+        return '<AsyncBus({})>'.format(self.name)
+
+    @property
+    def dropped(self):
+        """Number of events discarded under the :data:`DROP_OLDEST` policy."""
+        return sum(q.dropped for q in self._queues)
+
+    def emit(self, event, data):
+        """Queue an event for delivery by the worker the event is pinned to."""
+        if threading.get_ident() in self._worker_ids:
+            self._deliver(event, data)
+            return
+
+        self._queueOf(event).put(event, data)
+
+    def emitBatch(self, event, sequence):
+        """Queue a whole sequence of events for delivery, see :meth:`Bus.emitBatch`."""
+        if threading.get_ident() in self._worker_ids or event in self._conflators:
+            super().emitBatch(event, sequence)
+            return
+        self._queueOf(event).put(event, sequence, batch=True)
+
+    def close(self, wait=True):
+        """Stop accepting events. Pending events are still delivered.
+
+        Args
+        ----
+        wait : bool, optional
+            Block until the workers have drained their queues. Defaults to True.
+
+        """
+        self.flushConflated()
+        for queue in self._queues:
+            queue.close()
+        if wait:
+            for thread in self._threads:
+                if thread.ident != threading.get_ident():
+                    thread.join()
+
+    def _queueOf(self, event):
+        try:
+            return self._assignment[event]
+        except KeyError:
+            queue = self._queues[len(self._assignment) % len(self._queues)]
+            return self._assignment.setdefault(event, queue)
+
+    def _rebindEmit(self):
+        # Emission stays queued, workers pick up the bus state in _deliver
+        self.__dict__.pop('emit', None)
+        if self._conflators:
+            self._emitUnconflated = self.emit
+            self.emit = self._emitConflated
+
+    def _deliver(self, event, data):
+        callbacks = self._listenersOf(event)
+        if self.profiler is not None:
+            self.profiler.dispatch(event, callbacks, data)
+            return
+
+        for cb in callbacks:
+            cb(data)
+
+    def _work(self, queue):
+        while True:
+            entry = queue.get()
+            if entry is None:
+                return
+            event, data, batch = entry
+            try:
+                if batch:
+                    Bus.emitBatch(self, event, data)
+                else:
+                    self._deliver(event, data)
+            except Exception:
+                logger.exception('Uncaught exception in listener of "{}"', event)
+
+
 def on(event):
     """Unbound version of :meth:`Bus.on`.
 
     An unbounded callback must be binded to an event bus to be useful. Without
-    a binding, the callback behaves just like a regular function.
+    a binding, the callback behaves just like a regular function. The event may
+    be a wildcard pattern, see :class:`Bus`.
     """
     if not isinstance(event, str):
         raise TypeError('Event string required.')
@@ -254,6 +1201,26 @@ def on(event):
     return decorator
 
 
+def on_batch(event):
+    """Decorator for marking functions or methods as batch listeners of an event.
+
+    A batch listener takes a single positional argument which is a sequence of
+    event data. It receives whole chunks from :meth:`Bus.emitBatch`, and a
+    sequence of one item for every event emitted with :meth:`Bus.emit`.
+    """
+    if not isinstance(event, str):
+        raise TypeError('Event string required.')
+
+    def decorator(method):
+        if hasattr(method, '_batch_events'):
+            method._batch_events.append(event)
+        else:
+            method._batch_events = [event]
+        return method
+
+    return decorator
+
+
 def source(event):
     """Unbound version of :meth:`Bus.source`.
 
@@ -13,14 +13,32 @@ from functools import wraps
 from collections import OrderedDict
 
 import cryptle.logging as logging
-import csv
 import os
+import pickle
+import struct
 from pathlib import Path
 import datetime
 
+import numpy as np
+
+from cryptle.metric.batch import BatchColumns, last_value
+from cryptle.metric.rolling import RollingEstimator
+
 logger = logging.getLogger(__name__)
 
 
+def _env_flag(name):
+    """Whether an environment variable is set to 1, true or yes, in any case."""
+    return os.environ.get(name, '').strip().lower() in ('1', 'true', 'yes')
+
+
+# Debug logging of every update of every metric, for tracing the broadcast cascade.
+# Read from the environment at startup, the logging calls on the hot path are skipped
+# without evaluating their arguments unless it is set to 1, true or yes. Modules read
+# it as base.TRACE, so that it can also be switched at runtime.
+TRACE = _env_flag('CRYPTLE_METRIC_TRACE')
+
+
 class Metric:  # pylint: disable=no-member
     """Mixin class that provides dunder methods for of data objects witha single value."""
 
@@ -113,78 +131,281 @@ class Metric:  # pylint: disable=no-member
 
 
 class Candle:
-    """Mutable candle stick with namedtuple-like API."""
+    """Mutable candle stick with namedtuple-like API.
+
+    The values are held in slots rather than in a per-instance ``__dict__``, which
+    keeps candles small and attribute access cheap. :meth:`toArray` and
+    :meth:`fromArray` convert between candles and columnar NumPy arrays.
+    """
+
+    __slots__ = ('open', 'close', 'high', 'low', 'timestamp', 'volume', 'netvol')
+
+    _fields = __slots__
+
+    dtype = np.dtype(
+        [(field, np.int64 if field == 'timestamp' else np.float64) for field in _fields]
+    )
+    """Structured dtype of :meth:`toArray`, an integer timestamp and a float field per
+    other attribute. Candles with timestamps that are not integers have a float
+    timestamp instead."""
 
     def __init__(self, o, c, h, l, t, v, nv):
-        self._bar = [o, c, h, l, t, v, nv]
+        self.open = o
+        self.close = c
+        self.high = h
+        self.low = l
+        self.timestamp = t
+        self.volume = v
+        self.netvol = nv
 
     def __int__(self):
-        return int(self._bar[0])
+        return int(self.open)
 
     def __float__(self):
-        return float(self._bar[0])
+        return float(self.open)
 
     def __getitem__(self, item):
-        return self._bar[item]
+        if isinstance(item, slice):
+            return self._bar[item]
+        return getattr(self, self._fields[item])
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __iter__(self):
+        return iter(self._bar)
 
     def __repr__(self):
         return "Candle({})".format(self._bar.__repr__())
 
+    @property
+    def _bar(self):
+        """The values as a new list, in the order of the constructor arguments."""
+        return [
+            self.open,
+            self.close,
+            self.high,
+            self.low,
+            self.timestamp,
+            self.volume,
+            self.netvol,
+        ]
+
+    @classmethod
+    def toArray(cls, candles):
+        """Return the candles as a structured array of :attr:`dtype`."""
+        rows = [tuple(candle._bar) for candle in candles]
+        if all(_isInteger(row[4]) for row in rows):
+            return np.array(rows, dtype=cls.dtype)
+        return np.array(rows, dtype=_FLOAT_CANDLE)
+
+    @classmethod
+    def fromArray(cls, array):
+        """Return a list of candles from a structured array of :attr:`dtype`, or from a
+        2D array with a column per attribute in the order of the constructor
+        arguments."""
+        array = np.asarray(array)
+        if array.dtype.names:
+            columns = [array[field].tolist() for field in cls._fields]
+        else:
+            columns = array.T.tolist()
+        return [cls(*values) for values in zip(*columns)]
+
+
+_FLOAT_CANDLE = np.dtype([(field, np.float64) for field in Candle._fields])
+
+
+def _isInteger(value):
+    return isinstance(value, (int, np.integer))
+
+
+def _candle_field(index):
+    def fget(self):
+        store = self._store
+        return store._data[index, self._pos - store._base].item()
+
+    def fset(self, value):
+        store = self._store
+        store._data[index, self._pos - store._base] = value
+
+    return property(fget, fset)
+
+
+def _candle_time():
+    def fget(self):
+        store = self._store
+        return store._time[self._pos - store._base].item()
+
+    def fset(self, value):
+        store = self._store
+        store._setTime(self._pos - store._base, value)
+
+    return property(fget, fset)
+
+
+class CandleView:
+    """A candle held in a :class:`CandleColumns`, with the API of :class:`Candle`.
+
+    Reading and setting the attributes of the view reads and writes the columns of the
+    store. Views of candles pruned from the store must not be used.
+    """
+
+    __slots__ = ('_store', '_pos')
+
+    _fields = Candle._fields
+
+    open = _candle_field(0)
+    close = _candle_field(1)
+    high = _candle_field(2)
+    low = _candle_field(3)
+    timestamp = _candle_time()
+    volume = _candle_field(4)
+    netvol = _candle_field(5)
+
+    def __init__(self, store, pos):
+        self._store = store
+        self._pos = pos
+
+    __int__ = Candle.__int__
+    __float__ = Candle.__float__
+    __getitem__ = Candle.__getitem__
+    __len__ = Candle.__len__
+    __iter__ = Candle.__iter__
+    __repr__ = Candle.__repr__
+
+    @property
+    def _bar(self):
+        """The values as a new list, in the order of the constructor arguments of
+        :class:`Candle`."""
+        store = self._store
+        values = store._data[:, self._pos - store._base].tolist()
+        values.insert(4, store._time[self._pos - store._base].item())
+        return values
+
+
+class CandleColumns:
+    """Growable columnar store of candle sticks.
+
+    Each attribute of the candles is held in a preallocated float64 column, except for
+    the timestamps which are held as int64 until a timestamp that is not an integer is
+    appended, and as float64 from then on. Appending
+    a candle is amortised O(1), and pruning the oldest candles only moves the index of
+    the first one. The columns, e.g. :attr:`close`, are views of the candles held
+    without copying, and the candles themselves are accessed through
+    :class:`CandleView` by indexing the store like a list.
+
+    Args
+    ----
+    maxsize : int, optional
+        Number of candles after which the oldest one is pruned for every new one,
+        unbounded by default.
+    capacity : int, optional
+        Number of candles to preallocate for.
+
+    """
+
+    def __init__(self, maxsize=None, capacity=64):
+        self.maxsize = maxsize
+        self._data = np.empty((len(Candle._fields) - 1, capacity))
+        self._time = np.empty(capacity, dtype=np.int64)
+        self._start = 0
+        self._end = 0
+        # Position in the store of the first column entry, positions of candles stay
+        # valid when the columns are reallocated
+        self._base = 0
+
+    def __len__(self):
+        return self._end - self._start
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self[i] for i in range(*item.indices(len(self)))]
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError('CandleColumns index out of range')
+        return CandleView(self, self._base + self._start + item)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        return 'CandleColumns({} candles)'.format(len(self))
+
+    def append(self, o, c, h, l, t, v, nv):
+        """Append a candle, pruning the oldest one if the store is full."""
+        if self._end == self._data.shape[1]:
+            self._reserve()
+        self._data[:, self._end] = (o, c, h, l, v, nv)
+        self._setTime(self._end, t)
+        self._end += 1
+        if self.maxsize is not None and len(self) > self.maxsize:
+            self._start += 1
+
+    def prune(self, size):
+        """Drop all but the most recent ``size`` candles."""
+        self._start = max(self._start, self._end - size)
+
+    def toArray(self):
+        """Return a copy of the candles as a structured array of :attr:`Candle.dtype`."""
+        if self._time.dtype == np.int64:
+            array = np.empty(len(self), dtype=Candle.dtype)
+        else:
+            array = np.empty(len(self), dtype=_FLOAT_CANDLE)
+        for field in Candle._fields:
+            array[field] = getattr(self, field)
+        return array
+
+    def _setTime(self, pos, t):
+        if self._time.dtype == np.int64 and not _isInteger(t):
+            self._time = self._time.astype(np.float64)
+        self._time[pos] = t
+
+    def _reserve(self):
+        # Move the candles held to the front, in a larger allocation if more than half
+        # full, so that appending stays amortised O(1)
+        size = len(self)
+        capacity = self._data.shape[1]
+        if size > capacity // 2:
+            capacity *= 2
+        data = np.empty((len(Candle._fields) - 1, capacity))
+        data[:, :size] = self._data[:, self._start : self._end]
+        time = np.empty(capacity, dtype=self._time.dtype)
+        time[:size] = self._time[self._start : self._end]
+        self._base += self._start
+        self._data = data
+        self._time = time
+        self._start = 0
+        self._end = size
+
     @property
     def open(self):
-        return self._bar[0]
+        return self._data[0, self._start : self._end]
 
     @property
     def close(self):
-        return self._bar[1]
+        return self._data[1, self._start : self._end]
 
     @property
     def high(self):
-        return self._bar[2]
+        return self._data[2, self._start : self._end]
 
     @property
     def low(self):
-        return self._bar[3]
+        return self._data[3, self._start : self._end]
 
     @property
     def timestamp(self):
-        return self._bar[4]
+        return self._time[self._start : self._end]
 
     @property
     def volume(self):
-        return self._bar[5]
+        return self._data[4, self._start : self._end]
 
     @property
     def netvol(self):
-        return self._bar[6]
-
-    @open.setter
-    def open(self, value):
-        self._bar[0] = value
-
-    @close.setter
-    def close(self, value):
-        self._bar[1] = value
-
-    @high.setter
-    def high(self, value):
-        self._bar[2] = value
-
-    @low.setter
-    def low(self, value):
-        self._bar[3] = value
-
-    @timestamp.setter
-    def timestamp(self, value):
-        self._bar[4] = value
-
-    @volume.setter
-    def volume(self, value):
-        self._bar[5] = value
-
-    @netvol.setter
-    def netvol(self, value):
-        self._bar[6] = value
+        return self._data[5, self._start : self._end]
 
 
 class Model:
@@ -195,8 +416,6 @@ class Model:
         pass
 
 
-# Todo (MC):
-# Any timeseries type should also support list-based initialization and update
 class Timeseries(Metric):
     """Container for time series data.
 
@@ -214,16 +433,30 @@ class Timeseries(Metric):
     observable but not a observer. They act as a receptor for external data sources and
     should not depend on other Timeseries object for their updating of values.
 
+    Historical values are only recorded on request, see the ``history`` argument.
+
     Args
     ----
     *vargs : :class:`~cryptle.metric.base.Timeseries` or :class:`~cryptle.metric.base.MultivariateTS`
         One or more Timeseries/MultivariateTS objects to subscribe to
+    history : str, optional
+        Recording of the historical values for :meth:`__getitem__`. None by default
+        for no recording, 'memory' for holding all of them in memory, or 'disk' for
+        writing them to disk by a :class:`~cryptle.metric.base.DiskTS`.
 
     """
 
-    def __init__(self, *vargs):
-        self.mxtimeseries = MemoryTS(self)
-        self.hxtimeseries = DiskTS(self)
+    def __init__(self, *vargs, history=None):
+        if history is None:
+            self.hxtimeseries = None
+        elif history == 'memory':
+            self.hxtimeseries = DiskTS(self, store_num=None)
+        elif history == 'disk':
+            self.hxtimeseries = DiskTS(self)
+        else:
+            raise ValueError(
+                "Expected history to be None, 'memory' or 'disk', got {}".format(history)
+            )
         self.value = None
 
         # self.publishers are the list of references to timeseries objects that this
@@ -246,6 +479,11 @@ class Timeseries(Metric):
 
     def __getitem__(self, index):
         """Wrapping the DiskTS and give access via usual list-value getting syntax."""
+        if self.hxtimeseries is None:
+            raise ValueError(
+                "History of {} is not recorded, construct it with history='memory' "
+                "or 'disk'".format(repr(self))
+            )
         return self.hxtimeseries.__getitem__(index)
 
     # ???Todo(pine): Determine how to handle function arguments
@@ -255,33 +493,96 @@ class Timeseries(Metric):
             "Please implement an evaluate method for every Timeseries instance."
         )
 
+    def evaluate_batch(self, inputs):
+        """Compute the values of this Timeseries over a whole input series at once.
+
+        Instead of cascading the input values one at a time through
+        :meth:`processBroadcast`, every Timeseries upstream computes its full column of
+        values with NumPy, in topological order of the graph. The values agree with the
+        ones obtained by streaming, up to floating point rounding.
+
+        Args
+        ----
+        inputs : array-like or dict
+            Either a dict mapping source Timeseries to their columns of values, or a
+            single column if the graph has exactly one source. Any Timeseries of the
+            graph can be given as a source, e.g. ``stick.o`` of a
+            :class:`~cryptle.metric.timeseries.candle.CandleStick`.
+
+        Returns
+        -------
+        column : :class:`numpy.ndarray`
+            The value after each input value, NaN where the value would be None.
+
+        """
+        return BatchColumns(self, inputs)[self]
+
+    def _evaluate_batch(self, columns):
+        """Virtual method computing the column of the Timeseries from the
+        :class:`~cryptle.metric.batch.BatchColumns` of the graph."""
+        if not self.publishers:
+            raise ValueError(
+                'No input column given for the source {}'.format(repr(self))
+            )
+        raise NotImplementedError(
+            '{} does not support batch evaluation'.format(type(self).__name__)
+        )
+
+    def _warmup(self, columns):
+        """Virtual method seeding the state of the Timeseries from the
+        :class:`~cryptle.metric.batch.BatchColumns` of the graph, as if their values had
+        been streamed, see :meth:`~cryptle.metric.graph.MetricGraph.warmup`.
+
+        By default the cache of an :meth:`evaluate` decorated by
+        :meth:`MemoryTS.cache` is seeded with the most recent upstream values, and the
+        value is the last of the column of the Timeseries. Timeseries that do not
+        support batch evaluation evaluate their value from the seeded cache instead.
+        Subclasses holding further state, e.g. running averages, override this.
+        """
+        evaluate = type(self).evaluate
+        cached = getattr(evaluate, 'prune_type', None) == 'normal'
+        if cached:
+            MemoryTS.seed(self, columns)
+        try:
+            column = columns[self]
+        except NotImplementedError:
+            if not cached:
+                raise
+            evaluate.__wrapped__(self)
+        else:
+            self.value = last_value(column)
+
     def processBroadcast(self, pos):
         """To be called when all the listened Timeseries updated at least once."""
         if len(self.publishers) == 1:
-            logger.debug(
-                'Obj: {}. All publisher broadcasted, proceed to updating', repr(self)
-            )
+            if TRACE:
+                logger.debug(
+                    'Obj: {}. All publisher broadcasted, proceed to updating',
+                    repr(self),
+                )
             self.update()
         else:
             self.publishers_broadcasted.add(self.publishers[pos])
             if len(self.publishers_broadcasted) < len(self.publishers):
-                logger.debug(
-                    'Obj: {}. Number of publisher broadcasted: {}',
-                    repr(self),
-                    len(self.publishers_broadcasted),
-                )
-                logger.debug(
-                    'Obj: {}. Number of publisher remaining: {}',
-                    repr(self),
-                    len(self.publishers) - len(self.publishers_broadcasted),
-                )
+                if TRACE:
+                    logger.debug(
+                        'Obj: {}. Number of publisher broadcasted: {}',
+                        repr(self),
+                        len(self.publishers_broadcasted),
+                    )
+                    logger.debug(
+                        'Obj: {}. Number of publisher remaining: {}',
+                        repr(self),
+                        len(self.publishers) - len(self.publishers_broadcasted),
+                    )
             else:
                 self.publishers_broadcasted.clear()
                 self.update()
-                logger.debug(
-                    'Obj: {}. All publisher broadcasted, proceed to updating',
-                    repr(self),
-                )
+                if TRACE:
+                    logger.debug(
+                        'Obj: {}. All publisher broadcasted, proceed to updating',
+                        repr(self),
+                    )
 
     # ???Todo(pine): This should take arguments, requiring subclasses to know the internals of the
     # observables defeats the purpose of having this interface
@@ -290,12 +591,15 @@ class Timeseries(Metric):
         update."""
         # By current design, all :meth:`evaluate` of subscribers would be called if
         # candle decides to broadcast
-        logger.debug(
-            'Obj: {}. Calling evaluate method of the respective Timeseries', repr(self)
-        )
+        if TRACE:
+            logger.debug(
+                'Obj: {}. Calling evaluate method of the respective Timeseries',
+                repr(self),
+            )
         string = self.evaluate()
         if string != 'source' and string != 'NA':
-            self.hxtimeseries.evaluate()
+            if self.hxtimeseries is not None:
+                self.hxtimeseries.evaluate()
             self.broadcast()
 
         # The :meth:`evaluate` of hxtimeseries would also be called by default, could
@@ -313,11 +617,12 @@ class Timeseries(Metric):
         # 2. pass the index to subscriber
         for subscriber in self.subscribers:
             pos = [id(x) for x in subscriber.publishers].index(id(self))
-            logger.debug(
-                'Obj: {}, Calling processBroadcast of subscriber {}',
-                repr(self),
-                type(subscriber),
-            )
+            if TRACE:
+                logger.debug(
+                    'Obj: {}, Calling processBroadcast of subscriber {}',
+                    repr(self),
+                    type(subscriber),
+                )
             subscriber.processBroadcast(pos)
 
     def subscribe(self, new_ts):
@@ -340,10 +645,26 @@ class Timeseries(Metric):
         logger.info('Obj: {}, unregistering {} as a listener', self, ts)
         # to be implemented
 
-    def importBars(self):
-        """ Import functionality to import well defined excel columns as Timeseries
-        objects """
-        raise NotImplementedError
+    def snapshot(self):
+        """Return the internal state of the Timeseries as a compact binary snapshot.
+
+        The state covers the value, the caches and the running estimators, but neither
+        the publishers and subscribers nor the recorded history. See
+        :meth:`~cryptle.metric.graph.MetricGraph.snapshot` for a whole graph.
+        """
+        return pickle.dumps(self._getState(), protocol=pickle.HIGHEST_PROTOCOL)
+
+    def restore(self, snapshot):
+        """Restore the internal state from a :meth:`snapshot` of a Timeseries declared
+        the same way. Snapshots are unpickled, only restore trusted ones."""
+        self._setState(pickle.loads(snapshot))
+
+    def _getState(self):
+        return _state(self)
+
+    def _setState(self, state):
+        vars(self).update(state)
+        self.publishers_broadcasted.clear()
 
     def __hash__(self):
         """ Let :class:`~Timeseries` be usable as dict keys, ignoring the object
@@ -397,6 +718,64 @@ class MultivariateTS:
                 lst_ts.append(obj)
         return lst_ts
 
+    def evaluate_batch(self, inputs):
+        """Compute the values of the held Timeseries over a whole input series at once.
+
+        See :meth:`~cryptle.metric.base.Timeseries.evaluate_batch`.
+
+        Returns
+        -------
+        columns : dict
+            The column of each public Timeseries attribute, by attribute name.
+
+        """
+        columns = BatchColumns(self, inputs)
+        return {
+            name: columns[obj]
+            for name, obj in sorted(self.__dict__.items())
+            if isinstance(obj, Timeseries) and not name.startswith('_')
+        }
+
+    def _evaluate_batch(self, columns):
+        raise NotImplementedError(
+            '{} does not support batch evaluation'.format(type(self).__name__)
+        )
+
+    def _warmup(self, columns):
+        """Virtual method seeding the state held by the wrapper itself, the held
+        Timeseries are seeded on their own."""
+        pass
+
+    def snapshot(self):
+        """Return the internal state of the wrapper and of the Timeseries it holds as
+        a compact binary snapshot, see :meth:`Timeseries.snapshot`."""
+        state = {name: ts._getState() for name, ts in self._held()}
+        state[None] = self._getState()
+        return pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def restore(self, snapshot):
+        """Restore the internal state from a :meth:`snapshot` of a wrapper declared the
+        same way. Snapshots are unpickled, only restore trusted ones."""
+        state = pickle.loads(snapshot)
+        self._setState(state.pop(None))
+        held = dict(self._held())
+        for name, ts_state in state.items():
+            held[name]._setState(ts_state)
+
+    def _held(self):
+        return [
+            (name, obj)
+            for name, obj in sorted(vars(self).items())
+            if isinstance(obj, Timeseries)
+        ]
+
+    def _getState(self):
+        return _state(self)
+
+    def _setState(self, state):
+        vars(self).update(state)
+        self.publishers_broadcasted.clear()
+
     def broadcast(self):
         """Duck-typed with the :meth:`~cryptle.metric.base.Timeseries.broadcast`"""
         pass
@@ -420,13 +799,145 @@ class MultivariateTS:
         )
 
 
+class RingBuffer:
+    """Fixed capacity FIFO of the most recent values backed by a NumPy array.
+
+    Values are written twice, at their slot and at their slot plus the capacity,
+    so that the window of the most recent values is always a contiguous region of
+    the array. Pushing a value is O(1) and slicing returns a view into the array
+    without copying. Views are overwritten by later pushes and must be copied if
+    they are to be kept.
+
+    Entries are either scalars or rows of the same length, the shape is fixed by
+    the first pushed value. Entries that do not fit the shape, e.g. rows of
+    different lengths, make the buffer fall back to holding arbitrary objects.
+
+    Incremental estimators keep track of the buffer through :attr:`pushes` and
+    :attr:`evicted`, see :mod:`cryptle.metric.rolling`.
+
+    Args
+    ----
+    capacity : int
+        Maximum number of values held.
+    values : iterable, optional
+        Initial values, of which only the most recent ``capacity`` are kept.
+
+    Attributes
+    ----------
+    pushes : int
+        Total number of values ever appended.
+    evicted
+        The value dropped out of the window by the last append, None if the
+        buffer was not full yet.
+
+    """
+
+    def __init__(self, capacity, values=()):
+        self.capacity = capacity
+        self.pushes = 0
+        self.evicted = None
+        self._array = None
+        self._pos = 0
+        self._size = 0
+        for value in values:
+            self.append(value)
+
+    def append(self, value):
+        if self._array is None:
+            self._allocate(value)
+
+        pos = self._pos
+        if self._size == self.capacity:
+            evicted = self._array[pos]
+            if isinstance(evicted, np.ndarray):
+                evicted = evicted.copy()
+        else:
+            evicted = None
+
+        try:
+            if value is None and self._array.dtype != object:
+                # NumPy would silently store None as NaN
+                raise TypeError
+            self._array[pos] = value
+        except (TypeError, ValueError):
+            self._toObject()
+            self.append(value)
+            return
+        self._array[pos + self.capacity] = self._array[pos]
+
+        self.evicted = evicted
+        self.pushes += 1
+        self._pos = (pos + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def _allocate(self, value):
+        try:
+            if value is None:
+                raise TypeError
+            shape = np.shape(value)
+            np.asarray(value, dtype=float)
+        except (TypeError, ValueError):
+            self._array = np.empty(2 * self.capacity, dtype=object)
+        else:
+            self._array = np.empty((2 * self.capacity,) + shape, dtype=float)
+
+    def _toObject(self):
+        values = [self[i] for i in range(self._size)]
+        pushes = self.pushes
+        self._array = np.empty(2 * self.capacity, dtype=object)
+        self._pos = 0
+        self._size = 0
+        for value in values:
+            self.append(value)
+        self.pushes = pushes
+
+    @property
+    def view(self):
+        """The values in insertion order as an array, without copying."""
+        if self._array is None:
+            return np.empty(0)
+        end = self._pos if self._pos >= self._size else self._pos + self.capacity
+        return self._array[end - self._size : end]
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        return iter(self.view)
+
+    def __getitem__(self, index):
+        item = self.view[index]
+        if isinstance(index, slice) or self._array.dtype == object:
+            return item
+        # Rows are given back as lists, like the entries of a list cache
+        return item.tolist() if item.ndim else item
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None:
+            return self.view
+        return self.view.astype(dtype)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return 'RingBuffer({})'.format(self.view.tolist())
+
+
 class MemoryTS(Metric):
     def __init__(self, ts):
         self._ts = ts
 
     @staticmethod
     def prune(arg, lookback=None):
-        """The MemoryTS class prune method (as opposed to the DiskTS one)."""
+        """The MemoryTS class prune method (as opposed to the DiskTS one).
+
+        A :class:`RingBuffer` cache is bounded by construction and returned as is.
+        """
+        if isinstance(arg._cache, RingBuffer):
+            return arg._cache
+
         if lookback is None:
             lookback = arg._lookback
 
@@ -435,6 +946,38 @@ class MemoryTS(Metric):
         else:
             return arg._cache[-lookback:]
 
+    @staticmethod
+    def seed(arg, columns):
+        """Seed the cache of a Timeseries with the most recent values of its upstream
+        in the :class:`~cryptle.metric.batch.BatchColumns` of the graph, as
+        :meth:`cache` would have cached them.
+
+        Rows of several upstream Timeseries are only cached where all of them have a
+        value.
+        """
+        rows = MemoryTS.rows(arg._ts, columns)
+        arg._cache = RingBuffer(arg._lookback, rows[-arg._lookback :])
+
+    @staticmethod
+    def rows(ts, columns):
+        """Return the values of one or more Timeseries in the order :meth:`cache`
+        caches them, a row per update where all of them have a value."""
+        if isinstance(ts, Timeseries):
+            column = columns[ts]
+            return column[~np.isnan(column)]
+
+        flat = []
+        for t in ts if isinstance(ts, tuple) else (ts,):
+            if isinstance(t, MultivariateTS):
+                flat.extend(t.get_generic_ts())
+            elif isinstance(t, Timeseries):
+                flat.append(t)
+        if len(flat) == 1:
+            return MemoryTS.rows(flat[0], columns)
+
+        table = np.column_stack([columns[t] for t in flat])
+        return table[~np.isnan(table).any(axis=1)]
+
     @staticmethod
     def cache(prune):
         """Decorator for any :meth:`evaluate` to maintain its valid cache for
@@ -442,7 +985,8 @@ class MemoryTS(Metric):
 
         The class method to be decorated should initialize self._cache as empty list.
         The class should also contain a private attribute ``._lookback`` for caching
-        purpose.
+        purpose. With the 'normal' prune type the list is replaced on first use by a
+        :class:`RingBuffer` holding the most recent ``._lookback`` values.
 
         It handles the cachine of possible types being pased into ``self._ts`` of a Timeseries.
 
@@ -460,8 +1004,10 @@ class MemoryTS(Metric):
                 # set alias self - hacking interface
                 self = args[0]
 
-                if prune is 'normal':
+                if prune == 'normal':
                     prune_type = MemoryTS.prune
+                    if type(self._cache) is list:
+                        self._cache = RingBuffer(self._lookback, self._cache)
                 elif prune == 'historical':
                     prune_type = DiskTS.prune
 
@@ -500,6 +1046,7 @@ class MemoryTS(Metric):
                 val = func(*args, **kwargs)
                 return val
 
+            wrapper.prune_type = prune
             return wrapper
 
         return with_prune_type
@@ -526,6 +1073,16 @@ class GenericTS(Timeseries):
         :meth:`~cryptle.metric.base.Timeseries.cache` decorator, False by default
     name : boolean, optional
         For easy referencing of GenericTS instance when necessary
+    batch_func : function, optional
+        A function taking the :class:`~cryptle.metric.batch.BatchColumns` of the graph
+        and returning the column of values of the GenericTS, for
+        :meth:`~cryptle.metric.base.Timeseries.evaluate_batch`
+    cache_of : :class:`~cryptle.metric.base.GenericTS`, optional
+        A sibling caching the same Timeseries with the same lookback, whose cache is
+        read instead of caching the values again. It must be declared before this
+        GenericTS, so that it is updated first.
+    history : str, optional
+        Same as :class:`~cryptle.metric.base.Timeseries`
 
     """
 
@@ -536,19 +1093,32 @@ class GenericTS(Timeseries):
             return self.name
 
     def __init__(
-        self, *vargs, name=None, lookback=None, eval_func=None, args=None, tocache=True
+        self,
+        *vargs,
+        name=None,
+        lookback=None,
+        eval_func=None,
+        args=None,
+        tocache=True,
+        batch_func=None,
+        cache_of=None,
+        history=None,
     ):
         self.name = name
-        super().__init__(*vargs)
+        super().__init__(*vargs, history=history)
         self._lookback = lookback
         self._ts = vargs
         self._cache = []
         self.eval_func = eval_func
         self.args = args
         self.tocache = tocache
+        self.batch_func = batch_func
+        self.cache_of = cache_of
 
     def evaluate(self):
-        if self.tocache:
+        if self.cache_of is not None:
+            return self.eval_with_shared_cache()
+        elif self.tocache:
             string = self.eval_with_cache()
             return string
         else:
@@ -565,6 +1135,16 @@ class GenericTS(Timeseries):
         else:
             return 'NA'
 
+    def eval_with_shared_cache(self):
+        """Use when the cache of a sibling is shared."""
+        self._cache = self.cache_of._cache
+        val = self.eval_func(*self.args)
+        if val is not None:
+            self.value = val
+            return 'generic'
+        else:
+            return 'NA'
+
     # def eval_with_cache(self):
     #    """Use when caching is needed."""
     #    val = self.eval_func(*self.args)
@@ -582,23 +1162,116 @@ class GenericTS(Timeseries):
         self.broadcast()
         return 'source'
 
+    def _evaluate_batch(self, columns):
+        if self.batch_func is None:
+            return super()._evaluate_batch(columns)
+        return self.batch_func(columns)
+
+    def _warmup(self, columns):
+        if self.tocache and self.cache_of is None:
+            MemoryTS.seed(self, columns)
+        try:
+            column = columns[self]
+        except NotImplementedError:
+            if self.cache_of is not None:
+                self.eval_with_shared_cache()
+            elif self.tocache:
+                GenericTS.eval_with_cache.__wrapped__(self)
+            else:
+                raise
+        else:
+            value = last_value(column)
+            if value is not None:
+                self.value = value
+
+
+# Attributes linking a metric into the graph rather than holding its state
+_wiring = frozenset(
+    [
+        'publishers',
+        'publishers_broadcasted',
+        'subscribers',
+        'hxtimeseries',
+        'eval_func',
+        'batch_func',
+        'args',
+        'cache_of',
+    ]
+)
+
+
+def _isState(value):
+    """Whether an attribute value is plain state, as opposed to a reference to other
+    metrics or to functions."""
+    if value is None or isinstance(
+        value,
+        (bool, int, float, str, np.ndarray, np.generic, RingBuffer, RollingEstimator),
+    ):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_isState(x) for x in value)
+    return False
+
+
+def _state(obj):
+    """Return the attributes of a metric holding its state."""
+    return {
+        name: value
+        for name, value in vars(obj).items()
+        if name not in _wiring and _isState(value)
+    }
+
+
+# Header of the history files of DiskTS: magic, number of columns (0 for scalar values)
+_HISTORY_HEADER = struct.Struct('<8sI4x')
+_HISTORY_MAGIC = b'CRYPTLTS'
+
+_histdir = None
+
+
+def _history_dir():
+    """Return the directory for the history files of this execution, creating it on
+    first use."""
+    global _histdir
+    if _histdir is None:
+        current_time_f = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        dirpath = Path.cwd() / 'histlog' / current_time_f
+        try:
+            os.makedirs(dirpath, exist_ok=True)
+        except OSError:
+            raise OSError(
+                "Error in creating the required directory for storing DiskTS values."
+            )
+        _histdir = dirpath
+    return _histdir
+
 
 class DiskTS(Metric):
     """Class for management, storage, and retrieval of historical :class:`Timeseries`
     data.
 
-    The current design of the storage of generated historical values is stored to
-    directory named "histlog", in which the timestamp of the stamp of the first
-    generated file during that execution would be used as the subdirectory name.
-    Indiviudal historical timeseries values would be stored within a file under their
-    respective class name and hash id to ensure uniqueness.
+    The most recent values are held in memory. Once more than twice ``store_num``
+    values are held, the oldest ``store_num`` are appended to a binary file of float64
+    values in a directory of "histlog", named after the time the first file of that
+    execution was written. Individual files are named after the class name and hash id
+    of their Timeseries, and start with a small header holding the number of columns of
+    the values.
+
+    Historical values are read through a :class:`numpy.memmap` of the file, so that
+    retrieving a slice far back in history only touches the requested values.
 
     Args
     ----
     ts : :class:`~cryptle.metric.base.Timeseries`
         The ``Timeseries`` to be stored and retrievable during runtime
     store_num : int, optional
-        The number of values to be cached during runtime before writing to disk.
+        The number of values to be cached during runtime before writing to disk, None
+        for holding all the values in memory.
+
+    Attributes
+    ----------
+    path : :class:`pathlib.Path`
+        The history file, None until values are first written to disk.
 
     """
 
@@ -607,73 +1280,49 @@ class DiskTS(Metric):
         self._lookback = store_num
         self._cache = []
         self.value = None
-        self.flashed = False
-
-        # Setting up correct directory structure
-        current_time = datetime.datetime.now()
-        current_time_f = current_time.strftime("%Y-%m-%d %H:%M:%S")
-
-        histroot = Path('histlog')
-        subdirpath = histroot / current_time_f
+        self.path = None
+        self._stored = 0
+        self._columns = 0
+        self._map = None
 
-        # absolute pathing to the execution
-        dirpath = Path.cwd() / subdirpath
-        assert dirpath.is_absolute()
-
-        self.dir = dirpath
-        self.dirpaths = []
-
-        # Some leniency to let all files fall into same folder
-        for i in range(-3, 3):
-            diff_time = current_time + datetime.timedelta(seconds=i)
-            diff_time_f = diff_time.strftime("%Y-%m-%d %H:%M:%S")
-            subdirpath = histroot / diff_time_f
-            self.dirpaths.append(Path.cwd() / subdirpath)
+    def __len__(self):
+        return self._stored + len(self._cache)
 
     def cleanup(self):
+        """Write all the values held in memory to disk."""
         self.write(None)
+        del self._cache[:]
 
     def write(self, num_to_write):
-        """Write stored data to disk.
+        """Append the oldest values held in memory to the history file.
 
-        The behaviour of this function is that the filename changes accorind to the has
-        of the id of the Timeseries object to be written.
+        Args
+        ----
+        num_to_write : int
+            Number of values to be written, all the values held if None. The values are
+            not removed from memory.
 
         """
-        dpath = None
-        try:
-            if all([not Path.exists(dirpath) for dirpath in self.dirpaths]):
-                os.makedirs(self.dir)
-                dpath = self.dir
-            else:
-                for dirpath in self.dirpaths:
-                    if Path.exists(dirpath):
-                        dpath = dirpath
-                        break
-        except Exception as e:
-            raise OSError(
-                "Error in creating the required directory for storing DiskTS values."
-            )
+        values = np.asarray(self._cache[:num_to_write], dtype=np.float64)
+        if not len(values):
+            return
 
-        filename = repr(self._ts) + '_' + str(hash(id(self._ts))) + ".csv"
-
-        if not self.flashed:
-            with open(dpath / filename, "w", newline="") as file:
-                file.write(
-                    "Beginning of new file: should record the running instance metainfo. \n"
-                )
-            self.flashed = True
+        if self.path is None:
+            self._columns = values.shape[1] if values.ndim > 1 else 0
+            filename = repr(self._ts) + '_' + str(hash(id(self._ts))) + ".bin"
+            self.path = _history_dir() / filename
+            with open(self.path, "wb") as file:
+                file.write(_HISTORY_HEADER.pack(_HISTORY_MAGIC, self._columns))
 
-        with open(dpath / filename, "a", newline="") as file:
-
-            wr = csv.writer(file)
-            wr.writerow(self._cache[:num_to_write])
+        with open(self.path, "ab") as file:
+            file.write(values.tobytes())
+        self._stored += len(values)
 
     @staticmethod
     def prune(self):
         """DiskTS class prune method. Write cache to disk and delete them from main
         memory."""
-        if 2 * self._lookback >= len(self._cache):
+        if self._lookback is None or 2 * self._lookback >= len(self._cache):
             return self._cache
         else:
             self.write(self._lookback)
@@ -688,100 +1337,71 @@ class DiskTS(Metric):
         else:
             pass
 
-    # Todo(MC): To make this more smart in getting the required values
-    @staticmethod
-    def readCSV(cache, filename):
-        """Helper function to return a list of usable values from pre-formatted csv
-        file.
-
-        Currently, this function non-selectively read the whole csv and reconstruct
-        a python list.  This is not the desired behaviour. It is designed to be only
-        retrieve a suitable and reasonable amount of data from disk via some
-        algorithm.
-
-        Args
-        ---
-        cache : list
-            Residual cache maintained on the fly
-        filename: string
-            Name of the csv file containing the stored data
-
-        Returns
-        -------
-        lst[index]: list
-            List of requested values.
-
-        """
-        lst = []
-        with open(filename, "r") as f:
-            reader = csv.reader(f, delimiter=",")
-            for i, row in enumerate(f):
-                if i == 0:
-                    pass
-                else:
-                    row = [float(x) for x in row.rstrip("\n").split(",")]
-                    lst += row
-            lst += cache
-        return lst
+    def _mapped(self):
+        """Return the values written to disk as a read-only memory-mapped array."""
+        if self._map is None or len(self._map) != self._stored:
+            if self._columns:
+                shape = (self._stored, self._columns)
+            else:
+                shape = (self._stored,)
+            self._map = np.memmap(
+                self.path,
+                dtype=np.float64,
+                mode="r",
+                offset=_HISTORY_HEADER.size,
+                shape=shape,
+            )
+        return self._map
 
     def __getitem__(self, index):
         """Get historical values.
 
+        Indices count from the first value ever recorded, like for a list holding all
+        of them. Values written to disk are read from the memory-mapped file, without
+        reading any other values.
+
         Args
         ----
-        index : slice
-            A slice object - could handle all valid item retrieval syntax.
+        index : int or slice
+            Any valid index or slice of a list, e.g. ``ts[-5000:-4000]``.
 
         Returns
         -------
-        lst[index]: list
-            List of requested values.
+        The requested value, or the requested values as a float64
+        :class:`numpy.ndarray` wherever they are held. Arrays are copies, which stay
+        valid after the file is appended to or removed.
 
         """
-        # only support this currently
-        # if index.end > 0 or index.start > 0:
-        #    return ValueError('The slice object input for referencing historical value should be by
-        #    negative integers (i.e. ts[-1000:-800] for the 200 values starting from 800 bars from
-        #    now)')
-
-        ## row counts from bottom to top (end to beginning)
-        # rowstart = abs(index.start % self._lookback)
-        # rowend   = abs(index.stop % self._lookback)
-        ## col counts from right to left (end to beginning)
-        # colstart = abs(index.start) - rowstart * self._lookback
-        # colend   = abs(index.end) - rowed * self._lookback
-
-        filename = repr(self._ts) + '_' + str(hash(id(self._ts))) + ".csv"
-        filepath = self.dir / filename
-
+        stored = self._stored
         if isinstance(index, slice):
-            try:
-                # for handling index cases with integer bounded intervals and steps i.e.
-                # [-4:-2]
-                if (
-                    abs(index.stop) < self._lookback
-                    and abs(index.start) < self._lookback
-                ):
-                    # if still within caching limit, retrieve from cache
-                    return self._cache[index]
-            except TypeError:
-                # for handling index cases without integer bounded intervals and steps
-                # i.e. [-2:]
-                if index.stop is None and abs(index.start) < self._lookback:
-                    # if still within caching limit, retrieve from cache
-                    return self._cache[index]
-                elif index.stop is None and abs(index.start) >= self._lookback:
-                    # if not within caching limit, retrieve from file
-                    lst = DiskTS.readCSV(self._cache, filepath)
-                    return lst[index]
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                values = [self[i] for i in range(start, stop, step)]
+            elif stop <= start:
+                values = []
+            elif start >= stored:
+                values = self._cache[start - stored : stop - stored]
+            elif stop <= stored:
+                return np.array(self._mapped()[start:stop])
             else:
-                lst = DiskTS.readCSV(self._cache, filepath)
-                return lst[index]
+                return np.concatenate(
+                    [
+                        self._mapped()[start:],
+                        np.asarray(self._cache[: stop - stored], dtype=np.float64),
+                    ]
+                )
+            values = np.array(values, dtype=np.float64)
+            if not len(values) and self._columns:
+                values = values.reshape(0, self._columns)
+            return values
 
         elif isinstance(index, int):
-            # for handling index cases with single intenger only
-            if abs(index) < self._lookback:
-                return self._cache[index]
-            else:
-                lst = DiskTS.readCSV(self._cache, filepath)
-                return lst[index]
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError('DiskTS index out of range')
+            if index >= stored:
+                return self._cache[index - stored]
+            return self._mapped()[index].tolist()
+
+        raise TypeError('DiskTS indices must be integers or slices')
@@ -0,0 +1,158 @@
+"""Batch evaluation of Timeseries graphs over whole input series.
+
+When the whole input series is known in advance, e.g. for precomputing indicators
+over historical candles, every Timeseries of a graph can compute its full column of
+values with NumPy in one call instead of processing the values one at a time. This
+module holds the bookkeeping of the columns of a graph, see
+:meth:`~cryptle.metric.base.Timeseries.evaluate_batch`, and the NumPy kernels shared
+by the Timeseries implementations.
+
+Columns are float arrays with one entry per update of the sources, holding NaN where
+the streaming value of the Timeseries would be None.
+"""
+import numpy as np
+from scipy.signal import lfilter
+
+
+class BatchColumns(dict):
+    """Mapping of the Timeseries of a graph to their columns, computed on first access.
+
+    The column of a Timeseries is computed by its ``_evaluate_batch`` method, which
+    accesses the columns of its publishers in turn. The graph upstream of any
+    Timeseries is thereby evaluated in topological order, every Timeseries exactly
+    once.
+
+    Args
+    ----
+    target : :class:`~cryptle.metric.base.Timeseries` or :class:`~cryptle.metric.base.MultivariateTS`
+        The Timeseries whose upstream graph is to be evaluated.
+    inputs : array-like or dict
+        Either a dict mapping source Timeseries to their columns, or a single column
+        if the graph upstream of the target has exactly one source.
+
+    """
+
+    def __init__(self, target, inputs):
+        super().__init__()
+        if not isinstance(inputs, dict):
+            roots = sources(target)
+            if len(roots) != 1:
+                raise ValueError(
+                    'Expected a dict of input columns for a graph with '
+                    '{} sources'.format(len(roots))
+                )
+            inputs = {roots[0]: inputs}
+
+        for ts, column in inputs.items():
+            self[ts] = np.asarray(column, dtype=float)
+
+        lengths = {len(column) for column in self.values()}
+        if len(lengths) > 1:
+            raise ValueError('Expected input columns of the same length')
+
+    def __missing__(self, ts):
+        column = ts._evaluate_batch(self)
+        self[ts] = column
+        return column
+
+
+def sources(target):
+    """Return the Timeseries without publishers upstream of the target, in order of
+    discovery."""
+    roots = []
+    seen = set()
+    stack = [target]
+    while stack:
+        ts = stack.pop()
+        if id(ts) in seen:
+            continue
+        seen.add(id(ts))
+        if ts.publishers:
+            stack.extend(reversed(ts.publishers))
+        elif ts is not target:
+            roots.append(ts)
+    return roots
+
+
+def along_valid(func, *columns):
+    """Apply a kernel to the updates of one or more upstream columns.
+
+    A Timeseries only caches the upstream values that are not None, and keeps its
+    value while the upstream has none. The kernel maps the valid rows of the columns,
+    i.e. those without NaN in any column, to output values of the same length. The
+    result is scattered back to the positions of the valid rows and carried forward
+    over the positions in between. Positions before the first valid row are NaN.
+
+    Args
+    ----
+    func : function
+        Kernel taking one compressed array per column.
+    *columns : array
+        Columns of the publishers, of the same length.
+
+    """
+    valid = np.ones(len(columns[0]), dtype=bool)
+    for column in columns:
+        valid &= ~np.isnan(column)
+
+    out = np.full(len(valid), np.nan)
+    out[valid] = func(*(column[valid] for column in columns))
+
+    # Index of the most recent valid row for every position
+    last = np.maximum.accumulate(np.where(valid, np.arange(len(valid)), 0))
+    return out[last] if len(out) else out
+
+
+def windows(values, lookback):
+    """Return the trailing window of every value as the rows of a read-only view.
+
+    The windows of the first ``lookback - 1`` values are partial and padded with NaN
+    at the front, so that NaN-aware reductions over the rows see the same values as
+    the cache of a Timeseries filling up.
+    """
+    padded = np.concatenate([np.full(lookback - 1, np.nan), values])
+    stride = padded.strides[0]
+    return np.lib.stride_tricks.as_strided(
+        padded, shape=(len(values), lookback), strides=(stride, stride), writeable=False
+    )
+
+
+def weighted_average(values, lookback, weights):
+    """Weighted average of every full window, NaN for the partial ones."""
+    weights = np.asarray(weights, dtype=float)
+    return windows(values, lookback) @ weights / weights.sum()
+
+
+def smoothing(values, weight, initial):
+    """Exponential smoothing ``y[i] = weight * values[i] + (1 - weight) * y[i - 1]``,
+    starting from ``y[-1] = initial``."""
+    if not len(values):
+        return np.empty(0)
+    out, _ = lfilter([weight], [1, weight - 1], values, zi=[(1 - weight) * initial])
+    return out
+
+
+def window_moments(values, lookback):
+    """Count, mean and second to fourth central moments of every trailing window.
+
+    Partial windows at the front hold fewer values, like the cache of a Timeseries
+    filling up.
+    """
+    w = windows(values, lookback)
+    count = np.sum(~np.isnan(w), axis=1)
+    with np.errstate(invalid='ignore'):
+        mean = np.nanmean(w, axis=1)
+    d = w - mean[:, None]
+    d2 = d * d
+    with np.errstate(invalid='ignore'):
+        m2 = np.nansum(d2, axis=1) / count
+        m3 = np.nansum(d2 * d, axis=1) / count
+        m4 = np.nansum(d2 * d2, axis=1) / count
+    return count, mean, m2, m3, m4
+
+
+def last_value(column):
+    """The value of a Timeseries after the last row of its column, None for NaN."""
+    if not len(column) or np.isnan(column[-1]):
+        return None
+    return float(column[-1])
@@ -1,4 +1,4 @@
-from .base import Metric, Candle
+from .base import Metric, CandleColumns
 from .generic import *
 
 import numpy as np
@@ -19,7 +19,7 @@ class CandleBar:
 
     Attributes:
         period (int): Length in seconds of each candlestick.
-        _bars (list): List of all the Candle objects.
+        _bars (CandleColumns): Columnar store of the candles.
         _metrics (list): Metrics that are attached to the CandleBar instance.
         _auto_prune (bool): Flag for auto-removal of historic candles.
         _maxsize (int): Maximum number of historic candles to keep around.
@@ -32,7 +32,7 @@ class CandleBar:
 
     def __init__(self, period, auto_prune=False, maxsize=500):
         self.period = period
-        self._bars = []
+        self._bars = CandleColumns(maxsize if auto_prune else None)
         self._metrics = []
         self._auto_prune = auto_prune
         self._maxsize = maxsize
@@ -66,8 +66,6 @@ class CandleBar:
 
         # No one uses it yet so removed for reducing overhead
         # self._broadcastTick(price, timestamp, volume, action)
-        # if self._auto_prune:
-        #    self.prune(self._maxsize)
 
     def pushCandle(self, o, c, h, l, t, v, nv):
         """Provides public interface for accepting aggregated candles."""
@@ -86,35 +84,34 @@ class CandleBar:
         self._metrics.append(metric)
 
     def prune(self, size):
-        try:
-            self._bars = self._bars[-size:]
-        except IndexError:
-            raise ("Empty CandleBar cannot be pruned")
+        self._bars.prune(size)
 
     def open_prices(self, num_candles):
-        return [x.open for x in self[-num_candles:]]
+        """Return a view of the open prices of the last candles."""
+        return self._bars.open[-num_candles:]
 
     def close_prices(self, num_candles):
-        return [x.close for x in self[-num_candles:]]
+        """Return a view of the close prices of the last candles."""
+        return self._bars.close[-num_candles:]
 
     def _is_updated(self, timestamp):
         return timestamp < self.last_bar_timestamp + self.period
 
     def _pushFullCandle(self, o, c, h, l, t, v, nv):
         t = t - t % self.period
-        self._bars.append(Candle(o, c, h, l, t, v, nv))
+        self._bars.append(o, c, h, l, t, v, nv)
         self._broadcastCandle()
 
     def _pushInitCandle(self, price, timestamp, volume, action):
         round_ts = timestamp - timestamp % self.period
         self._bars.append(
-            Candle(price, price, price, price, round_ts, volume, volume * action)
+            price, price, price, price, round_ts, volume, volume * action
         )
         self._broadcastCandle()
 
     def _pushEmptyCandle(self, price, timestamp):
         round_ts = timestamp - timestamp % self.period
-        self._bars.append(Candle(price, price, price, price, round_ts, 0, 0))
+        self._bars.append(price, price, price, price, round_ts, 0, 0)
         self._broadcastCandle()
 
     def _broadcastCandle(self):
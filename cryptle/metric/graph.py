@@ -0,0 +1,255 @@
+"""Compiled execution of Timeseries graphs.
+
+Updating a graph through :meth:`~cryptle.metric.base.Timeseries.broadcast` looks up
+the position of the publisher in each subscriber and tracks the readiness of every
+subscriber with a set, for every value of every node. A :class:`MetricGraph` walks
+the publisher-subscriber links once instead, and runs every source event as a single
+pass over a flat, topologically ordered plan of evaluate calls.
+"""
+import pickle
+
+from cryptle.metric.base import GenericTS, MultivariateTS
+from cryptle.metric.batch import BatchColumns
+
+import cryptle.logging as logging
+
+logger = logging.getLogger(__name__)
+
+
+class MetricGraph:
+    """Flat execution plan of the Timeseries downstream of some sources.
+
+    Every node of the graph is assigned an integer slot in topological order. A node
+    is run once all of its publishers have broadcasted since its last update, which
+    is tracked with a bitmask of its publishers per slot, and does not broadcast if
+    its evaluate returned 'NA', just like when updating through
+    :meth:`~cryptle.metric.base.Timeseries.processBroadcast`.
+
+    Siblings are run in the order they subscribed to their publisher, so that a
+    node reading the value of an earlier sibling, e.g. the bands of a
+    :class:`~cryptle.metric.timeseries.bollinger.BollingerBand` reading its width,
+    sees the same values as when updating through the cascade.
+
+    The plan is fixed at compilation, Timeseries declared afterwards are only
+    updated after calling :meth:`compile` again.
+
+    Args
+    ----
+    *sources : :class:`~cryptle.metric.base.Timeseries`
+        The Timeseries updated by a source event, in the order they are updated,
+        e.g. the buffers of a :class:`~cryptle.metric.timeseries.candle.CandleStick`.
+    inputs : iterable, optional
+        Timeseries outside the graph that nodes of the graph depend on, e.g. a
+        :class:`~cryptle.metric.timeseries.timestamp.Timestamp`. They are updated by
+        their own source events, which must come before the source event of the
+        graph, and are read at their current value on every :meth:`run`.
+
+    Attributes
+    ----------
+    nodes : list
+        The Timeseries of the graph in order of execution, indexed by slot.
+
+    """
+
+    def __init__(self, *sources, inputs=()):
+        self.sources = sources
+        self.inputs = tuple(inputs)
+        self.nodes = []
+        self._plan = []
+        self._pending = []
+        self._inputs = []
+        self.compile()
+
+    def __repr__(self):
+        return '<MetricGraph({} nodes)>'.format(len(self.nodes))
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def compile(self):
+        """Walk the graph and build the execution plan."""
+        self.nodes = self._order()
+        slots = {id(ts): slot for slot, ts in enumerate(self.nodes)}
+        sources = {id(ts) for ts in self.sources}
+        inputs = {id(ts) for ts in self.inputs}
+
+        for ts in self.nodes:
+            if id(ts) in sources:
+                continue
+            for publisher in ts.publishers:
+                if id(publisher) not in slots and id(publisher) not in inputs:
+                    raise ValueError(
+                        '{} depends on {} outside the graph, pass it as an '
+                        'input'.format(_describe(ts), _describe(publisher))
+                    )
+
+        self._plan = []
+        self._pending = []
+        for slot, ts in enumerate(self.nodes):
+            if id(ts) in sources:
+                full = 0
+            else:
+                full = (1 << len(ts.publishers)) - 1
+
+            # Same position lookup as Timeseries.broadcast, done once
+            fanout = []
+            for subscriber in ts.subscribers:
+                pos = [id(x) for x in subscriber.publishers].index(id(ts))
+                fanout.append((slots[id(subscriber)], 1 << pos))
+
+            # Carry over the publishers that already broadcasted through the cascade
+            pending = 0
+            for pos, publisher in enumerate(ts.publishers):
+                if publisher in ts.publishers_broadcasted:
+                    pending |= 1 << pos
+
+            self._plan.append((slot, full, _step(ts), tuple(fanout)))
+            self._pending.append(pending)
+
+        # Inputs broadcast through their own cascade, which never completes the nodes
+        # of the graph as the rest of their publishers do not broadcast
+        self._inputs = []
+        for ts in self.inputs:
+            for subscriber in ts.subscribers:
+                if id(subscriber) in slots:
+                    pos = [id(x) for x in subscriber.publishers].index(id(ts))
+                    self._inputs.append((slots[id(subscriber)], 1 << pos))
+
+        logger.debug('Compiled {} Timeseries into {}', len(self.nodes), self)
+
+    def run(self):
+        """Run a source event through the graph in a single pass."""
+        pending = self._pending
+        for subscriber, bit in self._inputs:
+            pending[subscriber] |= bit
+        for slot, full, step, fanout in self._plan:
+            if pending[slot] != full:
+                continue
+            pending[slot] = 0
+            if not step():
+                continue
+            for subscriber, bit in fanout:
+                pending[subscriber] |= bit
+
+    def warmup(self, inputs):
+        """Seed the state of every node from historical values of the sources.
+
+        The columns of the graph are computed by batch evaluation, see
+        :meth:`~cryptle.metric.base.Timeseries.evaluate_batch`, and every node takes
+        its caches, running averages and value from them in a single step. The graph
+        is left as if the historical values had been streamed through it, except for
+        the recorded history of the nodes, which is not seeded.
+
+        Args
+        ----
+        inputs : dict
+            Mapping of the sources of the graph to their columns of historical values.
+
+        """
+        columns = BatchColumns(None, inputs)
+        for ts in self.nodes:
+            ts._warmup(columns)
+            ts.publishers_broadcasted.clear()
+        self._pending = [0] * len(self.nodes)
+        logger.debug('Warmed up {}', self)
+
+    def snapshot(self):
+        """Return the internal state of every node as a compact binary snapshot.
+
+        The snapshot is to be taken between source events, and restored by
+        :meth:`restore` into a graph declared the same way, e.g. by a restarted
+        process or a forked worker, which then continues from the same state.
+        """
+        state = {
+            'nodes': [type(ts).__qualname__ for ts in self.nodes],
+            'states': [ts._getState() for ts in self.nodes],
+        }
+        return pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def restore(self, snapshot):
+        """Restore the internal state of every node from a :meth:`snapshot`.
+
+        Snapshots are unpickled, only restore trusted ones.
+
+        Raises
+        ------
+        ValueError
+            If the snapshot was taken of a graph of different Timeseries.
+
+        """
+        state = pickle.loads(snapshot)
+        nodes = [type(ts).__qualname__ for ts in self.nodes]
+        if state['nodes'] != nodes:
+            raise ValueError(
+                'Snapshot of a graph of {} nodes does not match {}'.format(
+                    len(state['nodes']), self
+                )
+            )
+        for ts, ts_state in zip(self.nodes, state['states']):
+            ts._setState(ts_state)
+        self._pending = [0] * len(self.nodes)
+        logger.debug('Restored {}', self)
+
+    def _order(self):
+        # Reverse postorder of a depth first search is a topological order. Visiting
+        # subscribers and sources in reverse makes it the subscription order for trees.
+        postorder = []
+        seen = set()
+
+        def visit(ts):
+            seen.add(id(ts))
+            for subscriber in reversed(ts.subscribers):
+                if id(subscriber) not in seen:
+                    visit(subscriber)
+            postorder.append(ts)
+
+        for source in reversed(self.sources):
+            if id(source) not in seen:
+                visit(source)
+        return postorder[::-1]
+
+
+def _describe(ts):
+    # The repr of a Timeseries is its value, name it by type and name instead
+    name = getattr(ts, 'name', None)
+    if isinstance(name, str) and name:
+        return '{}({!r})'.format(type(ts).__name__, name)
+    return type(ts).__name__
+
+
+def _step(ts):
+    """Return a function updating the Timeseries without broadcasting, which returns
+    whether the Timeseries would have broadcasted."""
+    if isinstance(ts, MultivariateTS):
+
+        def step():
+            ts.evaluate()
+            return True
+
+    elif isinstance(ts, GenericTS) and not ts.tocache:
+        # GenericTS.eval_without_cache broadcasts by itself
+        eval_func, args = ts.eval_func, ts.args
+
+        def step():
+            ts.value = eval_func(*args)
+            return True
+
+    elif ts.hxtimeseries is None:
+        evaluate = ts.evaluate
+
+        def step():
+            return evaluate() != 'NA'
+
+    else:
+        evaluate = ts.evaluate
+        record = ts.hxtimeseries.evaluate
+
+        def step():
+            string = evaluate()
+            if string == 'NA':
+                return False
+            if string != 'source':
+                record()
+            return True
+
+    return step
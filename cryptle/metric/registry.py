@@ -0,0 +1,91 @@
+"""Deduplication of identical Timeseries.
+
+Strategies often declare the same metric more than once, e.g. ``SMA(stick.c, 20)``
+for several signals, and every declaration would cache the upstream values and
+compute the same value on every update. A :class:`MetricRegistry` hash-conses the
+declarations instead: a metric is constructed once per distinct class, inputs and
+parameters, and later declarations get the existing node.
+"""
+import inspect
+
+from cryptle.metric.base import Metric, MultivariateTS
+
+import cryptle.logging as logging
+
+logger = logging.getLogger(__name__)
+
+
+class MetricRegistry:
+    """Registry returning the existing node for an identical declaration.
+
+    Inputs that are Timeseries, MultivariateTS or other metrics are compared by
+    identity, so the nodes of a graph declared through the registry are shared
+    bottom-up. Any other argument is compared by value, with lists, tuples and dicts
+    compared by their items; arguments must be hashable otherwise. Arguments are
+    matched to the parameters of the class first, so passing one by position, by
+    keyword or leaving it to its default declares the same node.
+
+    The registry holds on to the nodes and their arguments, and is meant to live as
+    long as the graph, e.g. as an attribute of a strategy.
+
+    Example
+    -------
+    >>> metrics = MetricRegistry()
+    >>> fast = metrics(SMA, stick.c, 20)
+    >>> metrics(SMA, stick.c, 20) is fast
+    True
+
+    """
+
+    def __init__(self):
+        self._nodes = {}
+
+    def __call__(self, cls, *args, **kwargs):
+        """Return the node of the class for the arguments, constructing it on the
+        first declaration."""
+        bound = inspect.signature(cls).bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (cls, tuple((k, _key(v)) for k, v in bound.arguments.items()))
+        try:
+            node, _, _ = self._nodes[key]
+        except KeyError:
+            node = cls(*args, **kwargs)
+            # The arguments are kept alive, ids of inputs must not be reused
+            self._nodes[key] = (node, args, kwargs)
+            logger.debug('Registered {}', repr(node))
+        else:
+            logger.debug('Reusing {}', repr(node))
+        return node
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __iter__(self):
+        for node, _, _ in self._nodes.values():
+            yield node
+
+    def __contains__(self, node):
+        return any(node is other for other in self)
+
+    def clear(self):
+        """Forget all nodes. The nodes stay subscribed to their inputs."""
+        self._nodes.clear()
+
+
+def _key(value):
+    """Return a hashable key of an argument, by identity for metric nodes."""
+    if isinstance(value, (Metric, MultivariateTS)):
+        return ('node', id(value))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_key(x) for x in value))
+    if isinstance(value, dict):
+        return ('dict', tuple(sorted((k, _key(v)) for k, v in value.items())))
+    try:
+        hash(value)
+    except TypeError:
+        raise TypeError(
+            'Cannot register a metric with the unhashable argument {}'.format(
+                repr(value)
+            )
+        )
+    return value
@@ -0,0 +1,350 @@
+"""Incremental estimators over the window of a :class:`~cryptle.metric.base.RingBuffer`.
+
+The estimators follow a ring buffer cache, usually the ``_cache`` of a Timeseries, and
+update their state in constant time from the value that entered and the value that
+left the window on each push. They fall back to an exact recomputation over the window
+whenever they missed a push, and every ``reanchor`` updates to discard accumulated
+floating point error.
+"""
+from bisect import bisect_left, insort
+from collections import deque
+
+import numpy as np
+
+
+class RollingEstimator:
+    """Base class handling the synchronisation with a ring buffer.
+
+    Subclasses implement :meth:`_reset` from a window of values, :meth:`_add` for a
+    value entering a window that is not full yet, and :meth:`_replace` for a value
+    entering a full window.
+
+    Args
+    ----
+    reanchor : int, optional
+        Number of incremental updates after which the state is recomputed from the
+        window. Defaults to 1000.
+
+    """
+
+    def __init__(self, reanchor=1000):
+        self.reanchor = reanchor
+        self._pushes = 0
+        self._since = 0
+
+    def update(self, buffer):
+        """Bring the estimator up to date with the buffer."""
+        delta = buffer.pushes - self._pushes
+        if delta == 0:
+            return
+        self._pushes = buffer.pushes
+
+        self._since += 1
+        if delta != 1 or self._since >= self.reanchor:
+            self._since = 0
+            self._reset(buffer.view)
+        elif buffer.evicted is None:
+            self._add(buffer.view[-1])
+        else:
+            self._replace(buffer.view[-1], buffer.evicted)
+
+    def _reset(self, window):
+        raise NotImplementedError
+
+    def _add(self, x):
+        raise NotImplementedError
+
+    def _replace(self, x, y):
+        raise NotImplementedError
+
+
+class RollingMoments(RollingEstimator):
+    """Welford style running mean and variance of a window.
+
+    Windows of rows, e.g. of a :class:`~cryptle.metric.base.RingBuffer` holding one
+    value per asset, are followed column by column.
+
+    Attributes
+    ----------
+    count : int
+        Number of values in the window.
+    mean : float or :class:`numpy.ndarray`
+        Mean of the window, NaN if the window is empty.
+
+    """
+
+    def __init__(self, reanchor=1000):
+        super().__init__(reanchor)
+        self.count = 0
+        self.mean = float('nan')
+        self._m2 = 0.0
+
+    @property
+    def total(self):
+        """Sum of the window."""
+        return self.mean * self.count if self.count else 0.0
+
+    def var(self, ddof=0):
+        """Variance of the window, with the same ``ddof`` convention as NumPy."""
+        if self.count - ddof <= 0:
+            return float('nan')
+        # Guard against tiny negative values from cancellation
+        return np.maximum(self._m2, 0.0) / (self.count - ddof)
+
+    def std(self, ddof=0):
+        """Standard deviation of the window, with the same ``ddof`` convention as NumPy."""
+        return np.sqrt(self.var(ddof))
+
+    def _reset(self, window):
+        self.count = len(window)
+        if self.count:
+            self.mean = np.mean(window, axis=0)
+            self._m2 = np.sum((window - self.mean) ** 2, axis=0)
+        else:
+            self.mean = float('nan')
+            self._m2 = 0.0
+
+    def _add(self, x):
+        self.count += 1
+        if self.count == 1:
+            # Rows are views into the buffer, which later pushes overwrite
+            self.mean = x.copy() if isinstance(x, np.ndarray) else x
+            self._m2 = 0.0
+            return
+        delta = x - self.mean
+        self.mean = self.mean + delta / self.count
+        self._m2 = self._m2 + delta * (x - self.mean)
+
+    def _replace(self, x, y):
+        mean = self.mean + (x - y) / self.count
+        self._m2 = self._m2 + (x - y) * (x - mean + y - self.mean)
+        self.mean = mean
+
+
+class RollingWMA(RollingEstimator):
+    """Linearly weighted moving average of a full window.
+
+    The most recent of the ``lookback`` values has a weight of ``lookback``, the oldest
+    a weight of 1, normalised to a sum of one. The value is None until the window is
+    full.
+
+    Args
+    ----
+    lookback : int
+        Length of the window.
+
+    """
+
+    def __init__(self, lookback, reanchor=1000):
+        super().__init__(reanchor)
+        self.lookback = lookback
+        self.value = None
+        self._norm = 2 / (lookback * (lookback + 1))
+        self._count = 0
+        self._numerator = 0.0
+        self._sum = 0.0
+
+    def _reset(self, window):
+        self._count = len(window)
+        weights = np.arange(1, self._count + 1)
+        self._numerator = np.tensordot(weights, window, axes=1)
+        self._sum = np.sum(window, axis=0)
+        self._evaluate()
+
+    def _add(self, x):
+        # While filling up, the newest value takes the next weight
+        self._count += 1
+        self._numerator = self._numerator + self._count * x
+        self._sum = self._sum + x
+        self._evaluate()
+
+    def _replace(self, x, y):
+        # Every weight drops by one, the oldest value falls to zero
+        self._numerator = self._numerator - self._sum + self.lookback * x
+        self._sum = self._sum - y + x
+        self._evaluate()
+
+    def _evaluate(self):
+        if self._count == self.lookback:
+            self.value = self._numerator * self._norm
+        else:
+            self.value = None
+
+
+class RollingPowerSums(RollingEstimator):
+    """Rolling sums of the first four powers of a window, for skewness and kurtosis.
+
+    The powers are taken of the values shifted by an anchor, the window mean at the
+    last recomputation, which keeps the cancellation in the central moments small.
+    :meth:`skew` and :meth:`kurtosis` follow :func:`scipy.stats.skew` and
+    :func:`scipy.stats.kurtosis`, including their bias correction and their NaN for
+    windows of (numerically) zero variance.
+
+    Args
+    ----
+    reanchor : int, optional
+        Number of incremental updates after which the sums and the anchor are
+        recomputed from the window. Defaults to 100, the fourth powers drift
+        faster than lower order sums.
+
+    """
+
+    def __init__(self, reanchor=100):
+        super().__init__(reanchor)
+        self.count = 0
+        self._anchor = 0.0
+        self._sums = [0.0, 0.0, 0.0, 0.0]
+
+    def moments(self):
+        """Return the mean and the second, third and fourth central moments."""
+        n = self.count
+        s1, s2, s3, s4 = (s / n for s in self._sums)
+        m2 = s2 - s1 ** 2
+        m3 = s3 - 3 * s1 * s2 + 2 * s1 ** 3
+        m4 = s4 - 4 * s1 * s3 + 6 * s1 ** 2 * s2 - 3 * s1 ** 4
+        return self._anchor + s1, max(m2, 0.0), m3, m4
+
+    def skew(self, bias=False):
+        """Sample skewness of the window."""
+        if not self.count:
+            return float('nan')
+        n = self.count
+        mean, m2, m3, _ = self.moments()
+        if self._isConstant(mean, m2):
+            return float('nan')
+        g1 = m3 / m2 ** 1.5
+        if not bias and n > 2:
+            return ((n - 1) * n) ** 0.5 / (n - 2) * g1
+        return g1
+
+    def kurtosis(self, bias=False):
+        """Sample excess (Fisher) kurtosis of the window."""
+        if not self.count:
+            return float('nan')
+        n = self.count
+        mean, m2, _, m4 = self.moments()
+        if self._isConstant(mean, m2):
+            return float('nan')
+        g2 = m4 / m2 ** 2
+        if not bias and n > 3:
+            return ((n ** 2 - 1) * g2 - 3 * (n - 1) ** 2) / ((n - 2) * (n - 3))
+        return g2 - 3
+
+    @staticmethod
+    def _isConstant(mean, m2):
+        return m2 <= (np.finfo(float).eps * mean) ** 2
+
+    def _reset(self, window):
+        self.count = len(window)
+        self._anchor = float(np.mean(window)) if self.count else 0.0
+        d = np.asarray(window, dtype=float) - self._anchor
+        d2 = d * d
+        self._sums = [d.sum(), d2.sum(), (d2 * d).sum(), (d2 * d2).sum()]
+
+    def _add(self, x):
+        if not self.count:
+            self._anchor = x
+        self.count += 1
+        self._accumulate(x - self._anchor, 1)
+
+    def _replace(self, x, y):
+        self._accumulate(x - self._anchor, 1)
+        self._accumulate(y - self._anchor, -1)
+
+    def _accumulate(self, d, sign):
+        d2 = d * d
+        sums = self._sums
+        sums[0] += sign * d
+        sums[1] += sign * d2
+        sums[2] += sign * d2 * d
+        sums[3] += sign * d2 * d2
+
+
+class RollingExtremum(RollingEstimator):
+    """Maximum or minimum of a window, by a monotonic deque.
+
+    The deque holds the values of the window that may still become the extremum,
+    i.e. those not dominated by a more recent value, from the extremum at the front to
+    the newest value at the back. Every value enters and leaves the deque once, an
+    update is amortised O(1). The value is None while the window is empty.
+
+    Args
+    ----
+    lookback : int
+        Length of the window.
+    maximum : bool, optional
+        Whether to track the maximum rather than the minimum, default True.
+
+    """
+
+    def __init__(self, lookback, maximum=True):
+        # Nothing accumulates, recompute on missed pushes only
+        super().__init__(reanchor=float('inf'))
+        self.lookback = lookback
+        self.value = None
+        self._sign = 1 if maximum else -1
+        self._deque = deque()
+
+    def _reset(self, window):
+        self._deque.clear()
+        first = self._pushes - len(window) + 1
+        for i, x in enumerate(window):
+            self._push(first + i, x)
+        self._evaluate()
+
+    def _add(self, x):
+        self._push(self._pushes, x)
+        self._evaluate()
+
+    def _replace(self, x, y):
+        self._push(self._pushes, x)
+        # Drop the index that left the window
+        if self._deque[0][0] <= self._pushes - self.lookback:
+            self._deque.popleft()
+        self._evaluate()
+
+    def _push(self, index, x):
+        dq, sign = self._deque, self._sign
+        while dq and sign * dq[-1][1] <= sign * x:
+            dq.pop()
+        dq.append((index, x))
+
+    def _evaluate(self):
+        self.value = self._deque[0][1] if self._deque else None
+
+
+class RollingOrderStatistics(RollingEstimator):
+    """Sorted copy of a window, for its quantiles.
+
+    Values are inserted and removed by bisection, so locating them is O(log n) and
+    moving the rest of the list is a single memmove.
+    """
+
+    def __init__(self):
+        super().__init__(reanchor=float('inf'))
+        self._sorted = []
+
+    def __len__(self):
+        return len(self._sorted)
+
+    def quantile(self, q):
+        """Quantile of the window, linearly interpolated like
+        :func:`numpy.quantile`. None if the window is empty."""
+        values = self._sorted
+        if not values:
+            return None
+        pos = q * (len(values) - 1)
+        lo = int(pos)
+        if lo + 1 == len(values):
+            return values[lo]
+        return values[lo] + (values[lo + 1] - values[lo]) * (pos - lo)
+
+    def _reset(self, window):
+        self._sorted = sorted(window)
+
+    def _add(self, x):
+        insort(self._sorted, x)
+
+    def _replace(self, x, y):
+        del self._sorted[bisect_left(self._sorted, y)]
+        insort(self._sorted, x)
@@ -1,4 +1,6 @@
 from cryptle.metric.base import MultivariateTS, GenericTS
+import cryptle.metric.base as base
+from cryptle.metric.batch import last_value, along_valid, smoothing
 import numpy as np
 
 import cryptle.logging as logging
@@ -28,31 +30,57 @@ class ATR(MultivariateTS):
         self.prev_value = None
 
         def true_range(atr):
-            if len(atr._cache) >= 3:
-                last_close = atr._cache[-3][0]
-                high = atr._cache[-2][1]
-                low = atr._cache[-2][2]
-
-            if atr.value is None and len(atr._cache) == atr._lookback:
-                return np.mean([x[1] for x in atr._cache]) - np.mean(
-                    [x[2] for x in atr._cache]
-                )
-            elif atr.value is not None:
-                t1 = float(high) - float(low)
-                t2 = abs(float(high) - float(last_close))
-                t3 = abs(float(low) - float(last_close))
-                return max(t1, t2, t3)
+            cache = atr._tr._cache
+            if atr.prev_value is None:
+                if len(cache) == atr._lookback:
+                    return np.mean([x[1] for x in cache]) - np.mean(
+                        [x[2] for x in cache]
+                    )
+                return None
+
+            last_close = cache[-2][0]
+            high = cache[-1][1]
+            low = cache[-1][2]
+            t1 = float(high) - float(low)
+            t2 = abs(float(high) - float(last_close))
+            t3 = abs(float(low) - float(last_close))
+            return max(t1, t2, t3)
 
         def value(atr):
-            try:
-                if atr.prev_value is None:
-                    return float(self._tr)
-                else:
-                    return (
-                        atr.prev_value * (self._lookback - 1) + float(self._tr)
-                    ) / self._lookback
-            except:
-                pass
+            if atr.prev_value is None:
+                atr.prev_value = float(atr._tr)
+            else:
+                atr.prev_value = (
+                    atr.prev_value * (atr._lookback - 1) + float(atr._tr)
+                ) / atr._lookback
+            return atr.prev_value
+
+        # Column counterparts of the functions above for batch evaluation
+        def true_range_batch(columns):
+            def true_range(close, high, low):
+                out = np.full(len(close), np.nan)
+                if len(close) < lookback:
+                    return out
+                out[lookback - 1] = high[:lookback].mean() - low[:lookback].mean()
+                last_close = close[lookback - 1 : -1]
+                high, low = high[lookback:], low[lookback:]
+                out[lookback:] = np.max(
+                    [high - low, np.abs(high - last_close), np.abs(low - last_close)],
+                    axis=0,
+                )
+                return out
+
+            return along_valid(
+                true_range, columns[candle.c], columns[candle.h], columns[candle.l]
+            )
+
+        def value_batch(columns):
+            def average(tr):
+                if not len(tr):
+                    return tr
+                return np.concatenate([tr[:1], smoothing(tr[1:], 1 / lookback, tr[0])])
+
+            return along_valid(average, columns[self._tr])
 
         self._tr = GenericTS(
             candle.c,
@@ -61,9 +89,14 @@ class ATR(MultivariateTS):
             lookback=lookback,
             eval_func=true_range,
             args=[self],
+            batch_func=true_range_batch,
         )  # tr is the true_range object to be passed into the "ATR" wrapper
         self.value = GenericTS(
-            self._tr, lookback=lookback, eval_func=value, args=[self]
+            self._tr,
+            lookback=lookback,
+            eval_func=value,
+            args=[self],
+            batch_func=value_batch,
         )
         logger.debug(
             'Obj:{}. Finished declaration of all Timeseries objects', type(self)
@@ -76,4 +109,8 @@ class ATR(MultivariateTS):
         logger.debug('Obj: {}. Initialized BollingerBand', type(self))
 
     def evaluate(self):
-        logger.debug('Obj: {} Calling evaluate in bollinger', type(self))
+        if base.TRACE:
+            logger.debug('Obj: {} Calling evaluate in bollinger', type(self))
+
+    def _warmup(self, columns):
+        self.prev_value = last_value(columns[self.value])
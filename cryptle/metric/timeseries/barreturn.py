@@ -1,6 +1,9 @@
 import cryptle.logging as logging
 
 from cryptle.metric.base import Timeseries, MemoryTS
+import cryptle.metric.base as base
+from cryptle.metric.batch import along_valid
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +19,8 @@ class BarReturn(Timeseries):
         Use all open values to compute the return.
     all_close: bool, optional
         Use all close values to compute the return.
+    history : str, optional
+        Recording of historical values, see :class:`~cryptle.metric.base.Timeseries`
 
     Note: Default setting with bar=1 means that the latest close and latest open would
     be used.  Whereas for all_open/all_close=True, bar=1 means that latest open/close
@@ -26,9 +31,18 @@ class BarReturn(Timeseries):
     def __repr__(self):
         return self.name
 
-    def __init__(self, o, c, bar=1, all_open=False, all_close=False, name='barreturn'):
+    def __init__(
+        self,
+        o,
+        c,
+        bar=1,
+        all_open=False,
+        all_close=False,
+        name='barreturn',
+        history=None,
+    ):
         self.name = name
-        super().__init__(o, c)
+        super().__init__(o, c, history=history)
         logger.debug('Obj:{}. Initialized the parent Timeseries of Return.', type(self))
         self._ts = o, c
         self.all_open = all_open
@@ -44,7 +58,8 @@ class BarReturn(Timeseries):
 
     @MemoryTS.cache('normal')
     def evaluate(self):
-        logger.debug('Obj: {}. Calling evalute in Return.', type(self))
+        if base.TRACE:
+            logger.debug('Obj: {}. Calling evalute in Return.', type(self))
         if len(self._cache) == self._lookback:
             # format of items in self._cache: [[open, close], [open, close], ...]
             if not self.all_open and not self.all_close:
@@ -59,3 +74,18 @@ class BarReturn(Timeseries):
                 self.value = (
                     self._cache[-1][1] - self._cache[-1 - (self._lookback - 1)][1]
                 )
+
+    def _evaluate_batch(self, columns):
+        def barreturn(o, c):
+            if self.all_open:
+                o, c = o, o
+            elif self.all_close:
+                o, c = c, c
+            out = np.full(len(o), np.nan)
+            shift = self._lookback - 1
+            if len(o) > shift:
+                out[shift:] = c[shift:] - o[: len(o) - shift]
+            return out
+
+        o, c = self._ts
+        return along_valid(barreturn, columns[o], columns[c])
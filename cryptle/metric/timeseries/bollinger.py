@@ -1,4 +1,7 @@
 from cryptle.metric.base import Timeseries, GenericTS, MultivariateTS
+import cryptle.metric.base as base
+from cryptle.metric.rolling import RollingMoments
+from cryptle.metric.batch import along_valid, windows
 import numpy as np
 import cryptle.logging as logging
 
@@ -54,26 +57,71 @@ class BollingerBand(MultivariateTS):
         else:
             lowersd = lower_sd
 
+        # The bands share the cache of the width, and thereby a single estimator
+        self._moments = RollingMoments()
+
         def width(bb):
-            return np.std(bb.width._cache, ddof=0)
+            bb._moments.update(bb.width._cache)
+            return bb._moments.std()
 
         def upperband(bb):
-            return sum(bb.upperband._cache) / lookback + uppersd * float(bb.width)
+            return bb._moments.total / lookback + uppersd * float(bb.width)
 
         def lowerband(bb):
-            return sum(bb.lowerband._cache) / lookback - lowersd * float(bb.width)
+            return bb._moments.total / lookback - lowersd * float(bb.width)
 
         def value(bb):
             return (bb.upperband / bb.lowerband - 1) * 100
 
-        self.width = GenericTS(ts, lookback=lookback, eval_func=width, args=[self])
+        # Column counterparts of the functions above for batch evaluation
+        def width_batch(columns):
+            return along_valid(
+                lambda x: np.nanstd(windows(x, lookback), axis=1), columns[ts]
+            )
+
+        def band_batch(columns):
+            return along_valid(
+                lambda x: np.nansum(windows(x, lookback), axis=1) / lookback,
+                columns[ts],
+            )
+
+        def upperband_batch(columns):
+            return band_batch(columns) + uppersd * columns[self.width]
+
+        def lowerband_batch(columns):
+            return band_batch(columns) - lowersd * columns[self.width]
+
+        def value_batch(columns):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return (columns[self.upperband] / columns[self.lowerband] - 1) * 100
+
+        self.width = GenericTS(
+            ts, lookback=lookback, eval_func=width, args=[self], batch_func=width_batch
+        )
         self.upperband = GenericTS(
-            ts, lookback=lookback, eval_func=upperband, args=[self]
+            ts,
+            lookback=lookback,
+            eval_func=upperband,
+            args=[self],
+            batch_func=upperband_batch,
+            cache_of=self.width,
         )
         self.lowerband = GenericTS(
-            ts, lookback=lookback, eval_func=lowerband, args=[self]
+            ts,
+            lookback=lookback,
+            eval_func=lowerband,
+            args=[self],
+            batch_func=lowerband_batch,
+            cache_of=self.width,
+        )
+        self.value = GenericTS(
+            ts,
+            lookback=lookback,
+            eval_func=value,
+            args=[self],
+            batch_func=value_batch,
+            cache_of=self.width,
         )
-        self.value = GenericTS(ts, lookback=lookback, eval_func=value, args=[self])
 
         # The MultivariateTS initialization must come ***AFTER** all the Timeseries-(derived)
         # objects in order to ensure proper updating
@@ -88,4 +136,5 @@ class BollingerBand(MultivariateTS):
         logger.debug('Obj: {}. Initialized BollingerBand', type(self))
 
     def evaluate(self):
-        logger.debug('Obj: {} Calling evaluate in bollinger', type(self))
+        if base.TRACE:
+            logger.debug('Obj: {} Calling evaluate in bollinger', type(self))
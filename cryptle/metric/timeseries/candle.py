@@ -1,4 +1,5 @@
-from cryptle.metric.base import Timeseries, GenericTS
+from cryptle.metric.base import Timeseries, GenericTS, Candle
+from cryptle.metric.graph import MetricGraph
 from cryptle.event import on, Bus
 
 """Candle-related Timeseries object.
@@ -13,6 +14,8 @@ calculating their own values.
 
 """
 
+import numpy as np
+
 import cryptle.logging as logging
 
 logger = logging.getLogger(__name__)
@@ -43,6 +46,10 @@ def cache(ts):
     return ts.value
 
 
+# Columns of the candles extracted by the default functions above
+_columns = {Open: 0, Close: 1, High: 2, Low: 3, Volume: 5}
+
+
 class CandleStick:
     """ Extracted wrapper function of the original CandleBar class """
 
@@ -108,6 +115,7 @@ class CandleStick:
             eval_func=cache,
             args=[self._o_buffer],
             tocache=True,
+            batch_func=lambda columns: columns[self._o_buffer],
         )
 
         self.c = GenericTS(
@@ -117,6 +125,7 @@ class CandleStick:
             eval_func=cache,
             args=[self._c_buffer],
             tocache=True,
+            batch_func=lambda columns: columns[self._c_buffer],
         )
 
         self.h = GenericTS(
@@ -126,6 +135,7 @@ class CandleStick:
             eval_func=cache,
             args=[self._h_buffer],
             tocache=True,
+            batch_func=lambda columns: columns[self._h_buffer],
         )
 
         self.l = GenericTS(
@@ -135,6 +145,7 @@ class CandleStick:
             eval_func=cache,
             args=[self._l_buffer],
             tocache=True,
+            batch_func=lambda columns: columns[self._l_buffer],
         )
 
         self.v = GenericTS(
@@ -144,8 +155,10 @@ class CandleStick:
             eval_func=cache,
             args=[self._v_buffer],
             tocache=True,
+            batch_func=lambda columns: columns[self._v_buffer],
         )
         self.bar = bar
+        self._graph = None
 
     # CandleStick has a unique :meth:`source` that makes itself a timeseries generating source
     # todo(MC): segregate abstraction layer appropriately
@@ -155,7 +168,113 @@ class CandleStick:
         self._ts.append(data)
         self.update()
 
+    def compile(self, *inputs):
+        """Compile the Timeseries downstream of the candle into a
+        :class:`~cryptle.metric.graph.MetricGraph` updating them in a single pass per
+        candle.
+
+        Should be called after all the Timeseries are declared, those declared later
+        are only updated after compiling again.
+
+        Args
+        ----
+        *inputs : :class:`~cryptle.metric.base.Timeseries`
+            Further sources the Timeseries depend on, e.g. a
+            :class:`~cryptle.metric.timeseries.timestamp.Timestamp`, updated by their
+            own events before each candle.
+
+        """
+        self._graph = MetricGraph(*self._buffers(), inputs=inputs)
+        return self._graph
+
+    def warmup(self, bars, inputs=None):
+        """Seed the Timeseries downstream of the candle with historical candles, as
+        if they had been pushed one by one, see
+        :meth:`~cryptle.metric.graph.MetricGraph.warmup`.
+
+        Should be called after all the Timeseries are declared, and before pushing the
+        candles that follow the historical ones.
+
+        Args
+        ----
+        bars : array-like
+            The historical candles in order, either as rows of the values pushed to
+            :meth:`source`, as :class:`~cryptle.metric.base.Candle` objects, or as a
+            structured array of :attr:`~cryptle.metric.base.Candle.dtype`.
+        inputs : dict, optional
+            Columns of historical values of further sources of the graph, e.g. a
+            :class:`~cryptle.metric.timeseries.timestamp.Timestamp`, one per candle.
+
+        """
+        bars = np.asarray(bars)
+        if not len(bars):
+            return
+        if bars.dtype.names:
+            bars = np.column_stack([bars[field] for field in Candle._fields])
+        bars = np.asarray(bars, dtype=float)
+
+        columns = dict(inputs or {})
+        buffers = self._buffers()
+        for buffer in buffers:
+            if buffer.eval_func in _columns:
+                columns[buffer] = bars[:, _columns[buffer.eval_func]]
+            else:
+                columns[buffer] = [buffer.eval_func([bar]) for bar in bars]
+
+        graph = self._stateGraph(inputs or ())
+        graph.warmup(columns)
+        self._resetGraph(graph)
+        self._ts.append(bars[-1].tolist())
+
+    def snapshot(self, *inputs):
+        """Return the internal state of the Timeseries downstream of the candle as a
+        compact binary snapshot, see :meth:`~cryptle.metric.graph.MetricGraph.snapshot`.
+
+        Args
+        ----
+        *inputs : :class:`~cryptle.metric.base.Timeseries`
+            Further sources the Timeseries depend on, as passed to :meth:`compile`,
+            default to those of the compiled graph.
+
+        """
+        return self._stateGraph(inputs).snapshot()
+
+    def restore(self, snapshot, *inputs):
+        """Restore the internal state of the Timeseries downstream of the candle from
+        a :meth:`snapshot` taken with the same inputs, see
+        :meth:`~cryptle.metric.graph.MetricGraph.restore`."""
+        graph = self._stateGraph(inputs)
+        graph.restore(snapshot)
+        self._resetGraph(graph)
+
+    def _stateGraph(self, inputs):
+        # Graph of every Timeseries with a state, the inputs and those downstream of
+        # them included. Only the compiled graph if any, without installing one
+        if not inputs and self._graph is not None:
+            if not self._graph.inputs:
+                return self._graph
+            inputs = self._graph.inputs
+        return MetricGraph(*self._buffers(), *inputs)
+
+    def _resetGraph(self, graph):
+        # Drop what the compiled graph had pending before the state was replaced
+        if self._graph is not None and graph is not self._graph:
+            self._graph.compile()
+
+    def _buffers(self):
+        return (
+            self._o_buffer,
+            self._c_buffer,
+            self._h_buffer,
+            self._l_buffer,
+            self._v_buffer,
+        )
+
     def update(self):
+        if self._graph is not None:
+            self._graph.run()
+            return
+
         # eval_func passed to GenericTS objects held within CandleStick
         self._o_buffer.evaluate()
         self._c_buffer.evaluate()
@@ -1,4 +1,6 @@
 from cryptle.metric.base import Timeseries, MemoryTS
+import cryptle.metric.base as base
+from cryptle.metric.batch import along_valid
 import numpy as np
 
 import cryptle.logging as logging
@@ -15,15 +17,17 @@ class Difference(Timeseries):
         The integer for specifying the n-difference needed, default is 1.
     name : str, optional
         To be used by :meth:`__repr__` method for debugging
+    history : str, optional
+        Recording of historical values, see :class:`~cryptle.metric.base.Timeseries`
 
     """
 
     def __repr__(self):
         return self.name
 
-    def __init__(self, ts, n=1, name='difference'):
+    def __init__(self, ts, n=1, name='difference', history=None):
         self.name = f'{name}_{n}diff'
-        super().__init__(ts)
+        super().__init__(ts, history=history)
         logger.debug(
             'Obj: {}. Initialized the parent Timeseries of Difference.', type(self)
         )
@@ -35,7 +39,16 @@ class Difference(Timeseries):
 
     @MemoryTS.cache('normal')
     def evaluate(self):
-        logger.debug('Obj {} Calling evaluate in Difference.', type(self))
+        if base.TRACE:
+            logger.debug('Obj {} Calling evaluate in Difference.', type(self))
         if len(self._cache) == self._lookback:
             output = np.diff(self._cache, self._n)
             self.value = output[-1]
+
+    def _evaluate_batch(self, columns):
+        def difference(x):
+            out = np.full(len(x), np.nan)
+            out[self._n :] = np.diff(x, self._n)
+            return out
+
+        return along_valid(difference, columns[self._ts])
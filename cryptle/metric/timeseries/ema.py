@@ -1,4 +1,6 @@
 from cryptle.metric.base import Timeseries
+import cryptle.metric.base as base
+from cryptle.metric.batch import along_valid, smoothing
 import cryptle.logging as logging
 
 logger = logging.getLogger(__name__)
@@ -19,15 +21,17 @@ class EMA(Timeseries):
         A function that returns a fraction (smaller than 1 in value)
     name : str, optional
         To be used by :meth:`__repr__` method for debugging
+    history : str, optional
+        Recording of historical values, see :class:`~cryptle.metric.base.Timeseries`
 
     """
 
     def __repr__(self):
         return self.name
 
-    def __init__(self, ts, lookback, name="ema", weight=default):
+    def __init__(self, ts, lookback, name="ema", weight=default, history=None):
         self.name = f'{name}{lookback}'
-        super().__init__(ts)
+        super().__init__(ts, history=history)
         logger.debug('Obj: {}. Initialized the parent Timeseries of EMA.', type(self))
         self._lookback = lookback
         self._weight = weight(
@@ -37,10 +41,17 @@ class EMA(Timeseries):
         self.value = None
 
     def evaluate(self):
-        logger.debug('Obj {} Calling evaluate in EMA.', type(self))
+        if base.TRACE:
+            logger.debug('Obj {} Calling evaluate in EMA.', type(self))
         if self.value is None:
             self.value = float(self._ts)
         else:
             self.value = (
                 float(self._ts) * self._weight + (1 - self._weight) * self.value
             )
+
+    def _evaluate_batch(self, columns):
+        return along_valid(
+            lambda x: smoothing(x, self._weight, x[0] if len(x) else 0.0),
+            columns[self._ts],
+        )
@@ -0,0 +1,87 @@
+from cryptle.metric.base import Timeseries, MemoryTS
+import cryptle.metric.base as base
+from cryptle.metric.batch import along_valid, windows
+from cryptle.metric.rolling import RollingExtremum
+import numpy as np
+
+import cryptle.logging as logging
+
+logger = logging.getLogger(__name__)
+
+
+class RollingMax(Timeseries):
+    """Timeseries for the maximum of the upstream over the lookback period, e.g. for
+    the upper line of a channel breakout.
+
+    Args
+    ----
+    lookback : int
+        The lookback period for the maximum.
+    name : str, optional
+        To be used by :meth:`__repr__` method for debugging
+    history : str, optional
+        Recording of historical values, see :class:`~cryptle.metric.base.Timeseries`
+
+    """
+
+    def __repr__(self):
+        return self.name
+
+    def __init__(self, ts, lookback, name='max', history=None):
+        self.name = f'{name}{lookback}'
+        super().__init__(ts, history=history)
+        self._lookback = lookback
+        self._ts = ts
+        self._cache = []
+        self._extremum = RollingExtremum(lookback, maximum=True)
+
+    @MemoryTS.cache('normal')
+    def evaluate(self):
+        if base.TRACE:
+            logger.debug('Obj {} Calling evaluate in RollingMax.', type(self))
+        self._extremum.update(self._cache)
+        self.value = self._extremum.value
+
+    def _evaluate_batch(self, columns):
+        return along_valid(
+            lambda x: np.nanmax(windows(x, self._lookback), axis=1), columns[self._ts]
+        )
+
+
+class RollingMin(Timeseries):
+    """Timeseries for the minimum of the upstream over the lookback period, e.g. for
+    the lower line of a channel breakout.
+
+    Args
+    ----
+    lookback : int
+        The lookback period for the minimum.
+    name : str, optional
+        To be used by :meth:`__repr__` method for debugging
+    history : str, optional
+        Recording of historical values, see :class:`~cryptle.metric.base.Timeseries`
+
+    """
+
+    def __repr__(self):
+        return self.name
+
+    def __init__(self, ts, lookback, name='min', history=None):
+        self.name = f'{name}{lookback}'
+        super().__init__(ts, history=history)
+        self._lookback = lookback
+        self._ts = ts
+        self._cache = []
+        self._extremum = RollingExtremum(lookback, maximum=False)
+
+    @MemoryTS.cache('normal')
+    def evaluate(self):
+        if base.TRACE:
+            logger.debug('Obj {} Calling evaluate in RollingMin.', type(self))
+        self._extremum.update(self._cache)
+        self.value = self._extremum.value
+
+    def _evaluate_batch(self, columns):
+        return along_valid(
+            lambda x: np.nanmin(windows(x, self._lookback), axis=1), columns[self._ts]
+        )
@@ -1,5 +1,8 @@
 from cryptle.metric.base import Timeseries, MemoryTS
-import scipy.stats as sp
+import cryptle.metric.base as base
+from cryptle.metric.rolling import RollingPowerSums
+from cryptle.metric.batch import along_valid, window_moments
+import numpy as np
 import cryptle.logging as logging
 
 logger = logging.getLogger(__name__)
@@ -14,25 +17,42 @@ class Kurtosis(Timeseries):
         The looback period for calculating the sampled kurtosis.
     name : str, optional
         To be used by :meth:`__repr__` method for debugging
+    history : str, optional
+        Recording of historical values, see :class:`~cryptle.metric.base.Timeseries`
 
-    Note: It is using the bias=False option of the scipy.stats.kurtosis function
+    Note: Matches the bias=False option of the scipy.stats.kurtosis function, updated in
+    constant time from rolling power sums
     """
 
     def __repr__(self):
         return self.name
 
-    def __init__(self, ts, lookback, name='kurtosis'):
+    def __init__(self, ts, lookback, name='kurtosis', history=None):
         self.name = f'{name}{lookback}'
-        super().__init__(ts)
+        super().__init__(ts, history=history)
         logger.debug(
             'Obj: {}. Initialized the parent Timeseries of Kurtosis.', type(self)
         )
         self._lookback = lookback
         self._ts = ts
         self._cache = []
+        self._sums = RollingPowerSums()
         self.value = None
 
     @MemoryTS.cache('normal')
     def evaluate(self):
-        logger.debug('Obj {} Calling evaluate in Kurtosis.', type(self))
-        self.value = sp.kurtosis(self._cache, bias=False)
+        if base.TRACE:
+            logger.debug('Obj {} Calling evaluate in Kurtosis.', type(self))
+        self._sums.update(self._cache)
+        self.value = self._sums.kurtosis(bias=False)
+
+    def _evaluate_batch(self, columns):
+        def kurtosis(x):
+            n, mean, m2, _, m4 = window_moments(x, self._lookback)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                g2 = m4 / m2 ** 2
+                unbiased = ((n ** 2 - 1) * g2 - 3 * (n - 1) ** 2) / ((n - 2) * (n - 3))
+            value = np.where(n > 3, unbiased, g2 - 3)
+            return np.where(RollingPowerSums._isConstant(mean, m2), np.nan, value)
+
+        return along_valid(kurtosis, columns[self._ts])
@@ -1,4 +1,7 @@
 from cryptle.metric.base import GenericTS, MultivariateTS
+import cryptle.metric.base as base
+from cryptle.metric.rolling import RollingWMA
+from cryptle.metric.batch import along_valid, weighted_average
 
 import cryptle.logging as logging
 import numpy as np
@@ -53,7 +56,13 @@ class MACD(MultivariateTS):
             except:
                 return None
 
+        # The default linear weights are maintained incrementally
+        self._rolling = RollingWMA(lookback) if weights is default else None
+
         def diff_ma(macd, weights, lookback):
+            if macd._rolling is not None:
+                macd._rolling.update(macd.diff_ma._cache)
+                return macd._rolling.value
             if len(macd.diff_ma._cache) == lookback:
                 return np.average(macd.diff_ma._cache, axis=0, weights=weights)
 
@@ -61,6 +70,19 @@ class MACD(MultivariateTS):
             if len(macd.diff_ma._cache) == lookback:
                 return macd.diff - macd.diff_ma
 
+        # Column counterparts of the functions above for batch evaluation
+        def diff_batch(columns):
+            return columns[fast] - columns[slow]
+
+        def diff_ma_batch(columns):
+            return along_valid(
+                lambda x: weighted_average(x, lookback, self._weights),
+                columns[self.diff],
+            )
+
+        def signal_batch(columns):
+            return columns[self.diff] - columns[self.diff_ma]
+
         self.diff = GenericTS(
             fast,
             slow,
@@ -69,6 +91,7 @@ class MACD(MultivariateTS):
             eval_func=diff,
             args=[fast, slow],
             tocache=False,
+            batch_func=diff_batch,
         )
         self.diff_ma = GenericTS(
             self.diff,
@@ -76,6 +99,7 @@ class MACD(MultivariateTS):
             lookback=lookback,
             eval_func=diff_ma,
             args=[self, self._weights, lookback],
+            batch_func=diff_ma_batch,
         )
 
         self.signal = GenericTS(
@@ -85,6 +109,7 @@ class MACD(MultivariateTS):
             lookback=lookback,
             eval_func=signal,
             args=[self],
+            batch_func=signal_batch,
         )
         logger.debug(
             'Obj: {}. Finished declaration of all Timeseries objects', type(self)
@@ -96,4 +121,5 @@ class MACD(MultivariateTS):
         logger.debug('Obj: {}. Initialized MACD', type(self))
 
     def evaluate(self):
-        logger.debug('Obj: {} Calling evaluate in MACD', type(self))
+        if base.TRACE:
+            logger.debug('Obj: {} Calling evaluate in MACD', type(self))
@@ -0,0 +1,292 @@
+"""Panel Timeseries tracking a whole universe of assets at once.
+
+A :class:`~cryptle.metric.timeseries.candle.CandleStick` and the Timeseries
+downstream of it track a single asset, so monitoring hundreds of pairs takes hundreds
+of object graphs and as many Python calls per candle. The panel Timeseries here hold
+the state of every asset in the columns of their NumPy arrays instead, and update all
+of them in a single vectorized call per cross-sectional bar, i.e. the candles of all
+the assets over the same period.
+
+The value of a panel Timeseries is an array with one entry per asset, in the order of
+the ``assets`` of the :class:`PanelStick`, and agrees with the value of the
+corresponding single asset Timeseries fed with the candles of that asset.
+"""
+from cryptle.metric.base import Timeseries, RingBuffer
+import cryptle.metric.base as base
+from cryptle.metric.graph import MetricGraph
+from cryptle.metric.rolling import RollingMoments, RollingWMA
+from cryptle.metric.timeseries import ema, rsi
+from cryptle.event import on
+import numpy as np
+
+import cryptle.logging as logging
+
+logger = logging.getLogger(__name__)
+
+
+class PanelColumn(Timeseries):
+    """Source Timeseries of one field of the cross-sectional bars of a
+    :class:`PanelStick`."""
+
+    def __repr__(self):
+        return self.name
+
+    def __init__(self, stick, index, name):
+        self.name = name
+        super().__init__()
+        self.assets = stick.assets
+        self._stick = stick
+        self._index = index
+
+    def evaluate(self):
+        if base.TRACE:
+            logger.debug('Obj {} Calling evaluate in PanelColumn.', type(self))
+        self.value = self._stick._bar[:, self._index]
+
+
+class PanelStick:
+    """Candles of a universe of assets, as the source of panel Timeseries.
+
+    Cross-sectional bars hold one candle per asset, as a row in the format of the
+    candles of a :class:`~cryptle.metric.timeseries.candle.CandleStick`, i.e.
+    ``[o, c, h, l, t, v]``. An asset without a candle in a bar, given as a row of NaN,
+    carries its previous candle forward. Every asset must have a candle in the first
+    bar.
+
+    Args
+    ----
+    assets : list
+        Names of the assets, in the order of the rows of the bars.
+    name : str, optional
+        To be used by :meth:`__repr__` method for debugging
+
+    Attributes
+    ----------
+    o, c, h, l, v : :class:`PanelColumn`
+        The open, close, high, low and volume of every asset.
+
+    Example
+    -------
+    >>> stick = PanelStick(['btcusd', 'ethusd', 'xrpusd'])
+    >>> rsi = PanelRSI(stick.c, 14)
+    >>> stick.source(bars)  # Array of 3 rows, one per asset
+    >>> rsi.value  # Array of 3 values, one per asset
+
+    """
+
+    def __repr__(self):
+        return self.name
+
+    def __init__(self, assets, name='panel'):
+        self.assets = list(assets)
+        self.name = name
+        self._bar = None
+        self._graph = None
+
+        self.o = PanelColumn(self, 0, 'open')
+        self.c = PanelColumn(self, 1, 'close')
+        self.h = PanelColumn(self, 2, 'high')
+        self.l = PanelColumn(self, 3, 'low')
+        self.v = PanelColumn(self, 5, 'volume')
+
+    def __len__(self):
+        return len(self.assets)
+
+    def index(self, asset):
+        """Position of the asset in the values of the panel Timeseries."""
+        return self.assets.index(asset)
+
+    @on('new_panel')
+    def source(self, bar):
+        bar = np.array(bar, dtype=float, ndmin=2)
+        if bar.shape[0] != len(self.assets):
+            raise ValueError(
+                'Expected a bar of {} assets, got {}'.format(
+                    len(self.assets), bar.shape[0]
+                )
+            )
+        if self._bar is not None and bar.shape == self._bar.shape:
+            bar = np.where(np.isnan(bar), self._bar, bar)
+        self._bar = bar
+        self.update()
+
+    def compile(self):
+        """Compile the panel Timeseries downstream of the stick into a
+        :class:`~cryptle.metric.graph.MetricGraph`, see
+        :meth:`~cryptle.metric.timeseries.candle.CandleStick.compile`."""
+        self._graph = MetricGraph(self.o, self.c, self.h, self.l, self.v)
+        return self._graph
+
+    def update(self):
+        if self._graph is not None:
+            self._graph.run()
+            return
+
+        for column in (self.o, self.c, self.h, self.l, self.v):
+            column.update()
+
+
+class PanelSMA(Timeseries):
+    """Simple moving average of every asset of a panel Timeseries.
+
+    Args
+    ----
+    lookback : int
+        The lookback period for calculating the SMA.
+    name : str, optional
+        To be used by :meth:`__repr__` method for debugging
+
+    """
+
+    def __repr__(self):
+        return self.name
+
+    def __init__(self, ts, lookback, name='panel_sma'):
+        self.name = f'{name}{lookback}'
+        super().__init__(ts)
+        self.assets = ts.assets
+        self._lookback = lookback
+        self._ts = ts
+        self._cache = RingBuffer(lookback)
+        self._moments = RollingMoments()
+
+    def evaluate(self):
+        if base.TRACE:
+            logger.debug('Obj {} Calling evaluate in PanelSMA.', type(self))
+        self._cache.append(self._ts.value)
+        self._moments.update(self._cache)
+        self.value = self._moments.mean
+
+
+class PanelWMA(Timeseries):
+    """Linearly weighted moving average of every asset of a panel Timeseries, None
+    until the window is full.
+
+    Args
+    ----
+    lookback : int
+        The lookback period for calculating the WMA.
+    name : str, optional
+        To be used by :meth:`__repr__` method for debugging
+
+    """
+
+    def __repr__(self):
+        return self.name
+
+    def __init__(self, ts, lookback, name='panel_wma'):
+        self.name = f'{name}{lookback}'
+        super().__init__(ts)
+        self.assets = ts.assets
+        self._lookback = lookback
+        self._ts = ts
+        self._cache = RingBuffer(lookback)
+        self._rolling = RollingWMA(lookback)
+
+    def evaluate(self):
+        if base.TRACE:
+            logger.debug('Obj {} Calling evaluate in PanelWMA.', type(self))
+        self._cache.append(self._ts.value)
+        self._rolling.update(self._cache)
+        if self._rolling.value is not None:
+            self.value = self._rolling.value
+
+
+class PanelEMA(Timeseries):
+    """Exponential moving average of every asset of a panel Timeseries.
+
+    Args
+    ----
+    lookback : int
+        The lookback period for calculating the EMA.
+    weight : function, optional
+        A function of the lookback returning the weight of the newest value, default
+        to be 2/(lookback + 1) like :class:`~cryptle.metric.timeseries.ema.EMA`.
+    name : str, optional
+        To be used by :meth:`__repr__` method for debugging
+
+    """
+
+    def __repr__(self):
+        return self.name
+
+    def __init__(self, ts, lookback, name='panel_ema', weight=ema.default):
+        self.name = f'{name}{lookback}'
+        super().__init__(ts)
+        self.assets = ts.assets
+        self._lookback = lookback
+        self._weight = weight(lookback)
+        self._ts = ts
+
+    def evaluate(self):
+        if base.TRACE:
+            logger.debug('Obj {} Calling evaluate in PanelEMA.', type(self))
+        if self.value is None:
+            self.value = np.array(self._ts.value, dtype=float)
+        else:
+            self.value = (
+                self._weight * self._ts.value + (1 - self._weight) * self.value
+            )
+
+
+class PanelRSI(Timeseries):
+    """Relative strength index of every asset of a panel Timeseries, None until
+    ``lookback`` moves are seen.
+
+    Args
+    ----
+    lookback : int
+        The lookback period for calculating RSI.
+    weight : function, optional
+        A function of the lookback returning the weight of the newest move in the
+        average gain and loss, default to be 1/lookback like
+        :class:`~cryptle.metric.timeseries.rsi.RSI`.
+    name : str, optional
+        To be used by :meth:`__repr__` method for debugging
+
+    """
+
+    def __repr__(self):
+        return self.name
+
+    def __init__(self, ts, lookback, name='panel_rsi', weight=rsi.default):
+        self.name = f'{name}{lookback}'
+        super().__init__(ts)
+        self.assets = ts.assets
+        self._lookback = lookback
+        self._weight = weight(lookback)
+        self._ts = ts
+        self._last = None
+        self._moves = 0
+        self._ema_up = 0.0
+        self._ema_down = 0.0
+
+    def evaluate(self):
+        if base.TRACE:
+            logger.debug('Obj {} Calling evaluate in PanelRSI.', type(self))
+        x = np.array(self._ts.value, dtype=float)
+        last, self._last = self._last, x
+        if last is None:
+            return
+
+        move = x - last
+        up = np.where(move > 0, move, 0.0)
+        down = np.where(move > 0, 0.0, np.abs(move))
+        self._moves += 1
+
+        # The simple average of the first lookback moves, smoothed from then on
+        if self._moves <= self._lookback:
+            self._ema_up = self._ema_up + up / self._lookback
+            self._ema_down = self._ema_down + down / self._lookback
+            if self._moves < self._lookback:
+                return
+        else:
+            w = self._weight
+            self._ema_up = w * up + (1 - w) * self._ema_up
+            self._ema_down = w * down + (1 - w) * self._ema_down
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            value = 100 - 100 / (1 + self._ema_up / self._ema_down)
+        self.value = np.where(
+            self._ema_down == 0, np.where(self._ema_up == 0, 50.0, 100.0), value
+        )
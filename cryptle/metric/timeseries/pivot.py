@@ -1,4 +1,8 @@
 from cryptle.metric.base import Timeseries, MemoryTS
+from cryptle.metric.batch import along_valid
+import cryptle.metric.base as base
+from cryptle.metric.timeseries.extremum import RollingMax, RollingMin
+import numpy as np
 
 import cryptle.logging as logging
 
@@ -26,6 +30,8 @@ class PivotPoints(Timeseries):
         Number of support and resistnace levels to store, default to 8.
     name : str, optional
         To be used by :meth:`__repr__` method for debugging
+    history : str, optional
+        Recording of historical values, see :class:`~cryptle.metric.base.Timeseries`
 
     Attributes
     ----------
@@ -52,12 +58,20 @@ class PivotPoints(Timeseries):
         close,
         days=1,
         n=8,
-        list=False,
         name='pivot',
+        history=None,
     ):
         self.name = f'{name}{interval}'
-        self._ts = timestamp, close, high, low
-        super().__init__(*self._ts)
+
+        # the number of bars in a period
+        self._lookback = int((days * 24 * 60 * 60) / interval)
+
+        # the high and low of the period are maintained bar by bar
+        self._high = RollingMax(high, self._lookback)
+        self._low = RollingMin(low, self._lookback)
+
+        self._ts = timestamp, close, self._high, self._low
+        super().__init__(*self._ts, history=history)
         logger.debug(
             'Obj: {}. Initialized the parent Timeseries of PivotPoints.', type(self)
         )
@@ -66,9 +80,6 @@ class PivotPoints(Timeseries):
         self._days = days
         self._interval = interval
 
-        # the number of bars required to be cached
-        self._lookback = int((days * 24 * 60 * 60) / interval)
-
         # local attributes to be used in computation
         self._period_high, self._period_low, self._period_close = None, None, None
         self._timestamp = timestamp
@@ -81,37 +92,55 @@ class PivotPoints(Timeseries):
         self.cabins = self.s[::-1] + self.r[1:]
         self.value = self.pp
 
-        self._cache = []
-
-        if list:
-            self.onList()
-
-    @MemoryTS.cache('normal')
     def evaluate(self):
-        logger.debug('Obj {} Calling evaluate in PivotPoints.', type(self))
+        if base.TRACE:
+            logger.debug('Obj {} Calling evaluate in PivotPoints.', type(self))
         if self._timestamp % (24 * 60 * 60) == self._days * 86400 - self._interval:
-            # update the essential values of the previous period
-            self._period_high = max([i[2] for i in self._cache])
-            self._period_low = min([i[3] for i in self._cache])
-            self._period_close = self._cache[-1][1]
-
-            # calculate pivot point, support and resistance levels
-            self.pp = (self._period_high + self._period_low + self._period_close) / 3
-
-            self.r[0] = self.s[0] = self.pp
-            self.r[1] = self.pp + (self.pp - self._period_low)
-            self.s[1] = self.pp - (self._period_high - self.pp)
-
-            for i in range(2, self.n + 1):
-                self.r[i] = self.pp * (i - 1) + (
-                    self._period_high - (i - 1) * self._period_low
-                )
-                self.s[i] = self.pp * (i - 1) - (
-                    (i - 1) * self._period_high - self._period_low
-                )
+            self._levels(float(self._high), float(self._low), float(self._ts[1]))
 
         self.cabins = list(reversed(self.s)) + self.r[1:]
         self.value = self.pp
 
-    def onList(self):
-        pass
+    def _levels(self, high, low, close):
+        """Compute the levels from the high, low and close of the period."""
+        # update the essential values of the previous period
+        self._period_high = high
+        self._period_low = low
+        self._period_close = close
+
+        # calculate pivot point, support and resistance levels
+        self.pp = (self._period_high + self._period_low + self._period_close) / 3
+
+        self.r[0] = self.s[0] = self.pp
+        self.r[1] = self.pp + (self.pp - self._period_low)
+        self.s[1] = self.pp - (self._period_high - self.pp)
+
+        for i in range(2, self.n + 1):
+            self.r[i] = self.pp * (i - 1) + (
+                self._period_high - (i - 1) * self._period_low
+            )
+            self.s[i] = self.pp * (i - 1) - (
+                (i - 1) * self._period_high - self._period_low
+            )
+
+    def _evaluate_batch(self, columns):
+        def pivot(timestamp, close, high, low):
+            end = timestamp % (24 * 60 * 60) == self._days * 86400 - self._interval
+            pp = np.where(end, (high + low + close) / 3, np.nan)
+            # Hold the pivot point of the last completed period
+            last = np.maximum.accumulate(np.where(end, np.arange(len(end)), -1))
+            return np.where(last >= 0, pp[last], np.nan)
+
+        return along_valid(pivot, *(columns[ts] for ts in self._ts))
+
+    def _warmup(self, columns):
+        rows = MemoryTS.rows(self._ts, columns)
+
+        # Levels of the last period completed within the rows
+        end = rows[:, 0] % (24 * 60 * 60) == self._days * 86400 - self._interval
+        if end.any():
+            _, close, high, low = rows[np.flatnonzero(end)[-1]].tolist()
+            self._levels(high, low, close)
+
+        self.cabins = list(reversed(self.s)) + self.r[1:]
+        self.value = self.pp
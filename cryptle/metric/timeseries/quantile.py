@@ -0,0 +1,54 @@
+from cryptle.metric.base import Timeseries, MemoryTS
+import cryptle.metric.base as base
+from cryptle.metric.batch import along_valid, windows
+from cryptle.metric.rolling import RollingOrderStatistics
+import numpy as np
+
+import cryptle.logging as logging
+
+logger = logging.getLogger(__name__)
+
+
+class RollingQuantile(Timeseries):
+    """Timeseries for a quantile of the upstream over the lookback period, linearly
+    interpolated like :func:`numpy.quantile`.
+
+    Args
+    ----
+    lookback : int
+        The lookback period for the quantile.
+    q : float, optional
+        The quantile, between 0 and 1, default to 0.5 for the median.
+    name : str, optional
+        To be used by :meth:`__repr__` method for debugging
+    history : str, optional
+        Recording of historical values, see :class:`~cryptle.metric.base.Timeseries`
+
+    """
+
+    def __repr__(self):
+        return self.name
+
+    def __init__(self, ts, lookback, q=0.5, name='quantile', history=None):
+        if not 0 <= q <= 1:
+            raise ValueError('Expected a quantile between 0 and 1, got {}'.format(q))
+        self.name = f'{name}{lookback}'
+        super().__init__(ts, history=history)
+        self._lookback = lookback
+        self._q = q
+        self._ts = ts
+        self._cache = []
+        self._order = RollingOrderStatistics()
+
+    @MemoryTS.cache('normal')
+    def evaluate(self):
+        if base.TRACE:
+            logger.debug('Obj {} Calling evaluate in RollingQuantile.', type(self))
+        self._order.update(self._cache)
+        self.value = self._order.quantile(self._q)
+
+    def _evaluate_batch(self, columns):
+        return along_valid(
+            lambda x: np.nanquantile(windows(x, self._lookback), self._q, axis=1),
+            columns[self._ts],
+        )
@@ -1,4 +1,7 @@
 from cryptle.metric.base import Timeseries
+import cryptle.metric.base as base
+from cryptle.metric.batch import along_valid, smoothing
+import numpy as np
 
 import cryptle.logging as logging
 
@@ -20,6 +23,8 @@ class RSI(Timeseries):
         The weighing function for the EMA calculation, default to be 1/lookback.
     name : str, optional
         To be used by :meth:`__repr__` method for debugging
+    history : str, optional
+        Recording of historical values, see :class:`~cryptle.metric.base.Timeseries`
 
     Note: Complies with the TradingView value
 
@@ -28,9 +33,9 @@ class RSI(Timeseries):
     def __repr__(self):
         return self.name
 
-    def __init__(self, ts, lookback, name="rsi", weight=default):
+    def __init__(self, ts, lookback, name="rsi", weight=default, history=None):
         self.name = f'{name}{lookback}'
-        super().__init__(ts)
+        super().__init__(ts, history=history)
         logger.debug('Obj: {}. Initialized the parent Timeseries of RSI.', type(self))
         self._lookback = lookback
         self._ts = ts
@@ -42,7 +47,8 @@ class RSI(Timeseries):
         self._ema_down = None
 
     def evaluate(self):
-        logger.debug('Obj {} Calling evaluate in RSI.', type(self))
+        if base.TRACE:
+            logger.debug('Obj {} Calling evaluate in RSI.', type(self))
         self._cache.append(float(self._ts))
         if len(self._cache) < 2:
             return
@@ -99,3 +105,52 @@ class RSI(Timeseries):
                 self.value = 0
             elif self._ema_up == 0 and self._ema_down == 0:
                 self.value = 50
+
+    def _evaluate_batch(self, columns):
+        lookback = self._lookback
+
+        def rsi(x):
+            out = np.full(len(x), np.nan)
+            if len(x) <= lookback:
+                return out
+
+            ema_up, ema_down = self._averages(*self._moves(x))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                value = 100 - 100 / (1 + ema_up / ema_down)
+            out[lookback:] = np.where(
+                ema_down == 0, np.where(ema_up == 0, 50.0, 100.0), value
+            )
+            return out
+
+        return along_valid(rsi, columns[self._ts])
+
+    def _warmup(self, columns):
+        x = columns[self._ts]
+        x = x[~np.isnan(x)]
+        up, down = self._moves(x)
+        self._up = up[-self._lookback :].tolist()
+        self._down = down[-self._lookback :].tolist()
+        if len(up) < self._lookback:
+            self._cache = x.tolist()
+            self._ema_up = self._ema_down = None
+        else:
+            self._cache = x[-2:].tolist()
+            ema_up, ema_down = self._averages(up, down)
+            self._ema_up, self._ema_down = float(ema_up[-1]), float(ema_down[-1])
+        super()._warmup(columns)
+
+    @staticmethod
+    def _moves(x):
+        """Gains and losses between consecutive values."""
+        move = np.diff(x)
+        return np.where(move > 0, move, 0.0), np.where(move > 0, 0.0, np.abs(move))
+
+    def _averages(self, up, down):
+        """Average gain and loss from the lookback-th move on: the simple average of
+        the first lookback moves, smoothed from then on."""
+        averages = []
+        for moves in (up, down):
+            initial = moves[: self._lookback].mean()
+            smoothed = smoothing(moves[self._lookback :], self._weight, initial)
+            averages.append(np.concatenate([[initial], smoothed]))
+        return averages
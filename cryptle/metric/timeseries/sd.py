@@ -1,4 +1,7 @@
 from cryptle.metric.base import Timeseries, MemoryTS
+import cryptle.metric.base as base
+from cryptle.metric.rolling import RollingMoments
+from cryptle.metric.batch import along_valid, window_moments
 import numpy as np
 
 import cryptle.logging as logging
@@ -15,28 +18,44 @@ class SD(Timeseries):
         The lookback period for sampling and calculating the standard deviation.
     name : str, optional
         To be used by :meth:`__repr__` method for debugging
+    history : str, optional
+        Recording of historical values, see :class:`~cryptle.metric.base.Timeseries`
 
     """
 
     def __repr__(self):
         return self.name
 
-    def __init__(self, ts, lookback, name='sd'):
+    def __init__(self, ts, lookback, name='sd', history=None):
         self.name = f'{name}{lookback}'
-        super().__init__(ts)
+        super().__init__(ts, history=history)
         logger.debug('Obj: {}. Initialized the parent Timeseries of SD.', type(self))
         self._lookback = lookback
         self._ts = ts
         self.value = 0
         self._cache = []
+        self._moments = RollingMoments()
 
     @MemoryTS.cache('normal')
     def evaluate(self):
-        logger.debug('Obj {} Calling evaluate in SD.', type(self))
-        calc = self._cache[:]
-        if np.std(calc) > 0.001 * np.average(
-            calc
-        ):  # SHOULD SET TO A FRACTION OF THE MEAN VALUE OF THE SERIES
-            self.value = 1 / np.std(calc, ddof=1)
+        if base.TRACE:
+            logger.debug('Obj {} Calling evaluate in SD.', type(self))
+        moments = self._moments
+        moments.update(self._cache)
+        if moments.std() > 0.001 * moments.mean:
+            # SHOULD SET TO A FRACTION OF THE MEAN VALUE OF THE SERIES
+            self.value = 1 / moments.std(ddof=1)
         else:
-            self.value = (float(self._ts) - np.average(calc)) / 0.001 * np.average(calc)
+            self.value = (float(self._ts) - moments.mean) / 0.001 * moments.mean
+
+    def _evaluate_batch(self, columns):
+        def sd(x):
+            count, mean, m2, _, _ = window_moments(x, self._lookback)
+            std = np.sqrt(m2)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                sample = np.sqrt(m2 * count / (count - 1))
+                return np.where(
+                    std > 0.001 * mean, 1 / sample, (x - mean) / 0.001 * mean
+                )
+
+        return along_valid(sd, columns[self._ts])
@@ -1,5 +1,8 @@
 from cryptle.metric.base import Timeseries, MemoryTS
-import scipy.stats as sp
+import cryptle.metric.base as base
+from cryptle.metric.rolling import RollingPowerSums
+from cryptle.metric.batch import along_valid, window_moments
+import numpy as np
 
 import cryptle.logging as logging
 
@@ -15,23 +18,41 @@ class Skewness(Timeseries):
         The lookback period for sampling upstream timeseries values.
     name : str, optional
         To be used by :meth:`__repr__` method for debugging
+    history : str, optional
+        Recording of historical values, see :class:`~cryptle.metric.base.Timeseries`
 
+    Note: Matches the bias=False option of the scipy.stats.skew function, updated in
+    constant time from rolling power sums
     """
 
     def __repr__(self):
         return self.name
 
-    def __init__(self, ts, lookback, name='skewness'):
+    def __init__(self, ts, lookback, name='skewness', history=None):
         self.name = f'{name}{lookback}'
-        super().__init__(ts)
+        super().__init__(ts, history=history)
         logger.debug(
             'Obj: {}. Initialized the parent Timeseries of Skewness.', type(self)
         )
         self._lookback = lookback
         self._ts = ts
         self._cache = []
+        self._sums = RollingPowerSums()
 
     @MemoryTS.cache('normal')
     def evaluate(self):
-        logger.debug('Obj {} Calling evaluate in WMA.', type(self))
-        self.value = sp.skew(self._cache, bias=False)
+        if base.TRACE:
+            logger.debug('Obj {} Calling evaluate in WMA.', type(self))
+        self._sums.update(self._cache)
+        self.value = self._sums.skew(bias=False)
+
+    def _evaluate_batch(self, columns):
+        def skew(x):
+            n, mean, m2, m3, _ = window_moments(x, self._lookback)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                g1 = m3 / m2 ** 1.5
+                unbiased = np.sqrt((n - 1) * n) / (n - 2) * g1
+            value = np.where(n > 2, unbiased, g1)
+            return np.where(RollingPowerSums._isConstant(mean, m2), np.nan, value)
+
+        return along_valid(skew, columns[self._ts])
@@ -1,4 +1,7 @@
 from cryptle.metric.base import Timeseries, MemoryTS
+import cryptle.metric.base as base
+from cryptle.metric.batch import along_valid, windows
+from cryptle.metric.rolling import RollingMoments
 import numpy as np
 
 import cryptle.logging as logging
@@ -15,29 +18,33 @@ class SMA(Timeseries):
         The lookback period for calculating the SMA.
     name : str, optional
         To be used by :meth:`__repr__` method for debugging
+    history : str, optional
+        Recording of historical values, see :class:`~cryptle.metric.base.Timeseries`
     """
 
     def __repr__(self):
         return self.name
 
-    def __init__(self, ts, lookback, name="sma", list=False):
+    def __init__(self, ts, lookback, name="sma", history=None):
         self.name = f'{name}{lookback}'
-        super().__init__(ts)
+        super().__init__(ts, history=history)
         logger.debug('Obj: {}. Initialized the parent Timeseries of SMA.', type(self))
         self._lookback = lookback
         self._ts = ts
         self._cache = []
+        self._moments = RollingMoments()
         self.value = None
-        if list:
-            self.onList()
 
     # Any ts would call evaluate as new_candle emits. This updates its ts value for calculating the
     # correct value for output and further sourcing.
     @MemoryTS.cache('normal')
     def evaluate(self, candle=None):
-        logger.debug('Obj {} Calling evaluate in SMA.', type(self))
-        self.value = np.mean(self._cache)
-
-    def onList(self):
-        pass
-        # self.history = list(pd.DataFrame(self._ts).rolling(self._lookback).mean())
+        if base.TRACE:
+            logger.debug('Obj {} Calling evaluate in SMA.', type(self))
+        self._moments.update(self._cache)
+        self.value = self._moments.mean
+
+    def _evaluate_batch(self, columns):
+        return along_valid(
+            lambda x: np.nanmean(windows(x, self._lookback), axis=1), columns[self._ts]
+        )
@@ -9,9 +9,9 @@ logger = logging.getLogger(__name__)
 
 
 class Timestamp(Timeseries):
-    def __init__(self, lookback):
+    def __init__(self, lookback, history=None):
         self.name = 'timestamp'
-        super().__init__()
+        super().__init__(history=history)
         self._lookback = lookback
         self._ts = []
         self.value = None
@@ -1,4 +1,6 @@
 from cryptle.metric.base import Timeseries, MemoryTS
+import cryptle.metric.base as base
+from cryptle.metric.batch import along_valid, window_moments
 import numpy as np
 
 import cryptle.logging as logging
@@ -15,15 +17,17 @@ class Volatility(Timeseries):
         The lookback period for sampling and calculating the 1/sd.
     name : str, optional
         To be used by :meth:`__repr__` method for debugging
+    history : str, optional
+        Recording of historical values, see :class:`~cryptle.metric.base.Timeseries`
 
     """
 
     def __repr__(self):
         return self.name
 
-    def __init__(self, ts, lookback, name='volatility'):
+    def __init__(self, ts, lookback, name='volatility', history=None):
         self.name = f'{name}{lookback}'
-        super().__init__(ts)
+        super().__init__(ts, history=history)
         logger.debug(
             'Obj: {}. Initialized the parent Timeseries of Volatility.', type(self)
         )
@@ -32,9 +36,19 @@ class Volatility(Timeseries):
         self._cache = []
 
     @MemoryTS.cache('normal')
-    def evaluate(self, bar, candle):
-        logger.debug('Obj {} Calling evaluate in Volatility.', type(self))
+    def evaluate(self):
+        if base.TRACE:
+            logger.debug('Obj {} Calling evaluate in Volatility.', type(self))
         if np.std(self._cache) > 0:
             self.value = 1 / np.std(self._cache, ddof=1)
         else:
             self.value = 100
+
+    def _evaluate_batch(self, columns):
+        def volatility(x):
+            count, _, m2, _, _ = window_moments(x, self._lookback)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                sample = np.sqrt(m2 * count / (count - 1))
+                return np.where(np.sqrt(m2) > 0, 1 / sample, 100.0)
+
+        return along_valid(volatility, columns[self._ts])
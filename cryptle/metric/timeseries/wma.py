@@ -1,4 +1,7 @@
 from cryptle.metric.base import Timeseries, MemoryTS
+import cryptle.metric.base as base
+from cryptle.metric.batch import along_valid, weighted_average
+from cryptle.metric.rolling import RollingWMA
 import numpy as np
 
 import cryptle.logging as logging
@@ -16,6 +19,8 @@ class WMA(Timeseries):
     weights: list, optional
         A list of weighting to weigh the past historical values, default to TradingView's
         implementaion
+    history : str, optional
+        Recording of historical values, see :class:`~cryptle.metric.base.Timeseries`
 
     """
 
@@ -23,9 +28,9 @@ class WMA(Timeseries):
     def __repr__(self):
         return self.name
 
-    def __init__(self, ts, lookback, name="wma", weights=None):
+    def __init__(self, ts, lookback, name="wma", weights=None, history=None):
         self.name = f'{name}{lookback}'
-        super().__init__(ts)
+        super().__init__(ts, history=history)
         logger.debug('Obj: {}. Initialized the parent Timeseries of WMA.', type(self))
         self._lookback = lookback
         self._weights = weights or [
@@ -35,8 +40,22 @@ class WMA(Timeseries):
         self._cache = []
         self.value = None
 
+        # The default linear weights are maintained incrementally
+        self._rolling = RollingWMA(lookback) if weights is None else None
+
     @MemoryTS.cache('normal')
     def evaluate(self):
-        logger.debug('Obj {} Calling evaluate in WMA.', type(self))
-        if len(self._cache) == self._lookback:
+        if base.TRACE:
+            logger.debug('Obj {} Calling evaluate in WMA.', type(self))
+        if self._rolling is not None:
+            self._rolling.update(self._cache)
+            if self._rolling.value is not None:
+                self.value = self._rolling.value
+        elif len(self._cache) == self._lookback:
             self.value = np.average(self._cache, axis=0, weights=self._weights)
+
+    def _evaluate_batch(self, columns):
+        return along_valid(
+            lambda x: weighted_average(x, self._lookback, self._weights),
+            columns[self._ts],
+        )
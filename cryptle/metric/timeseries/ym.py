@@ -2,6 +2,8 @@ import cryptle.logging as logging
 import math
 
 from cryptle.metric.base import Timeseries, MemoryTS
+from cryptle.metric.batch import along_valid, windows
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -16,15 +18,17 @@ class YM(Timeseries):
         Default to lookback 6 bars.
     lookback: int, optional
         Number of bars to lookback for computing the value for YM.
+    history : str, optional
+        Recording of historical values, see :class:`~cryptle.metric.base.Timeseries`
 
     """
 
     def __repr__(self):
         return self.name
 
-    def __init__(self, r, lookback=6, name='ym'):
+    def __init__(self, r, lookback=6, name='ym', history=None):
         self.name = name
-        super().__init__(r)
+        super().__init__(r, history=history)
         logger.debug('Obj:{}. Initialized the parent Timeseries of YM.', type(self))
         self._ts = r
 
@@ -63,3 +67,19 @@ class YM(Timeseries):
                 val += sign
 
         self.value = val
+
+    def _evaluate_batch(self, columns):
+        def ym(x):
+            # The loop of evaluate over the columns of the windows, for all at once
+            prev_mo = np.zeros(len(x))
+            val = np.zeros(len(x))
+            for ret in windows(x, self._lookback).T:
+                sign = np.sign(ret)
+                same = (prev_mo != 0) & (np.sign(prev_mo) == sign)
+                grown = np.sign(prev_mo) * (np.abs(prev_mo) + 0.5)
+                prev_mo = np.where(same, grown, sign)
+                val += prev_mo
+            # Partial windows hold NaN, like the None value of evaluate
+            return val
+
+        return along_valid(ym, columns[self._ts])
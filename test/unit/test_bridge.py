@@ -0,0 +1,98 @@
+import os
+import stat
+import time
+
+import pytest
+
+from cryptle.bridge import BusBridge, encode, decode, _HEADER
+from cryptle.event import Bus
+
+
+def wait_for(predicate, timeout=2):
+    deadline = time.time() + timeout
+    while not predicate():
+        if time.time() > deadline:
+            raise TimeoutError
+        time.sleep(0.001)
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        [1.5, 1546300800, 0.25, True],
+        (1.0, 2.0, 3.0, 0.5, 1546300800.0, 10, -3.5),
+        {'price': 1.0},
+        [1, 'a'],
+        None,
+    ],
+)
+def test_codec_roundtrip(data):
+    frame = encode('tick', data)
+    kind, namelen, size = _HEADER.unpack(frame[: _HEADER.size])
+    event, decoded = decode(kind, frame[_HEADER.size :], namelen)
+    assert event == 'tick'
+    assert decoded == data
+    assert type(decoded) is type(data)
+
+
+def test_bridge_fanout(tmp_path):
+    path = str(tmp_path / 'bus.sock')
+    feed_bus = Bus()
+    feed = BusBridge(feed_bus, events=['tick'])
+    feed.listen(path)
+
+    strat_buses = [Bus() for _ in range(2)]
+    received = [[] for _ in strat_buses]
+    strats = []
+    for bus, recv in zip(strat_buses, received):
+        bus.addListener('tick', recv.append)
+        strat = BusBridge(bus, events=['order'])
+        strat.connect(path)
+        strats.append(strat)
+
+    orders = []
+    feed_bus.addListener('order', orders.append)
+    wait_for(lambda: feed.peers == 2)
+
+    for i in range(3):
+        feed_bus.emit('tick', [100.0 + i, i, 1.0, 1])
+    strat_buses[0].emit('order', {'side': 'buy'})
+
+    wait_for(lambda: all(len(r) == 3 for r in received) and orders)
+    assert received[0] == [[100.0 + i, i, 1.0, 1] for i in range(3)]
+    assert received[1] == received[0]
+    assert orders == [{'side': 'buy'}]
+
+    for strat in strats:
+        strat.close()
+    feed.close()
+
+
+def test_bridge_forwards_events_emitted_on_receipt(tmp_path):
+    path = str(tmp_path / 'bus.sock')
+    feed_bus = Bus()
+    feed = BusBridge(feed_bus, events=['tick'])
+    feed.listen(path)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+    strat_bus = Bus()
+    strat = BusBridge(strat_bus, events=['tick', 'order'])
+    strat.connect(path)
+
+    # A strategy ordering in response to a bridged tick
+    strat_bus.addListener('tick', lambda tick: strat_bus.emit('order', tick[0]))
+    ticks, orders = [], []
+    feed_bus.addListener('tick', ticks.append)
+    feed_bus.addListener('order', orders.append)
+    wait_for(lambda: feed.peers == 1)
+
+    feed_bus.emit('tick', [100.0, 1])
+    wait_for(lambda: orders)
+    assert orders == [100.0]
+
+    # The received tick is not echoed back to the feed
+    time.sleep(0.05)
+    assert ticks == [[100.0, 1]]
+
+    strat.close()
+    feed.close()
@@ -197,3 +197,478 @@ def test_multi_on(capsys):
     bus.emit('test2', None)
     captured = capsys.readouterr()
     assert captured.out == 'reached\nreached\n'
+
+
+def test_frozen_dispatch():
+    class Ticker:
+        def __init__(self):
+            self.received = []
+
+        @source('tick')
+        def tick(self, val):
+            return val
+
+        @on('tick')
+        def recv(self, data):
+            self.received.append(data)
+
+    ticker = Ticker()
+    bus = event.Bus()
+    bus.bind(ticker)
+    bus.freeze()
+    assert bus.frozen
+    assert bus._dispatch['tick'] == (ticker.recv,)
+
+    ticker.tick(1)
+    bus.emit('not_listened', None)
+
+    # listeners added after freezing are recompiled into the table
+    late = []
+    bus.addListener('tick', late.append)
+    ticker.tick(2)
+    assert ticker.received == [1, 2]
+    assert late == [2]
+
+    bus.unfreeze()
+    assert not bus.frozen
+    ticker.tick(3)
+    assert ticker.received == [1, 2, 3]
+
+
+def test_threaded_bus_is_reentrant():
+    bus = event.Bus(threaded=True)
+    received = []
+
+    @on('outer')
+    def outer(data):
+        bus.emit('inner', data + 1)
+
+    @on('inner')
+    def inner(data):
+        received.append(data)
+
+    bus.bind(outer)
+    bus.bind(inner)
+    bus.emit('outer', 1)
+    bus.freeze()
+    bus.emit('outer', 2)
+    assert received == [2, 3]
+
+
+def test_async_bus_preserves_event_order():
+    bus = event.AsyncBus(workers=2)
+    received = {'tick': [], 'trade': []}
+
+    @on('tick')
+    def on_tick(data):
+        received['tick'].append(data)
+
+    @on('trade')
+    def on_trade(data):
+        received['trade'].append(data)
+
+    bus.bind(on_tick)
+    bus.bind(on_trade)
+    for i in range(100):
+        bus.emit('tick', i)
+        bus.emit('trade', -i)
+    bus.close()
+
+    assert received['tick'] == list(range(100))
+    assert received['trade'] == [-i for i in range(100)]
+    with pytest.raises(event.BusClosed):
+        bus.emit('tick', 100)
+
+
+def test_async_bus_nested_emit_runs_on_worker():
+    bus = event.AsyncBus(maxsize=1)
+    received = []
+
+    @on('tick')
+    def aggregate(data):
+        bus.emit('candle', data * 2)
+
+    @on('candle')
+    def candle(data):
+        received.append(data)
+
+    bus.bind(aggregate)
+    bus.bind(candle)
+    bus.freeze()
+    for i in range(10):
+        bus.emit('tick', i)
+    bus.close()
+    assert received == [i * 2 for i in range(10)]
+
+
+@pytest.mark.parametrize('policy', [event.DROP_OLDEST, event.COALESCE])
+def test_async_bus_backpressure(policy):
+    import threading
+
+    bus = event.AsyncBus(maxsize=2, policy=policy)
+    gate = threading.Event()
+    received = []
+
+    @on('tick')
+    def slow(data):
+        gate.wait()
+        received.append(data)
+
+    bus.bind(slow)
+    bus.emit('tick', 0)
+    # wait for the worker to pick up the first event and block on the gate
+    while len(bus._queues[0]):
+        pass
+    for i in range(1, 6):
+        bus.emit('tick', i)
+    gate.set()
+    bus.close()
+
+    assert received[0] == 0
+    assert received[-1] == 5
+    if policy == event.DROP_OLDEST:
+        assert received == [0, 4, 5]
+        assert bus.dropped == 3
+    else:
+        assert received == [0, 5]
+
+
+def test_emit_batch_ordering():
+    received = []
+
+    @on('tick')
+    def first(data):
+        received.append(('first', data))
+
+    @on('tick')
+    def second(data):
+        received.append(('second', data))
+
+    @event.on_batch('tick')
+    def batch(chunk):
+        received.append(('batch', list(chunk)))
+
+    @on('tick')
+    def last(data):
+        received.append(('last', data))
+
+    bus = event.Bus()
+    for listener in (first, second, batch, last):
+        bus.bind(listener)
+    bus.emitBatch('tick', [1, 2])
+    assert received == [
+        ('first', 1),
+        ('second', 1),
+        ('first', 2),
+        ('second', 2),
+        ('batch', [1, 2]),
+        ('last', 1),
+        ('last', 2),
+    ]
+
+    # scalar emits reach batch listeners as a sequence of one
+    received.clear()
+    bus.freeze()
+    bus.emit('tick', 3)
+    assert received == [('first', 3), ('second', 3), ('batch', [3]), ('last', 3)]
+
+
+def test_emit_batch_bound_method():
+    class Sink:
+        def __init__(self):
+            self.chunks = []
+
+        @event.on_batch('tick')
+        def recv(self, chunk):
+            self.chunks.append(list(chunk))
+
+    sink = Sink()
+    bus = event.AsyncBus()
+    bus.bind(sink)
+    bus.emitBatch('tick', range(3))
+    bus.emit('tick', 3)
+    bus.close()
+    assert sink.chunks == [[0, 1, 2], [3]]
+
+
+def test_bus_profiler(tmp_path):
+    import csv
+    import json
+
+    bus = event.Bus()
+
+    @on('tick')
+    def aggregate(data):
+        bus.emit('candle', data)
+
+    @on('candle')
+    def indicator(data):
+        pass
+
+    bus.bind(aggregate)
+    bus.bind(indicator)
+    bus.emit('tick', 0)
+
+    profiler = bus.enableProfiling()
+    for i in range(10):
+        bus.emit('tick', i)
+    bus.freeze()
+    bus.emitBatch('tick', [10, 11])
+
+    stats = profiler.stats()
+    assert stats['events']['tick']['count'] == 11
+    assert stats['events']['tick']['max_depth'] == 1
+    assert stats['events']['candle']['count'] == 12
+    assert stats['events']['candle']['max_depth'] == 2
+    assert stats['listeners'][aggregate.__qualname__]['count'] == 12
+    assert stats['events']['tick']['p50'] <= stats['events']['tick']['p99']
+
+    profiler.dump(str(tmp_path / 'profile.json'))
+    with open(str(tmp_path / 'profile.json')) as f:
+        assert json.load(f) == stats
+    profiler.dump(str(tmp_path / 'profile.csv'))
+    with open(str(tmp_path / 'profile.csv')) as f:
+        rows = list(csv.DictReader(f))
+    assert {(row['kind'], row['name']) for row in rows} >= {
+        ('event', 'tick'),
+        ('listener', indicator.__qualname__),
+    }
+
+    assert bus.disableProfiling() is profiler
+    bus.emit('tick', 12)
+    assert profiler.stats()['events']['tick']['count'] == 11
+    assert bus.emit == bus._emitFrozen
+
+
+def test_conflate_latest_wins():
+    import time
+
+    bus = event.Bus(threaded=True)
+    received = []
+    bus.addListener('bookdiff', received.append)
+    bus.addListener('trades', received.append)
+    bus.conflate('bookdiff', 60)
+
+    for i in range(5):
+        bus.emit('bookdiff', i)
+    bus.emit('trades', 'trade')
+    assert received == [0, 'trade']
+
+    bus.flushConflated()
+    assert received == [0, 'trade', 4]
+
+    # pending data is delivered by the timer once the interval elapses
+    bus.conflate('bookdiff', 0.01)
+    bus.emitBatch('bookdiff', [5, 6, 7])
+    time.sleep(0.1)
+    assert received[3:] == [5, 7]
+
+    bus.deconflate('bookdiff')
+    bus.emit('bookdiff', 8)
+    bus.emit('bookdiff', 9)
+    assert received[5:] == [8, 9]
+
+
+def test_conflate_reducer():
+    bus = event.Bus()
+    received = []
+    bus.addListener('trades', received.append)
+    bus.conflate('trades', 60, reducer=lambda merged, data: merged + data)
+    bus.freeze()
+
+    for i in range(1, 5):
+        bus.emit('trades', [i])
+    bus.deconflate('trades')
+    assert received == [[1], [2, 3, 4]]
+
+
+def test_conflate_async_bus():
+    bus = event.AsyncBus()
+    received = []
+    bus.addListener('bookdiff', received.append)
+    bus.conflate('bookdiff', 60)
+    for i in range(5):
+        bus.emit('bookdiff', i)
+    bus.close()
+    assert received == [0, 4]
+
+
+def test_bind_skips_properties_and_caches_class():
+    class Ticker:
+        @property
+        def expensive(self):
+            raise AssertionError('properties must not be evaluated by bind')
+
+        @source('tick')
+        def tick(self, val):
+            return val
+
+        @on('tick')
+        def recv(self, data):
+            self.received.append(data)
+
+    class QuietTicker(Ticker):
+        # undecorated override is not a listener
+        def recv(self, data):
+            pass
+
+    ticker = Ticker()
+    ticker.received = []
+    bus = event.Bus()
+    bus.bind(ticker)
+    ticker.tick(1)
+    assert ticker.received == [1]
+    assert event._bindable_names[Ticker] == ('recv', 'tick')
+
+    bus.bind(QuietTicker())
+    assert event._bindable_names[QuietTicker] == ('tick',)
+    assert len(bus._callbacks['tick']) == 1
+
+
+def test_emitters_bind_per_instance():
+    class Ticker:
+        @source('tick')
+        def tick(self, val):
+            return val
+
+    a, b = Ticker(), Ticker()
+    bus_a, bus_b = event.Bus(), event.Bus()
+    bus_a.bind(a)
+    bus_b.bind(b)
+
+    received_a, received_b = [], []
+    bus_a.addListener('tick', received_a.append)
+    bus_b.addListener('tick', received_b.append)
+
+    a.tick(1)
+    b.tick(2)
+    assert received_a == [1]
+    assert received_b == [2]
+    assert a.tick is a.tick
+    assert a.tick.buses == [bus_a]
+    assert Ticker.tick.buses == []
+    assert a.tick.__func__ is Ticker.tick
+
+
+def test_remove_listener_and_unbind():
+    class Candle:
+        def __init__(self):
+            self.received = []
+
+        @source('candle')
+        def push(self, val):
+            return val
+
+        @on('tick')
+        def recv(self, data):
+            self.received.append(data)
+
+        @event.on_batch('trade')
+        def recvMany(self, chunk):
+            self.received.extend(chunk)
+
+    candle = Candle()
+    bus = event.Bus()
+    bus.bind(candle)
+    bus.freeze()
+
+    received = []
+    bus.addListener('tick', received.append)
+    bus.emit('tick', 1)
+    bus.removeListener('tick', received.append)
+    bus.emit('tick', 2)
+    assert received == [1]
+    with pytest.raises(ValueError):
+        bus.removeListener('tick', received.append)
+
+    bus.unbind(candle)
+    bus.emit('tick', 3)
+    bus.emitBatch('trade', [4])
+    assert candle.received == [1, 2]
+    assert candle.push.buses == []
+    assert 'tick' not in bus._callbacks
+    assert 'tick' not in bus._dispatch
+
+
+def test_weak_listeners_are_dropped():
+    import gc
+
+    class Metric:
+        def __init__(self, received):
+            self.received = received
+
+        @on('tick')
+        def recv(self, data):
+            self.received.append(data)
+
+    received = []
+    bus = event.Bus(weak=True)
+    metric = Metric(received)
+    bus.bind(metric)
+    bus.emit('tick', 1)
+
+    del metric
+    gc.collect()
+    bus.emit('tick', 2)
+    assert received == [1]
+    assert 'tick' not in bus._callbacks
+
+
+@pytest.mark.parametrize(
+    'pattern, name, match',
+    [
+        ('trades:*', 'trades:btcusd', True),
+        ('trades:*', 'trades:btcusd:1m', False),
+        ('trades:*', 'trades', False),
+        ('order:**', 'order:fill:paper', True),
+        ('order:**', 'order:fill', True),
+        ('order:**', 'orderbook:fill', False),
+        ('candles:*:1m', 'candles:ethusd:1m', True),
+        ('candles:btc*', 'candles:btcusd', True),
+    ],
+)
+def test_wildcard_pattern(pattern, name, match):
+    assert bool(event._compilePattern(pattern).match(name)) == match
+
+
+@pytest.mark.parametrize('frozen', [False, True])
+def test_wildcard_subscriptions(frozen):
+    class Monitor:
+        def __init__(self):
+            self.trades = []
+            self.orders = []
+
+        @on('trades:*')
+        def recvTrade(self, data):
+            self.trades.append(data)
+
+        @on('order:**')
+        def recvOrder(self, data):
+            self.orders.append(data)
+
+    bus = event.Bus()
+    exact = []
+    bus.addListener('trades:btcusd', exact.append)
+
+    monitor = Monitor()
+    bus.bind(monitor)
+    if frozen:
+        bus.freeze()
+
+    bus.emit('trades:btcusd', 1)
+    bus.emit('trades:ethusd', 2)
+    bus.emit('order:fill:paper', 3)
+    bus.emit('order', 4)
+    bus.emit('trades:ethusd', 5)
+    assert exact == [1]
+    assert monitor.trades == [1, 2, 5]
+    assert monitor.orders == [3]
+    # matched once, then routed through the concrete tables
+    assert 'trades:ethusd' in bus._resolved
+
+    bus.unbind(monitor)
+    bus.emit('trades:ethusd', 6)
+    bus.emit('order:cancel', 7)
+    assert monitor.trades == [1, 2, 5]
+    assert monitor.orders == [3]
+    assert exact == [1]
@@ -8,6 +8,7 @@ supported.
 
 import logging
 import inspect
+import tempfile
 from pathlib import Path
 
 import cryptle.logging
@@ -19,7 +20,9 @@ logger = cryptle.logging.getLogger('cryptle')
 
 logger.setLevel(logging.TICK)
 
-fh = cryptle.logging.FileHandler('logging.log', mode='w')
+# Keep the log file of the tests out of the working tree
+logdir = tempfile.mkdtemp()
+fh = cryptle.logging.FileHandler(str(Path(logdir) / 'logging.log'), mode='w')
 fh.setLevel(logging.TICK)
 
 sh = cryptle.logging.StreamHandler()
@@ -125,13 +128,13 @@ def test_formatters(caplog):
 
 
 # Test all configure root logger functionality
-def test_configure_root_logger(caplog):
+def test_configure_root_logger(caplog, tmp_path):
     hi = 'world'
     # By default no file and stream handler
     cryptle.logging.root.warning(f'abc {hi}')
 
     # After configuring, have file and stream handler
-    cryptle.logging.configure_root_logger('logging.log')
+    cryptle.logging.configure_root_logger(str(tmp_path / 'logging.log'))
     cryptle.logging.root.warning(f'abc {hi}')
 
     levels = ['WARNING', '[\x1b[33mWARNING\x1b[0m]']
@@ -5,6 +5,8 @@ import time
 import sys
 import traceback
 
+import numpy as np
+
 from cryptle.logging import *
 from cryptle.metric.base import *
 from cryptle.metric.candle import *
@@ -141,6 +143,70 @@ def test_candle():
     assert c.netvol == 0
 
 
+def test_candle_compact_and_columnar():
+    c = Candle(4, 7, 10, 3, 12316, 1, 1)
+    assert not hasattr(c, '__dict__')
+    assert c[1] == 7 and c[-1] == 1
+    assert c[:4] == [4, 7, 10, 3]
+    assert list(c) == [4, 7, 10, 3, 12316, 1, 1]
+
+    candles = [c, Candle(5, 6, 8, 2, 12317, 2, -2)]
+    array = Candle.toArray(candles)
+    assert array.dtype == Candle.dtype
+    assert array['close'].tolist() == [7, 6]
+    assert array['timestamp'].dtype == np.int64
+    assert Candle.toArray([Candle(1, 1, 1, 1, 0.5, 1, 1)])['timestamp'] == 0.5
+
+    rows = np.array([list(x) for x in candles])
+    for restored in (Candle.fromArray(array), Candle.fromArray(rows)):
+        assert [list(x) for x in restored] == [list(x) for x in candles]
+
+
+def test_candle_columns():
+    store = CandleColumns(capacity=2)
+    for i in range(5):
+        store.append(i, i + 1, i + 2, i - 1, 60 * i, 1, -1)
+    assert len(store) == 5
+    assert store.close.tolist() == [1, 2, 3, 4, 5]
+    assert np.shares_memory(store.close, store._data)
+
+    first = store[0]
+    store.prune(3)
+    assert len(store) == 3
+    assert store.open.tolist() == [2, 3, 4]
+
+    # Views stay valid over pruning and reallocation
+    last = store[-1]
+    for i in range(5, 12):
+        store.append(i, i + 1, i + 2, i - 1, 60 * i, 1, -1)
+    assert list(last) == [4, 5, 6, 3, 240, 1, -1]
+    last.close = 10
+    assert store.close[2] == 10
+    assert store[-1].timestamp == 660
+    assert store[1:3] and [x.open for x in store[1:3]] == [3, 4]
+    assert store.toArray()['open'].tolist() == list(range(2, 12))
+    assert store.timestamp.dtype == np.int64
+    assert isinstance(store[-1].timestamp, int) and store[-1]._bar[4] == 660
+    assert store.toArray().dtype == Candle.dtype
+
+    # Timestamps that are not integers make the timestamps float
+    store.append(12, 13, 14, 11, 720.5, 1, -1)
+    assert store.timestamp.dtype == np.float64
+    assert store.timestamp[-2:].tolist() == [660, 720.5]
+    assert store.toArray()['timestamp'][-1] == 720.5
+
+    bounded = CandleColumns(maxsize=3)
+    for i in range(10):
+        bounded.append(i, i, i, i, i, 0, 0)
+    assert bounded.open.tolist() == [7, 8, 9]
+
+    bar = CandleBar(10, auto_prune=True, maxsize=4)
+    for i, tick in enumerate(lin[:100]):
+        bar.pushTick(tick, i)
+    assert len(bar) == 4
+    assert bar.close_prices(2).tolist() == [x.close for x in bar[-2:]]
+
+
 def test_candelbar():
     bar = CandleBar(10)
     for i, tick in enumerate(const):
@@ -157,10 +223,10 @@ def test_candelbar():
         assert bar.last_close == tick
         assert bar.last_high == tick
 
-    assert isinstance(bar[-1].open, int)
-    assert isinstance(bar[-1].close, int)
-    assert isinstance(bar[-1].high, int)
-    assert isinstance(bar[-1].low, int)
+    assert isinstance(bar[-1].open, float)
+    assert isinstance(bar[-1].close, float)
+    assert isinstance(bar[-1].high, float)
+    assert isinstance(bar[-1].low, float)
     assert isinstance(bar[-1].timestamp, int)
     assert bar[-1].volume == 0
 
@@ -1,5 +1,5 @@
 from cryptle.logging import *
-from cryptle.metric.base import Candle, Timeseries, MemoryTS, MultivariateTS
+from cryptle.metric.base import Candle, Timeseries, MemoryTS, MultivariateTS, RingBuffer
 from cryptle.aggregator import Aggregator
 from cryptle.event import source, on, Bus
 from cryptle.metric.timeseries.atr import ATR
@@ -7,9 +7,11 @@ from cryptle.metric.timeseries.bollinger import BollingerBand
 from cryptle.metric.timeseries.candle import CandleStick
 from cryptle.metric.timeseries.difference import Difference
 from cryptle.metric.timeseries.ema import EMA
+from cryptle.metric.timeseries.extremum import RollingMax, RollingMin
 from cryptle.metric.timeseries.kurtosis import Kurtosis
 from cryptle.metric.timeseries.macd import MACD
 from cryptle.metric.timeseries.pivot import PivotPoints
+from cryptle.metric.timeseries.quantile import RollingQuantile
 from cryptle.metric.timeseries.barreturn import BarReturn
 from cryptle.metric.timeseries.rsi import RSI
 from cryptle.metric.timeseries.sd import SD
@@ -28,6 +30,8 @@ import traceback
 
 import pytest
 
+import numpy as np
+
 const = [3 for i in range(1, 100)]
 lin = [i for i in range(1, 100)]
 quad = [i ** 2 for i in range(1, 100)]
@@ -195,10 +199,10 @@ def test_diff(loop, bind):
 def test_TimeseriesWrapperRetrieval(bind):
     bus, stick = bind(1, 1)
 
-    diff = Difference(stick.o, 1)
+    diff = Difference(stick.o, 1, history='memory')
     pushAltQuad()
 
-    assert diff[-21:-19] == [750.8125, -770.3125]
+    np.testing.assert_array_equal(diff[-21:-19], [750.8125, -770.3125])
     assert diff[-9] == 1001.3125
     compare(diff, 1188.3125)
 
@@ -229,13 +233,17 @@ def test_MultivariateTSCache(bind):
     pushAltQuad()
 
     assert len(mock._cache) == 10
-    assert mock._cache[-1] == [
-        185.77678571428572,
-        -914.1845184202044,
-        1344.7345184202045,
-        -247.0966190440449,
-        564.7297592101022,
-    ]
+    # upstream metrics are incremental, agree with the batch computation up to rounding
+    assert mock._cache[-1] == pytest.approx(
+        [
+            185.77678571428572,
+            -914.1845184202044,
+            1344.7345184202045,
+            -247.0966190440449,
+            564.7297592101022,
+        ],
+        rel=1e-12,
+    )
 
 
 # @Deprecated - use Time event instead of a Timeseries where possible
@@ -272,3 +280,605 @@ def test_MultivariateTSCache(bind):
 #    assert pivot.pp -15687.9791666666667 < 1e-7
 #    assert pivot.r[2] - 108892.041666667 < 1e-7
 #    assert pivot.s[2] - -77516.083333333 < 1e-7
+
+
+def test_ring_buffer():
+    buf = RingBuffer(3)
+    for i in range(5):
+        buf.append(i)
+    assert len(buf) == 3
+    assert buf[-1] == 4
+    assert list(buf[:]) == [2, 3, 4]
+    assert buf.view.base is buf._array
+
+    rows = RingBuffer(2, [[1, 2], [3, 4], [5, 6]])
+    assert rows[-1] == [5, 6]
+    assert [row[0] for row in rows] == [3, 5]
+
+    # entries not fitting the established shape fall back to objects
+    rows.append([7, 8, 9])
+    assert rows[-1] == [7, 8, 9]
+    assert rows[0] == [5, 6]
+
+
+def test_memoryts_ring_buffer_cache(bind):
+    bus, stick = bind(1, 1)
+    sma = SMA(stick.o, 5)
+    pushAltQuad()
+
+    assert isinstance(sma._cache, RingBuffer)
+    assert list(sma._cache) == alt_quad[-6:-1]
+
+
+def test_rolling_estimators_match_batch():
+    from cryptle.metric.rolling import RollingMoments, RollingWMA
+
+    lookback = 7
+    buf = RingBuffer(lookback)
+    moments = RollingMoments(reanchor=50)
+    wma = RollingWMA(lookback, reanchor=50)
+    weights = [2 * (i + 1) / (lookback * (lookback + 1)) for i in range(lookback)]
+
+    for price in alt_quad_1k:
+        buf.append(price)
+        moments.update(buf)
+        wma.update(buf)
+
+        window = list(buf)
+        compare(moments.mean, np.mean(window), 1e-9)
+        compare(moments.std(), np.std(window), 1e-6)
+        if len(window) == lookback:
+            compare(wma.value, np.average(window, weights=weights), 1e-9)
+        else:
+            assert wma.value is None
+
+
+@pytest.mark.parametrize('lookback', [1, 4, 9])
+def test_rolling_order_estimators_match_numpy(lookback):
+    from cryptle.metric.rolling import RollingExtremum, RollingOrderStatistics
+
+    buf = RingBuffer(lookback)
+    high, low = RollingExtremum(lookback), RollingExtremum(lookback, maximum=False)
+    order = RollingOrderStatistics()
+    for i, price in enumerate(alt_quad + sine + const):
+        buf.append(price)
+        if i % 13 == 5:
+            # Missed pushes are recovered from the window
+            buf.append(-price)
+        high.update(buf)
+        low.update(buf)
+        order.update(buf)
+
+        window = np.array(buf)
+        assert high.value == window.max()
+        assert low.value == window.min()
+        assert len(order) == len(window)
+        for q in (0, 0.25, 0.5, 0.9, 1):
+            compare(order.quantile(q), np.quantile(window, q), 1e-9)
+
+
+@pytest.mark.parametrize('data', [alt_quad_1k, logistic, sine, const])
+def test_rolling_power_sums_match_scipy(data):
+    import scipy.stats as sp
+    from cryptle.metric.rolling import RollingPowerSums
+
+    buf = RingBuffer(10)
+    sums = RollingPowerSums(reanchor=25)
+    for price in data:
+        buf.append(price)
+        sums.update(buf)
+
+        window = np.array(buf)
+        if np.ptp(window) == 0:
+            assert math.isnan(sums.skew())
+            assert math.isnan(sums.kurtosis())
+            continue
+        compare(sums.skew(), sp.skew(window, bias=False), 1e-6)
+        compare(sums.kurtosis(), sp.kurtosis(window, bias=False), 1e-6)
+
+
+def _stream(stick, series, metrics):
+    """Push the series tick by tick, recording the opens and the values of the metrics."""
+    opens, values = [], {name: [] for name in metrics}
+    for i, price in enumerate(series):
+        pushTick([price, i, 0, 0])
+        opens.append(stick.o.value)
+        for name, ts in metrics.items():
+            values[name].append(math.nan if ts.value is None else float(ts.value))
+    return opens, values
+
+
+@pytest.mark.parametrize(
+    'make',
+    [
+        lambda o: SMA(o, 5),
+        lambda o: WMA(o, 5),
+        lambda o: EMA(o, 5),
+        lambda o: RSI(o, 5),
+        lambda o: Difference(o, 2),
+        lambda o: SMA(WMA(o, 5), 3),
+        lambda o: Difference(SMA(o, 4)),
+        lambda o: Volatility(o, 5),
+        lambda o: YM(o, 4),
+        lambda o: RollingMax(o, 5),
+        lambda o: RollingMin(o, 5),
+        lambda o: RollingQuantile(o, 5, 0.3),
+    ],
+)
+@pytest.mark.parametrize('series', [alt_quad, sine, const])
+def test_evaluate_batch_matches_streaming(bind, make, series):
+    bus, stick = bind(1, 1)
+    ts = make(stick.o)
+    opens, values = _stream(stick, series, {'ts': ts})
+
+    np.testing.assert_allclose(ts.evaluate_batch(opens), values['ts'], rtol=1e-9)
+    np.testing.assert_allclose(
+        ts.evaluate_batch({stick.o: opens}), values['ts'], rtol=1e-9
+    )
+
+
+def test_evaluate_batch_multivariate(bind):
+    bus, stick = bind(1, 1)
+    bollinger = BollingerBand(stick.o, 5)
+    macd = MACD(WMA(stick.o, 5), WMA(stick.o, 8), 3)
+    metrics = {
+        'width': bollinger.width,
+        'upperband': bollinger.upperband,
+        'lowerband': bollinger.lowerband,
+        'value': bollinger.value,
+        'diff': macd.diff,
+        'diff_ma': macd.diff_ma,
+        'signal': macd.signal,
+    }
+    opens, values = _stream(stick, alt_quad, metrics)
+
+    columns = bollinger.evaluate_batch(opens)
+    columns.update(macd.evaluate_batch(opens))
+    assert set(columns) == set(metrics)
+    for name in metrics:
+        np.testing.assert_allclose(columns[name], values[name], rtol=1e-9)
+
+
+def test_evaluate_batch_atr():
+    stick = CandleStick(1)
+    atr = ATR(stick, 5)
+
+    candles, values = [], []
+    for i, price in enumerate(sine):
+        bar = [price, price + 0.5 * math.cos(i), price + 1, price - 1, i, 1, 0]
+        stick.source(bar)
+        candles.append(bar)
+        values.append(math.nan if atr.value.value is None else atr.value.value)
+
+    closes, highs, lows = np.array(candles)[:, 1:4].T
+    columns = atr.evaluate_batch({stick.c: closes, stick.h: highs, stick.l: lows})
+    assert not np.isnan(values[-1])
+    np.testing.assert_allclose(columns['value'], values, rtol=1e-9)
+
+
+def test_evaluate_batch_errors(bind):
+    bus, stick = bind(1, 1)
+    with pytest.raises(ValueError):
+        ATR(stick, 5).evaluate_batch([1.0, 2.0])
+
+    class Plain(Timeseries):
+        def evaluate(self):
+            pass
+
+    with pytest.raises(NotImplementedError):
+        Plain(stick.o).evaluate_batch([1.0, 2.0])
+
+
+def _indicators(stick):
+    bollinger = BollingerBand(stick.o, 5)
+    macd = MACD(WMA(stick.c, 5), WMA(stick.c, 8), 3)
+    atr = ATR(stick, 5)
+    return {
+        'sma': SMA(stick.o, 5),
+        'ema': EMA(stick.c, 5),
+        'rsi': RSI(stick.c, 5),
+        'recursive': SMA(WMA(stick.o, 5), 3),
+        'diff': Difference(SD(stick.o, 5)),
+        'width': bollinger.width,
+        'upperband': bollinger.upperband,
+        'value': bollinger.value,
+        'signal': macd.signal,
+        'atr': atr.value,
+    }
+
+
+def test_metric_graph_matches_cascade():
+    streamed, compiled = CandleStick(1), CandleStick(1)
+    expected, actual = _indicators(streamed), _indicators(compiled)
+    graph = compiled.compile()
+    assert len(graph) > len(actual)
+
+    for i, price in enumerate(sine):
+        bar = [price, price + 0.5 * math.cos(i), price + 1, price - 1, i, 1, 0]
+        streamed.source(bar)
+        compiled.source(bar)
+        for name in expected:
+            np.testing.assert_equal(actual[name].value, expected[name].value, name)
+
+
+def test_metric_graph_rejects_outside_publishers():
+    stick, other = CandleStick(1), CandleStick(1)
+    SMA(stick.o, 3)
+    MACD(WMA(stick.o, 3), WMA(other.o, 5), 3)
+    with pytest.raises(ValueError):
+        stick.compile()
+
+    stick, timestamp = CandleStick(1), Timestamp(1)
+    PivotPoints(timestamp, 8640, stick.h, stick.l, stick.c)
+    with pytest.raises(ValueError, match=r"PivotPoints\('pivot8640'\) depends on"):
+        stick.compile()
+
+
+def test_metric_graph_with_inputs():
+    streamed, compiled = CandleStick(1), CandleStick(1)
+    streamed_time, compiled_time = Timestamp(1), Timestamp(1)
+    expected = {
+        'pivot': PivotPoints(streamed_time, 8640, streamed.h, streamed.l, streamed.c),
+        'time': SMA(streamed_time, 3),
+        'sma': SMA(streamed.c, 3),
+    }
+    actual = {
+        'pivot': PivotPoints(compiled_time, 8640, compiled.h, compiled.l, compiled.c),
+        'time': SMA(compiled_time, 3),
+        'sma': SMA(compiled.c, 3),
+    }
+    graph = compiled.compile(compiled_time)
+    outside = compiled_time, actual['time']
+    assert not any(ts is node for ts in outside for node in graph.nodes)
+
+    # Timestamps come before their candle, as pushed by the Aggregator
+    for i, price in enumerate(sine):
+        bar = [price, price + 0.5 * math.cos(i), price + 1, price - 1, i * 4320, 1, 0]
+        for stick, timestamp in ((streamed, streamed_time), (compiled, compiled_time)):
+            timestamp.source(bar[4])
+            stick.source(bar)
+        for name in expected:
+            np.testing.assert_equal(actual[name].value, expected[name].value, name)
+    assert actual['pivot'].pp is not None
+
+
+def test_metric_registry(bind):
+    from cryptle.metric.registry import MetricRegistry
+
+    bus, stick = bind(1, 1)
+    metrics = MetricRegistry()
+    sma = metrics(SMA, stick.o, 5)
+    assert metrics(SMA, stick.o, lookback=5) is sma
+    assert metrics(SMA, ts=stick.o, lookback=5, name='sma') is sma
+    assert metrics(SMA, stick.o, 5) is sma
+    assert metrics(SMA, stick.c, 5) is not sma
+    assert metrics(SMA, stick.o, 3) is not sma
+
+    recursive = metrics(SMA, metrics(WMA, stick.o, 5, weights=[1, 2, 3, 4, 5]), 3)
+    again = metrics(SMA, metrics(WMA, stick.o, 5, weights=[1, 2, 3, 4, 5]), 3)
+    assert again is recursive
+    assert sma in metrics and len(metrics) == 5
+    assert sum(ts is sma for ts in stick.o.subscribers) == 1
+
+    bollinger = metrics(BollingerBand, stick.o, 5)
+    assert metrics(BollingerBand, stick.o, 5) is bollinger
+
+    with pytest.raises(TypeError):
+        metrics(SMA, stick.o, {5})
+
+    separate = SMA(stick.o, 5)
+    pushAltQuad()
+    compare(sma, separate.value)
+    assert bollinger.upperband._cache is bollinger.width._cache
+    compare(bollinger.upperband, 1344.7345184202045)
+    compare(bollinger.lowerband, -914.1845184202044)
+
+
+def test_diskts_memmap_history(bind, tmp_path, monkeypatch):
+    import cryptle.metric.base as base
+    from cryptle.metric.base import DiskTS
+
+    monkeypatch.setattr(base, '_history_dir', lambda: tmp_path)
+
+    bus, stick = bind(1, 1)
+    sma = SMA(stick.o, 3)
+    sma.hxtimeseries = DiskTS(sma, store_num=10)
+
+    history = []
+    for i, price in enumerate(alt_quad):
+        pushTick([price, i, 0, 0])
+        history.append(sma.value)
+
+    hx = sma.hxtimeseries
+    assert hx.path.parent == tmp_path
+    assert hx.path.stat().st_size == 16 + 8 * hx._stored
+    assert len(hx) == len(history)
+
+    # slices are arrays wherever the values are held, copied off the mapped file
+    stored = hx._stored
+    for index in [
+        slice(-90, -80),
+        slice(stored - 3, stored + 3),
+        slice(-5, None),
+        slice(None, None, 10),
+        slice(5, 5),
+    ]:
+        values = sma[index]
+        assert type(values) is np.ndarray and values.dtype == np.float64
+        np.testing.assert_array_equal(values, history[index])
+    assert not np.shares_memory(sma[-90:-80], hx._mapped())
+    assert sma[3] == history[3]
+    assert sma[-1] == history[-1]
+
+    hx.cleanup()
+    np.testing.assert_array_equal(sma[:], history)
+
+
+def test_history_opt_in(bind, tmp_path, monkeypatch):
+    import cryptle.metric.base as base
+
+    monkeypatch.setattr(base, '_history_dir', lambda: tmp_path)
+    bus, stick = bind(1, 1)
+    sma = SMA(stick.o, 3)
+    recorded = SMA(stick.o, 3, history='memory')
+    pushAltQuad()
+
+    assert sma.hxtimeseries is None
+    with pytest.raises(ValueError):
+        sma[-1]
+    assert len(recorded.hxtimeseries) == len(alt_quad)
+    assert recorded[-1] == sma.value
+
+    with pytest.raises(ValueError):
+        SMA(stick.o, 3, history='cloud')
+
+
+def test_metric_trace_switch(bind, monkeypatch, caplog):
+    import cryptle.metric.base as base
+    import cryptle.metric.timeseries.sma as sma_module
+
+    bus, stick = bind(1, 1)
+    sma = SMA(stick.o, 3)
+    loggers = (base.logger, sma_module.logger)
+    levels = [logger.level for logger in loggers]
+    for logger in loggers:
+        logger.setLevel(DEBUG)
+    caplog.clear()
+    try:
+        pushTick([1, 0, 0, 0])
+        assert not [r for r in caplog.records if r.name.startswith('cryptle.metric')]
+
+        monkeypatch.setattr(base, 'TRACE', True)
+        pushTick([2, 1, 0, 0])
+        assert any(repr(sma) in r.getMessage() for r in caplog.records)
+        assert any(
+            r.name == sma_module.logger.name and 'evaluate in SMA' in r.getMessage()
+            for r in caplog.records
+        )
+    finally:
+        for logger, level in zip(loggers, levels):
+            logger.setLevel(level)
+
+
+@pytest.mark.parametrize(
+    'value, enabled',
+    [('1', True), ('true', True), ('YES', True), ('0', False), ('false', False)],
+)
+def test_metric_trace_environment(monkeypatch, value, enabled):
+    import cryptle.metric.base as base
+
+    monkeypatch.setenv('CRYPTLE_METRIC_TRACE', value)
+    assert base._env_flag('CRYPTLE_METRIC_TRACE') is enabled
+    monkeypatch.delenv('CRYPTLE_METRIC_TRACE')
+    assert base._env_flag('CRYPTLE_METRIC_TRACE') is False
+
+
+def _warmup_indicators(stick, timestamp):
+    indicators = _indicators(stick)
+    ret = BarReturn(stick.o, stick.c)
+    pivot = PivotPoints(timestamp, 8640, stick.h, stick.l, stick.c)
+    indicators.update(
+        {
+            'sd': SD(stick.c, 5),
+            'kurtosis': Kurtosis(stick.c, 6),
+            'skewness': Skewness(Difference(stick.c), 6),
+            'volatility': Volatility(stick.c, 5),
+            'return': BarReturn(stick.o, stick.c, 3, all_close=True),
+            'ym': YM(ret, 4),
+            'pivot': pivot,
+            'max': RollingMax(stick.h, 6),
+            'volatility_sma': SMA(Volatility(stick.c, 5), 3),
+            'ym_sma': SMA(YM(ret, 4), 3),
+            'pivot_sma': SMA(pivot, 2),
+            'min': RollingMin(stick.l, 6),
+            'quantile': RollingQuantile(stick.c, 6, 0.75),
+            'custom': SMA(WMA(stick.c, 4, weights=[0.1, 0.2, 0.3, 0.4]), 3),
+        }
+    )
+    return indicators, pivot
+
+
+@pytest.mark.parametrize('split', [0, 3, 12, 60])
+def test_warmup_matches_streaming(split):
+    bars = [
+        [p, p + 0.5 * math.cos(i), p + 1 + math.sin(i) ** 2, p - 1, i * 8640, 1 + i % 3]
+        for i, p in enumerate(sine)
+    ]
+    streamed, warmed = CandleStick(1), CandleStick(1)
+    streamed_time, warmed_time = Timestamp(1), Timestamp(1)
+    expected, _ = _warmup_indicators(streamed, streamed_time)
+    actual, pivot = _warmup_indicators(warmed, warmed_time)
+
+    for bar in bars[:split]:
+        streamed.source(bar)
+        streamed_time.source(bar[4])
+    warmed.warmup(bars[:split], {warmed_time: [bar[4] for bar in bars[:split]]})
+
+    for bar in bars[split:]:
+        for stick, timestamp in ((streamed, streamed_time), (warmed, warmed_time)):
+            stick.source(bar)
+            timestamp.source(bar[4])
+        for name in expected:
+            np.testing.assert_allclose(
+                np.array(actual[name].value, dtype=float),
+                np.array(expected[name].value, dtype=float),
+                rtol=1e-9,
+                atol=1e-9,
+                err_msg=name,
+            )
+    assert pivot.pp is not None
+
+
+def test_warmup_compiled_and_candles():
+    bars = [Candle(p, p + 1, p + 2, p - 1, i, 1, 0) for i, p in enumerate(sine)]
+    stick = CandleStick(1)
+    rsi = RSI(stick.c, 5)
+    stick.compile()
+    stick.warmup(Candle.toArray(bars[:50]))
+    for bar in bars[50:]:
+        stick.source(list(bar))
+
+    streamed = CandleStick(1)
+    expected = RSI(streamed.c, 5)
+    for bar in bars:
+        streamed.source(list(bar))
+    compare(rsi, expected.value)
+
+
+@pytest.mark.parametrize('compiled', [False, True])
+def test_snapshot_restore(compiled):
+    bars = [
+        [p, p + 0.5 * math.cos(i), p + 1, p - 1, i, 1, 0] for i, p in enumerate(sine)
+    ]
+    original, restored = CandleStick(1), CandleStick(1)
+    expected, actual = _indicators(original), _indicators(restored)
+    if compiled:
+        original.compile()
+        restored.compile()
+
+    for bar in bars[:40]:
+        original.source(bar)
+    snapshot = original.snapshot()
+    assert isinstance(snapshot, bytes)
+    restored.restore(snapshot)
+
+    for bar in bars[40:]:
+        original.source(bar)
+        restored.source(bar)
+        for name in expected:
+            np.testing.assert_equal(actual[name].value, expected[name].value, name)
+
+    mismatched = CandleStick(1)
+    SMA(mismatched.o, 5)
+    with pytest.raises(ValueError):
+        mismatched.restore(snapshot)
+
+
+@pytest.mark.parametrize('compiled', [False, True])
+def test_snapshot_restore_with_inputs(compiled):
+    bars = [
+        [p, p + 0.5 * math.cos(i), p + 1, p - 1, i * 4320, 1, 0]
+        for i, p in enumerate(sine)
+    ]
+    sticks = CandleStick(1), CandleStick(1)
+    timestamps = Timestamp(1), Timestamp(1)
+    expected, actual = (
+        {
+            'pivot': PivotPoints(timestamp, 8640, stick.h, stick.l, stick.c),
+            'time': SMA(timestamp, 3),
+            'sma': SMA(stick.c, 3),
+        }
+        for stick, timestamp in zip(sticks, timestamps)
+    )
+    (original, restored), (original_time, restored_time) = sticks, timestamps
+    if compiled:
+        original.compile(original_time)
+        restored.compile(restored_time)
+
+    for bar in bars[:40]:
+        original_time.source(bar[4])
+        original.source(bar)
+    if compiled:
+        restored.restore(original.snapshot())
+    else:
+        restored.restore(original.snapshot(original_time), restored_time)
+    assert restored_time.value == original_time.value
+
+    for bar in bars[40:]:
+        for stick, timestamp in zip(sticks, timestamps):
+            timestamp.source(bar[4])
+            stick.source(bar)
+        for name in expected:
+            np.testing.assert_equal(actual[name].value, expected[name].value, name)
+    assert actual['pivot'].pp is not None
+
+
+def test_timeseries_snapshot_restore():
+    stick = CandleStick(1)
+    sma, other = SMA(stick.o, 3), SMA(stick.o, 3)
+    bollinger = BollingerBand(stick.o, 5)
+    for i, price in enumerate(sine[:20]):
+        stick.source([price, price, price, price, i, 1, 0])
+    snapshot, value = sma.snapshot(), sma.value
+    bands = bollinger.snapshot()
+
+    stick.source([100, 100, 100, 100, 20, 1, 0])
+    assert sma.value != value
+    width = bollinger.width.value
+    sma.restore(snapshot)
+    other.restore(snapshot)
+    assert sma.value == other.value == value
+    stick.source([50, 50, 50, 50, 21, 1, 0])
+    assert sma.value == other.value == (sine[18] + sine[19] + 50) / 3
+
+    bollinger.restore(bands)
+    assert bollinger.width.value != width
+    stick.source([100, 100, 100, 100, 20, 1, 0])
+    assert bollinger.width.value == width
+
+
+def test_panel_matches_single_assets():
+    from cryptle.metric.timeseries.panel import (
+        PanelStick,
+        PanelSMA,
+        PanelWMA,
+        PanelEMA,
+        PanelRSI,
+    )
+
+    series = [sine, alt_quad, logistic, const]
+    panel = PanelStick(['sine', 'alt_quad', 'logistic', 'const'])
+    actual = [
+        PanelSMA(panel.c, 5),
+        PanelWMA(panel.c, 5),
+        PanelEMA(panel.c, 5),
+        PanelRSI(panel.c, 5),
+    ]
+    sticks = [CandleStick(1) for _ in series]
+    expected = [
+        (SMA(s.c, 5), WMA(s.c, 5), EMA(s.c, 5), RSI(s.c, 5)) for s in sticks
+    ]
+
+    for i in range(len(sine)):
+        bar = [[x[i], x[i], x[i] + 1, x[i] - 1, i, 1] for x in series]
+        panel.source(bar)
+        for stick, row in zip(sticks, bar):
+            stick.source(row)
+        for j, ts in enumerate(actual):
+            if expected[0][j].value is None:
+                assert ts.value is None
+                continue
+            np.testing.assert_allclose(
+                ts.value,
+                [float(e[j]) for e in expected],
+                rtol=1e-9,
+                err_msg=repr(ts),
+            )
+    assert panel.index('logistic') == 2
+
+    # Assets without a candle carry their previous one forward
+    close = panel.c.value.copy()
+    panel.source([[np.nan] * 6] + bar[1:])
+    assert panel.c.value[0] == close[0]
+    with pytest.raises(ValueError):
+        panel.source(bar[1:])